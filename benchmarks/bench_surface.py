@@ -0,0 +1,106 @@
+"""
+Compares PhysicsSurface against the previous one-Line-per-tick implementation.
+
+Run from the repository root:
+    PYTHONPATH=. uv run python benchmarks/bench_surface.py
+
+The same comparison is part of the full suite in benchmarks/run.py.
+"""
+
+import functools
+import time
+
+from manim import *
+from physics import PhysicsSurface
+
+TICK_COUNTS = (10, 100, 1000)
+REPEATS = 5
+
+
+class LegacyPhysicsSurface(VGroup):
+    """The previous implementation, kept here only as a baseline"""
+
+    def __init__(
+        self,
+        start=LEFT,
+        end=RIGHT,
+        hash_len=0.2,
+        hash_spacing=0.2,
+        color=WHITE,
+        stroke_width=4,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+
+        main_line = Line(start, end, color=color, stroke_width=stroke_width)
+        self.add(main_line)
+
+        line_vec = main_line.get_vector()
+        line_length = np.linalg.norm(line_vec)
+        unit_vec = line_vec / line_length
+
+        angle = -135 * DEGREES
+        hash_vec = rotate_vector(unit_vec, angle) * hash_len
+
+        num_hashes = int(line_length / hash_spacing)
+
+        for i in range(num_hashes + 1):
+            alpha = i / num_hashes if num_hashes > 0 else 0.5
+            point_on_line = main_line.point_from_proportion(alpha)
+
+            tick = Line(
+                point_on_line,
+                point_on_line + hash_vec,
+                color=color,
+                stroke_width=stroke_width * 0.5,
+            )
+            self.add(tick)
+
+
+def best_of(func, repeats=REPEATS):
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def surface_kwargs(num_ticks):
+    # Spacing chosen so the floor carries exactly num_ticks hash marks
+    spacing = 12 / num_ticks
+    return {
+        "start": LEFT * 6,
+        "end": RIGHT * 6,
+        "hash_len": 0.2,
+        "hash_spacing": spacing,
+    }
+
+
+def render_frame(camera, surface):
+    camera.reset()
+    camera.capture_mobject(surface)
+
+
+def main():
+    camera = Camera()
+    print(
+        f"{'ticks':>6} {'impl':>8} {'construct ms':>13} {'frame ms':>9} {'mobjects':>9}"
+    )
+    for num_ticks in TICK_COUNTS:
+        kwargs = surface_kwargs(num_ticks)
+        for name, cls in (
+            ("legacy", LegacyPhysicsSurface),
+            ("current", PhysicsSurface),
+        ):
+            construct = best_of(functools.partial(cls, **kwargs))
+            surface = cls(**kwargs)
+            frame = best_of(functools.partial(render_frame, camera, surface))
+            print(
+                f"{num_ticks:>6} {name:>8} {construct * 1e3:>13.2f} "
+                f"{frame * 1e3:>9.2f} {len(surface.get_family()):>9}"
+            )
+
+
+if __name__ == "__main__":
+    main()
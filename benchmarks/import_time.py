@@ -0,0 +1,85 @@
+"""
+Import-time check for the physics package.
+
+Every target is imported in a fresh interpreter under `python -X importtime`
+a few times; the median cumulative time is compared with its budget, and
+targets that must start without manim are checked for it. Exits non-zero
+on any regression, so it can gate test runs. Run from the repository root:
+    PYTHONPATH=. uv run python benchmarks/import_time.py [--scale 2] [--top 10]
+"""
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+# target -> (budget in ms, must load without manim)
+BUDGETS = {
+    "physics": (400, True),
+    "physics.cache": (400, True),
+    "physics.bake": (400, True),
+    "physics.sweep": (400, True),
+    "physics.parallel": (400, True),
+    "physics.pobject": (None, False),
+}
+
+_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def import_times(target):
+    """{module: (self µs, cumulative µs)} of one cold `import target`"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": os.environ.get("PYTHONPATH", ".")},
+        check=True,
+    )
+    times = {}
+    for match in _LINE.finditer(result.stderr):
+        own, cumulative, _, module = match.groups()
+        times[module] = (int(own), int(cumulative))
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--scale", type=float, default=1.0, help="multiply budgets")
+    parser.add_argument("--top", type=int, default=0, help="slowest modules to list")
+    args = parser.parse_args()
+
+    failed = []
+    print(f"{'target':<20} {'median':>9} {'budget':>9}  manim")
+    for target, (budget, manim_free) in BUDGETS.items():
+        runs = [import_times(target) for _ in range(args.repeats)]
+        median = statistics.median(run[target][1] for run in runs) / 1e3
+        loads_manim = "manim" in runs[0]
+        limit = budget * args.scale if budget is not None else None
+
+        problems = []
+        if limit is not None and median > limit:
+            problems.append(f"over budget by {median - limit:.0f}ms")
+        if manim_free and loads_manim:
+            problems.append("imports manim")
+        failed += [f"{target}: {problem}" for problem in problems]
+        budget_text = f"{limit:>7.0f}ms" if limit is not None else f"{'-':>9}"
+        print(
+            f"{target:<20} {median:>7.1f}ms {budget_text}  "
+            f"{'yes' if loads_manim else 'no':<5} {'; '.join(problems)}"
+        )
+
+        if args.top:
+            slowest = sorted(runs[0].items(), key=lambda item: -item[1][0])
+            for module, (own, _) in slowest[: args.top]:
+                print(f"    {own / 1e3:>7.1f}ms  {module}")
+
+    if failed:
+        print("Import time regressions:\n  " + "\n  ".join(failed))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
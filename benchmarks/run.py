@@ -0,0 +1,417 @@
+"""
+Benchmark suite for the physics mobjects: construction, per-frame updaters,
+headless frame rendering of a reduced car/pulley scene and the cost of
+hashing its mobjects for the partial movie cache.
+
+Run from the repository root:
+    PYTHONPATH=. uv run python benchmarks/run.py [-k pattern] [--no-save]
+
+Every run is appended to benchmarks/history.json under the current git
+commit, and compared with the latest earlier run from the same machine.
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+
+from bench_surface import LegacyPhysicsSurface, surface_kwargs
+
+from manim import *
+from manim.utils.hashing import _CustomEncoder, _Memoizer, get_json
+from physics import (
+    PhysicsCar,
+    PhysicsChain,
+    PhysicsCollisions,
+    PhysicsParticles,
+    PhysicsPlatform,
+    PhysicsPulley,
+    PhysicsReadout,
+    PhysicsRope,
+    PhysicsSurface,
+    PhysicsTracker,
+    PhysicsWorld,
+    StaticBackdrop,
+)
+from physics.hashing import _state as hashing_state
+from physics.pobject import _car_parts, _hatching_points, _pulley_parts
+
+HISTORY = Path(__file__).with_name("history.json")
+BENCHMARKS = []
+
+
+def benchmark(name, params=(None,)):
+    """
+    Registers func(param) -> callable: the outer call is untimed setup, the
+    returned callable is what gets timed.
+    """
+
+    def register(func):
+        for param in params:
+            label = name if param is None else f"{name}[{param}]"
+            BENCHMARKS.append((label, func, param))
+        return func
+
+    return register
+
+
+def measure(func, repeats=7, min_time=0.02):
+    """Per-call seconds over repeats samples of an auto-calibrated loop"""
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time or number >= 1 << 16:
+            break
+        number *= 2
+
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        samples.append((time.perf_counter() - start) / number)
+    return {"min": min(samples), "median": statistics.median(samples)}
+
+
+# ---------------------------------------------------------------------------
+# Construction
+# ---------------------------------------------------------------------------
+
+
+@benchmark("construct.car", params=(0.5, 1.2, 4.0))
+def construct_car(width):
+    return lambda: PhysicsCar(width=width, height=width / 2, wheel_radius=width / 8)
+
+
+@benchmark("construct.pulley", params=(0.16, 0.5, 2.0))
+def construct_pulley(radius):
+    return lambda: PhysicsPulley(position=ORIGIN, mount_point=LEFT, radius=radius)
+
+
+@benchmark("construct.platform", params=(2, 6.5, 20))
+def construct_platform(length):
+    return lambda: PhysicsPlatform(length=length)
+
+
+@benchmark("construct.platform_uncached_hatching", params=(2, 6.5, 20))
+def construct_platform_uncached(length):
+    def build():
+        _hatching_points.cache_clear()
+        PhysicsPlatform(length=length)
+
+    return build
+
+
+FLEET_SIZES = (1, 10, 100, 1000)
+
+
+@benchmark("construct.car_fleet", params=FLEET_SIZES)
+def construct_car_fleet(count):
+    return lambda: [
+        PhysicsCar(width=1.2, height=0.6, wheel_radius=0.15) for _ in range(count)
+    ]
+
+
+@benchmark("construct.car_fleet_uncached_prototype", params=FLEET_SIZES)
+def construct_car_fleet_uncached(count):
+    def build():
+        for _ in range(count):
+            _car_parts.cache_clear()
+            PhysicsCar(width=1.2, height=0.6, wheel_radius=0.15)
+
+    return build
+
+
+@benchmark("construct.pulley_fleet", params=FLEET_SIZES)
+def construct_pulley_fleet(count):
+    return lambda: [
+        PhysicsPulley(position=RIGHT * i, mount_point=RIGHT * i + LEFT, radius=0.16)
+        for i in range(count)
+    ]
+
+
+@benchmark("construct.pulley_fleet_uncached_prototype", params=FLEET_SIZES)
+def construct_pulley_fleet_uncached(count):
+    def build():
+        for i in range(count):
+            _pulley_parts.cache_clear()
+            PhysicsPulley(position=RIGHT * i, mount_point=RIGHT * i + LEFT, radius=0.16)
+
+    return build
+
+
+@benchmark("construct.surface", params=(10, 100, 1000))
+def construct_surface(num_ticks):
+    return lambda: PhysicsSurface(**surface_kwargs(num_ticks))
+
+
+@benchmark("construct.surface_legacy", params=(10, 100, 1000))
+def construct_surface_legacy(num_ticks):
+    return lambda: LegacyPhysicsSurface(**surface_kwargs(num_ticks))
+
+
+# ---------------------------------------------------------------------------
+# Per frame
+# ---------------------------------------------------------------------------
+
+
+def stepping(tracker, *mobjects, step=0.01):
+    """One frame: advance the tracker, then run the mobjects' updaters"""
+
+    def frame():
+        tracker.increment_value(step)
+        for mobject in mobjects:
+            mobject.update(0)
+
+    return frame
+
+
+@benchmark("frame.car_update_physics")
+def frame_car():
+    car, tracker = PhysicsCar(), PhysicsTracker(0)
+    car.attach_physics(tracker)
+    return stepping(tracker, car)
+
+
+@benchmark("frame.pulley_update_rotation")
+def frame_pulley():
+    pulley = PhysicsPulley(position=ORIGIN, mount_point=LEFT)
+    tracker = PhysicsTracker(0)
+    pulley.attach_physics(tracker)
+    return stepping(tracker, pulley)
+
+
+@benchmark("frame.world_step")
+def frame_world():
+    scene = build_scene()
+    return stepping(scene["tracker"], scene["world"])
+
+
+@benchmark("frame.rope_update")
+def frame_rope():
+    scene = build_scene()
+    scene["world"].update(0)
+    return stepping(scene["tracker"], scene["world"], scene["rope"])
+
+
+@benchmark("frame.readout_update")
+def frame_readout():
+    scene = build_scene()
+    return stepping(scene["tracker"], scene["readout"])
+
+
+@benchmark("frame.mathtex_label_update")
+def frame_label():
+    scene = build_scene()
+    return stepping(scene["tracker"], scene["world"], scene["label"])
+
+
+@benchmark("frame.particles", params=(1000, 10000))
+def frame_particles(count):
+    rng = np.random.default_rng(0)
+    particles = PhysicsParticles(
+        rng.random((count, 3)) * [8, 4, 0] - [4, 2, 0],
+        velocities=rng.normal(size=(count, 3)) * [1, 1, 0],
+        floor=-3,
+        walls=(-7, 7),
+    )
+    pairs = np.arange(0, count - 1, 2)
+    particles.add_springs(pairs, pairs + 1, stiffness=200)
+    return lambda: particles.update(1 / 15)
+
+
+@benchmark("frame.chain", params=(100, 300))
+def frame_chain(links):
+    chain = PhysicsChain(LEFT * 3, RIGHT * 3, links=links, length=7)
+    return lambda: chain.update(1 / 30)
+
+
+@benchmark("frame.collisions", params=(10, 100, 1000))
+def frame_collisions(count):
+    rng = np.random.default_rng(0)
+    collisions = PhysicsCollisions()
+    for x in range(-count // 10, count // 10 + 1):
+        collisions.add_surface(PhysicsSurface(start=[x, -3, 0], end=[x + 1, -3, 0]))
+    bodies = [
+        Square(side_length=0.3).move_to([*(rng.random(2) * [count / 5, 6] - 3), 0])
+        for _ in range(count)
+    ]
+    for body in bodies:
+        collisions.add_body(body)
+    velocities = rng.normal(size=(count, 3)) * [0.5, 0.5, 0]
+
+    def frame():
+        for body, velocity in zip(bodies, velocities):
+            body.shift(velocity / 30)
+        velocities[:] *= -1
+        collisions.update(1 / 30)
+
+    return frame
+
+
+# ---------------------------------------------------------------------------
+# Headless rendering
+# ---------------------------------------------------------------------------
+
+
+def build_scene(backdrop=False):
+    """
+    A reduced car/pulley scene: platform, car, two pulleys, rope, labels.
+    With backdrop, the platform and floor are drawn from a StaticBackdrop.
+    """
+    stage = PhysicsPlatform(length=6.5, color=TEAL_C).move_to(LEFT * 3)
+    floor = PhysicsSurface(start=DOWN * 3, end=RIGHT * 2 + DOWN * 3)
+    car = PhysicsCar(width=1.2, height=0.6, wheel_radius=0.15, color=YELLOW)
+    car.move_to(LEFT * 5 + UP * 0.2)
+    car_pulley = PhysicsPulley(
+        position=car.get_rope_anchor() + RIGHT * 0.5,
+        mount_point=car.get_rope_anchor(),
+        radius=0.16,
+    )
+    pulley = PhysicsPulley(position=RIGHT * 0.5, mount_point=DOWN * 0.3, radius=0.16)
+    mass = Square(side_length=0.6, color=RED_C, fill_opacity=0.9)
+    mass.move_to(RIGHT * 0.66 + DOWN)
+
+    tracker = PhysicsTracker(0)
+    world = PhysicsWorld()
+    world.add_car(car, tracker)
+    world.add_pulley(car_pulley, tracker, direction=RIGHT)
+    world.add_pulley(pulley, tracker, speed_ratio=2)
+    world.add_body(mass, tracker, direction=DOWN, speed_ratio=2)
+
+    rope = PhysicsRope(
+        RIGHT * 1.5 + UP * 0.4, (car_pulley, 1), (pulley, -1), mass.get_top
+    )
+    readout = PhysicsReadout(["v_{car}", "="], tracker.get_value, target=car)
+    label = MathTex("mg", color=GREEN_B).add_updater(
+        lambda m: m.next_to(mass, RIGHT, buff=0.3)
+    )
+    scenery = [StaticBackdrop(stage, floor)] if backdrop else [stage, floor]
+    mobjects = [world, *scenery, car, car_pulley, pulley, mass, rope]
+    mobjects += [readout, label]
+    return {
+        "tracker": tracker,
+        "world": world,
+        "rope": rope,
+        "readout": readout,
+        "label": label,
+        "mobjects": mobjects,
+    }
+
+
+@benchmark("render.scene_frame", params=(None, "backdrop"))
+def render_scene_frame(variant=None):
+    scene = build_scene(backdrop=variant == "backdrop")
+    camera = Camera()
+    advance = stepping(scene["tracker"], *scene["mobjects"])
+
+    def frame():
+        advance()
+        camera.reset()
+        camera.capture_mobjects(scene["mobjects"])
+
+    return frame
+
+
+@benchmark("hash.scene_mobjects", params=("physics", "manim"))
+def hash_scene_mobjects(encoder="physics"):
+    scene = build_scene()
+    stepping(scene["tracker"], *scene["mobjects"])()
+    # manim's own encoder, as it was before physics hashing was installed
+    default = _CustomEncoder.default
+    if encoder == "manim":
+        default = hashing_state["default"] or default
+
+    def hash_mobjects():
+        installed, _CustomEncoder.default = _CustomEncoder.default, default
+        try:
+            [get_json(mobject) for mobject in scene["mobjects"]]
+        finally:
+            _CustomEncoder.default = installed
+            _Memoizer.reset_already_processed()
+
+    return hash_mobjects
+
+
+# ---------------------------------------------------------------------------
+# Runner
+# ---------------------------------------------------------------------------
+
+
+def git_commit():
+    def git(*args):
+        # Outside a git checkout the commit is recorded as unknown
+        result = subprocess.run(
+            ["git", *args], capture_output=True, text=True, check=False
+        )
+        return result.stdout.strip()
+
+    return git("rev-parse", "--short", "HEAD") or "unknown", bool(git("status", "-s"))
+
+
+def machine():
+    return {
+        "node": platform.node(),
+        "processor": platform.processor() or platform.machine(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+    }
+
+
+def load_history():
+    return json.loads(HISTORY.read_text()) if HISTORY.exists() else []
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-k", default="", help="only benchmarks containing this")
+    parser.add_argument("--repeats", type=int, default=7)
+    parser.add_argument("--no-save", action="store_true")
+    args = parser.parse_args()
+
+    history = load_history()
+    previous = next(
+        (run for run in reversed(history) if run["machine"] == machine()), None
+    )
+
+    results = {}
+    print(f"{'benchmark':<48} {'median':>10} {'min':>10} {'change':>8}")
+    for label, func, param in BENCHMARKS:
+        if args.k not in label:
+            continue
+        timed = func() if param is None else func(param)
+        results[label] = measure(timed, repeats=args.repeats)
+
+        change = ""
+        if previous and label in previous["results"]:
+            before = previous["results"][label]["median"]
+            change = f"{(results[label]['median'] / before - 1) * 100:+.1f}%"
+        print(
+            f"{label:<48} {results[label]['median'] * 1e3:>8.3f}ms "
+            f"{results[label]['min'] * 1e3:>8.3f}ms {change:>8}"
+        )
+
+    if not args.no_save:
+        commit, dirty = git_commit()
+        history.append(
+            {
+                "commit": commit,
+                "dirty": dirty,
+                "date": datetime.now(UTC).isoformat(timespec="seconds"),
+                "machine": machine(),
+                "results": results,
+            }
+        )
+        HISTORY.write_text(json.dumps(history, indent=1))
+        print(f"Saved to {HISTORY} under {commit}{' (dirty)' if dirty else ''}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,18 +2,38 @@
 Title: 90% of Physics Students Get This WRONG! 😱
 """
 
-from manim import *
-from manim.utils.rate_functions import ease_in_quad
-
-from physics import PhysicsSurface, PhysicsCar, PhysicsPulley, PhysicsPlatform
-from manim_voiceover import VoiceoverScene
 from manim_voiceover.services.azure import AzureService
 
+from manim import *
+from physics import (
+    PhysicsCar,
+    PhysicsPlatform,
+    PhysicsPulley,
+    PhysicsReadout,
+    PhysicsRope,
+    PhysicsSurface,
+    PhysicsTracker,
+    PhysicsWorld,
+    PrefetchVoiceoverScene,
+    PulleySystem,
+    StaticBackdrop,
+    bake_trajectory,
+)
+
+
+class FullPhysicsDemoLightMood(PrefetchVoiceoverScene):
+    # Variant parameters; a sweep overrides them (see physics/sweep.py)
+    VOICE = "en-US-GuyNeural"
+    CAR_MASS = 1.0
+    HANGING_MASS = 1.0
+    DECEL_RATE = 0.5
+    CAR_COLOR = YELLOW
+    MASS_COLOR = RED_C
+    SCENERY_COLOR = TEAL_C
 
-class FullPhysicsDemoLightMood(VoiceoverScene):
     def construct(self):
         service = AzureService(
-            voice="en-US-GuyNeural",
+            voice=self.VOICE,
             style="cheerful",
         )
         self.set_speech_service(service)
@@ -44,6 +64,8 @@ class FullPhysicsDemoLightMood(VoiceoverScene):
         PULLEY_MOUNT_Y = 0.3
         CAR_PULLEY_OFFSET_X = 0.5
         MASS_Y = 1
+        # Scene units per s^2, tuned so the mass falls at about 2 units / s^2
+        GRAVITY = 2.75
 
         CAR_Y = (
             (CAR_HEIGHT + CAR_WHEEL_RADIUS) / 2
@@ -53,7 +75,6 @@ class FullPhysicsDemoLightMood(VoiceoverScene):
         PLATFORM_POS = LEFT * PLATFORM_X
         CAR_POS = LEFT * CAR_X + UP * CAR_Y
         PULLEY_OFFSET_X = PLATFORM_LENGTH / 2 + PULLEY_OFFSET_X_CAR - PLATFORM_X
-        PULLEY_Y = PLATFORM_THICKNESS / 2
         PULLEY_MOUNT_OFFSET_X = PLATFORM_LENGTH / 2 - PLATFORM_X
         CAR_PULLEY_OFFSET = RIGHT * CAR_PULLEY_OFFSET_X
         MASS_X = PULLEY_OFFSET_X + PULLEY_RADIUS
@@ -66,7 +87,7 @@ class FullPhysicsDemoLightMood(VoiceoverScene):
             length=PLATFORM_LENGTH,
             thickness=PLATFORM_THICKNESS,
             wall_height=PLATFORM_WALL_HEIGHT,
-            color=TEAL_C,  # Lighter blue
+            color=self.SCENERY_COLOR,
         )
         platform.move_to(PLATFORM_POS)
 
@@ -74,7 +95,7 @@ class FullPhysicsDemoLightMood(VoiceoverScene):
             length=WALL_LENGTH,
             thickness=WALL_THICKNESS,
             wall_height=WALL_WALL_HEIGHT,
-            color=TEAL_C,
+            color=self.SCENERY_COLOR,
         )
         wall.rotate(-90 * DEGREES)
         wall.move_to(WALL_POS)
@@ -83,7 +104,8 @@ class FullPhysicsDemoLightMood(VoiceoverScene):
             width=CAR_WIDTH,
             height=CAR_HEIGHT,
             wheel_radius=CAR_WHEEL_RADIUS,
-            color=YELLOW,  # Bright Yellow
+            color=self.CAR_COLOR,
+            name="car",
         )
         car.move_to(CAR_POS)
 
@@ -91,104 +113,106 @@ class FullPhysicsDemoLightMood(VoiceoverScene):
             position=car.get_rope_anchor() + CAR_PULLEY_OFFSET,
             mount_point=car.get_rope_anchor(),
             radius=PULLEY_RADIUS,
+            name="car_pulley",
         )
         car_pulley_group = VGroup(car, car_pulley)
 
         floor = PhysicsSurface(start=FLOOR_START, end=FLOOR_END)
 
-        pulley_pos = RIGHT * PULLEY_OFFSET_X + DOWN * PULLEY_Y
+        # Both rope runs are horizontal: the wall anchor is level with the top
+        # of the car pulley, the fixed pulley's top with its bottom
+        car_pulley_y = car_pulley.center_pos[1]
+        rope_anchor = RIGHT * WALL_X + LEFT * WALL_THICKNESS
+        rope_anchor += UP * (car_pulley_y + PULLEY_RADIUS)
+        pulley_pos = RIGHT * PULLEY_OFFSET_X + UP * (car_pulley_y - 2 * PULLEY_RADIUS)
         pulley_mount_point = RIGHT * PULLEY_MOUNT_OFFSET_X + DOWN * PULLEY_MOUNT_Y
         pulley = PhysicsPulley(
-            position=pulley_pos, mount_point=pulley_mount_point, radius=PULLEY_RADIUS
+            position=pulley_pos,
+            mount_point=pulley_mount_point,
+            radius=PULLEY_RADIUS,
+            name="pulley",
         )
 
-        mass = Square(side_length=MASS_SIZE, color=RED_C, fill_opacity=0.9)
-        mass.move_to(RIGHT * MASS_X + DOWN * MASS_Y)
-
-        # Ropes
-        rope_to_pulley = always_redraw(
-            lambda: Line(
-                start=car_pulley.wheel.get_bottom(),
-                end=pulley.get_tangent_point(car_pulley.wheel.get_bottom()),
-                color=WHITE,
-                stroke_width=3,
-            )
+        mass = Square(
+            side_length=MASS_SIZE, color=self.MASS_COLOR, fill_opacity=0.9, name="mass"
         )
+        mass.move_to(RIGHT * MASS_X + DOWN * MASS_Y)
 
-        rope_free = always_redraw(
-            lambda: Line(
-                start=WALL_POS + LEFT * WALL_THICKNESS,
-                end=car_pulley.wheel.get_top(),
-                color=WHITE,
-                stroke_width=3,
-            )
+        # One rope: wall -> around the car pulley -> over the fixed pulley -> mass
+        rope = PhysicsRope(
+            rope_anchor,
+            (car_pulley, 1),
+            (pulley, -1),
+            mass.get_top,
+            color=WHITE,
+            stroke_width=3,
         )
 
-        rope_v = always_redraw(
-            lambda: Line(
-                start=pulley.wheel.get_right(),
-                end=mass.get_top(),
-                color=WHITE,
-                stroke_width=3,
-            )
-        )
+        # Distances travelled by the car and fallen by the mass
+        car_tracker = PhysicsTracker(0, name="car_tracker")
+        mass_tracker = PhysicsTracker(0, name="mass_tracker")
 
         # Labels
-        mass_weight_label = always_redraw(
-            lambda: MathTex("mg", color=GREEN_B).next_to(mass, RIGHT, buff=0.3)
+        mass_weight_label = MathTex("mg", color=GREEN_B).add_updater(
+            lambda m: m.next_to(mass, RIGHT, buff=0.3)
         )
 
-        mass_velocity_tracker = ValueTracker(0)
-        mass_velocity_label = always_redraw(
-            lambda: MathTex(
-                "v_{mass}", "=", f"{mass_velocity_tracker.get_value():.2f}", color=RED_C
-            ).next_to(mass, LEFT, buff=0.5)
+        mass_velocity_label = PhysicsReadout(
+            ["v_{mass}", "="],
+            mass_tracker.get_velocity,
+            color=self.MASS_COLOR,
+            target=mass,
+            direction=LEFT,
         )
 
-        car_velocity_tracker = ValueTracker(0)
-        car_velocity_label = always_redraw(
-            lambda: MathTex(
-                "v_{car}", "=", f"{car_velocity_tracker.get_value():.2f}", color=YELLOW
-            ).next_to(car, DOWN, buff=0.5)
+        car_velocity_label = PhysicsReadout(
+            ["v_{car}", "="], car.get_velocity, color=self.CAR_COLOR, target=car
         )
 
+        # The scenery never moves: draw it from one cached raster
         self.add(
-            platform,
-            floor,
-            wall,
+            StaticBackdrop(platform, floor, wall),
             car_pulley_group,
             pulley,
             mass,
-            rope_to_pulley,
-            rope_free,
-            rope_v,
+            rope,
             mass_weight_label,
             mass_velocity_label,
             car_velocity_label,
         )
 
-        # 4. Physics Binding
-        master_tracker = ValueTracker(0)
-        car.attach_physics(master_tracker, 0.5)
-        car_pulley_group.add_updater(
-            lambda m: car_pulley.update_position(
-                car.get_rope_anchor() + CAR_PULLEY_OFFSET, car.get_rope_anchor()
-            )
-        )
-        pulley.attach_physics(master_tracker)
-
-        mass_start_y = mass.get_y()
-        mass.add_updater(lambda m: m.set_y(mass_start_y - master_tracker.get_value()))
-
-        # --- UPDATER FOR ACCELERATION ---
-        # "Latches" the value so it doesn't drop to zero when the animation finishes
-        def update_velocities_acceleration(dt):
-            car_v = car.calculate_speed(dt)
-            if car_v > 0.01:
-                mass_velocity_tracker.set_value(car_v * 2)
-                car_velocity_tracker.set_value(car_v)
+        # 4. Physics Model
+        # The 2:1 constraint, the fall time and the coast all follow from the
+        # rope topology; nothing is derived by hand.
+        distance_to_floor = mass.get_bottom()[1] - floor.get_top()[1] - GAP
 
-        self.add_updater(update_velocities_acceleration)
+        system = PulleySystem(gravity=GRAVITY)
+        car_body = system.add_body(
+            "car", mass=self.CAR_MASS, axis=RIGHT, friction=self.DECEL_RATE / GRAVITY
+        )
+        mass_body = system.add_body(
+            "mass", mass=self.HANGING_MASS, axis=DOWN, limits=(None, distance_to_floor)
+        )
+        system.add_rope(
+            rope_anchor,
+            (car_body, car_pulley.center_pos, PULLEY_RADIUS),
+            (None, pulley.center_pos, -PULLEY_RADIUS),
+            (mass_body, mass.get_top()),
+        )
+        # Kept on the scene so a dry run can check the model it drives
+        self.system = system
+        # Baked once per parameter set; later renders replay the cached frames
+        trajectory = bake_trajectory(system, config.frame_rate)
+        FALL_TIME = trajectory.event_time("contact", "mass")
+        STOP_TIME = trajectory.event_time("stop", "car")
+
+        # 5. Physics Binding
+        # One world updater drives the car, both pulleys and the mass.
+        world = PhysicsWorld().attach(self)
+        world.add_car(car, car_tracker)
+        world.add_pulley(car_pulley, car_tracker, direction=RIGHT)
+        world.add_pulley(pulley, mass_tracker)
+        world.add_body(mass, mass_tracker, direction=DOWN)
 
         # ---------------------------------------------------------------------
         # NARRATIVE AND ANIMATION
@@ -285,73 +309,37 @@ class FullPhysicsDemoLightMood(VoiceoverScene):
         )
 
         # --- Motion Animation ---
-        distance_to_floor = mass.get_bottom()[1] - floor.get_top()[1] - GAP
-        MASS_ACCELERATION = 2
-        FALL_TIME = np.sqrt(2 * abs(distance_to_floor) / MASS_ACCELERATION)
-
         with self.voiceover(
             text="Ok. Let's drop the mass. Three, two, one... drop! <bookmark mark='start_drop'/>"
         ) as tracker:
             self.wait_until_bookmark("start_drop")
             self.play(
-                master_tracker.animate.set_value(distance_to_floor),
-                run_time=FALL_TIME,
-                rate_func=ease_in_quad,
+                car_tracker.follow(trajectory, "car", 0, FALL_TIME),
+                mass_tracker.follow(trajectory, "mass", 0, FALL_TIME),
             )
 
         # --- TRANSITION LOGIC ---
 
-        # 1. Remove the acceleration updater.
-        self.remove_updater(update_velocities_acceleration)
-
-        # 2. Freeze the mass (it hit the floor).
-        mass.clear_updaters()
+        # 1. Freeze the mass labels (it hit the floor).
         mass_weight_label.clear_updaters()
         mass_velocity_label.clear_updaters()
-        car_velocity_tracker.clear_updaters()
-
-        mass_velocity_tracker.set_value(0)
 
-        # 3. CRITICAL: Manually calculate the peak velocity at this exact moment.
-        # This ensures that even if there was a micro-pause, the label shows the max speed, not 0.
-        final_velocity = car_velocity_tracker.get_value()
+        # 2. The tracker holds the exact velocity at touchdown. The car label
+        # keeps following the car but shows that value from now on.
+        final_velocity = car.get_velocity()
+        car_velocity_label.value = lambda: final_velocity
 
-        car_velocity_tracker1 = ValueTracker(car_velocity_tracker.get_value())
-        car_velocity_label1 = always_redraw(
-            lambda: MathTex(
-                "v_{car}", "=", f"{car_velocity_tracker1.get_value():.2f}", color=RED
-            ).next_to(car_velocity_label, DOWN, buff=0.5)
+        car_velocity_label1 = PhysicsReadout(
+            ["v_{car}", "="], car.get_velocity, color=RED, target=car_velocity_label
         )
 
-        print(f"{car_velocity_tracker.get_value() = }")
         self.wait(1)
 
         self.add(car_velocity_label1)
 
-        # 4. Add deceleration updater.
-        # This standard updater is fine now because we *want* it to track the speed down to 0.
-        def update_velocities_deceleration(dt):
-            if dt > 0:
-                velocity = car.calculate_speed(dt)
-                car_velocity_tracker1.set_value(velocity)
-
-        self.add_updater(update_velocities_deceleration)
-
-        # 5. Deceleration Calculation
-        DECEL_RATE = 0.5
-        DECEL_TIME = final_velocity / DECEL_RATE
-        decel_distance = final_velocity * DECEL_TIME - (DECEL_RATE * DECEL_TIME**2) / 2
-
         with self.voiceover(
             text="Boom! It hits the floor, tension is gone, and the car coasts to a smooth stop."
         ):
-            self.play(
-                master_tracker.animate.set_value(distance_to_floor + decel_distance),
-                run_time=DECEL_TIME,
-                rate_func=lambda t: 2 * t - t**2,  # ease_out_quad
-            )
+            self.play(car_tracker.follow(trajectory, "car", FALL_TIME, STOP_TIME))
 
-        # Final cleanup
-        car_velocity_tracker1.set_value(0)
-        self.remove_updater(update_velocities_deceleration)
         self.wait(2)
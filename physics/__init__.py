@@ -1,2 +1,98 @@
-from .surface import *
-from .pobject import *
+"""
+Physics mobjects and tools for manim.
+
+Names are resolved on first use: `from physics import PhysicsCar` imports
+physics.pobject only, and the manim-free helpers (cache, bake, system,
+trajectory, belt, parallel, sweep) load without importing manim at all.
+The first name resolved once manim is loaded also installs the content
+hashing of physics.hashing.
+"""
+
+import importlib
+import os
+import sys
+
+_EXPORTS = {
+    "surface": ["PhysicsSurface"],
+    "pobject": ["PhysicsCar", "PhysicsPulley", "PhysicsPlatform"],
+    "world": ["PhysicsWorld"],
+    "motion": [
+        "rate_derivatives",
+        "PhysicsTracker",
+        "DriveTracker",
+        "FollowTrajectory",
+    ],
+    "readout": ["PhysicsReadout"],
+    "rope": ["PhysicsRope"],
+    "belt": ["BeltPath"],
+    "trajectory": ["Trajectory"],
+    "system": ["Body", "PulleySystem"],
+    "cache": [
+        "CACHE_ENV",
+        "cache_root",
+        "cache_dir",
+        "params_hash",
+        "file_hash",
+        "atomic_save",
+        "atomic_directory",
+    ],
+    "bake": [
+        "FORMAT_VERSION",
+        "MMAP_THRESHOLD",
+        "BakedTrajectory",
+        "bake_key",
+        "bake_trajectory",
+        "load_baked",
+    ],
+    "mesh": ["MESH_FORMAT", "load_mesh", "PhysicsMesh"],
+    "voiceover": [
+        "collect_voiceovers",
+        "bookmarks",
+        "prefetch_voiceovers",
+        "PrefetchVoiceoverScene",
+        "LocalSpeechService",
+    ],
+    "profiling": ["PROFILE_ENV", "install_profiling", "profile_report"],
+    "hashing": [
+        "HASHING_ENV",
+        "family_fingerprint",
+        "physics_signature",
+        "install_hashing",
+    ],
+    "dryrun": [
+        "DryRun",
+        "DryRunRenderer",
+        "SilentSpeechService",
+        "dry_run",
+        "placeholder_tex",
+    ],
+    "preview": ["Keyframe", "Preview", "PreviewRenderer", "keyframe_preview"],
+    "particles": ["PhysicsParticles"],
+    "collision": ["Contact", "PhysicsCollisions"],
+    "chain": ["PhysicsChain"],
+    "backdrop": ["StaticBackdrop"],
+}
+_MODULES = {name: module for module, names in _EXPORTS.items() for name in names}
+
+__all__ = list(_MODULES)
+
+
+def __getattr__(name):
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    # Scenes built from physics mobjects hash them by content, see hashing
+    if "manim" in sys.modules and os.environ.get("PHYSICS_HASHING") != "0":
+        importlib.import_module(".hashing", __name__).install_hashing()
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *__all__})
+
+
+# Profiling has to patch manim before the first scene is built
+if os.environ.get("PHYSICS_PROFILE"):
+    importlib.import_module(".profiling", __name__)
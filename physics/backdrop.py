@@ -0,0 +1,144 @@
+"""
+Static scenery drawn from a cached raster.
+
+A StaticBackdrop holds scenery that does not move (platforms, walls,
+floors). The camera rasterizes its family once into a transparent pixel
+array and afterwards composites that array in its place every frame, so
+dense hatching and ticks cost a copy instead of a Cairo pass. The raster is
+keyed by the camera's resolution and frame and by a fingerprint of the
+family's points and style; any change (a shift, a colour change, a fade)
+rasterizes it again on the next frame.
+"""
+
+import functools
+import itertools as it
+
+from manim import *
+from manim.utils.family import extract_mobject_family_members
+
+from .hashing import family_fingerprint
+
+__all__ = ["StaticBackdrop"]
+
+_state = {"installed": False}
+
+
+def _camera_key(camera):
+    return (
+        camera.pixel_width,
+        camera.pixel_height,
+        camera.frame_width,
+        camera.frame_height,
+        tuple(np.round(camera.frame_center, 9)),
+    )
+
+
+class StaticBackdrop(Mobject):
+    """
+    Group of scenery drawn from a cached raster instead of path by path.
+
+    Transforming the backdrop or any member invalidates the raster, so it
+    behaves like a VGroup; it just only pays for rasterization when the
+    scenery or the camera changes.
+    """
+
+    def __init__(self, *mobjects, **kwargs):
+        super().__init__(**kwargs)
+        _install()
+        self.add(*mobjects)
+        self._key = None
+        self._region = None
+
+    def display(self, camera, pixel_array):
+        """Composites the raster onto pixel_array, rasterizing it if stale"""
+        key = (_camera_key(camera), pixel_array.shape, family_fingerprint(self))
+        if key != self._key:
+            self._rasterize(camera, pixel_array)
+            self._key = key
+        if self._region is None:
+            return
+
+        # Premultiplied "over" on the covered rectangle, in place:
+        # colors + round(under * (255 - alpha) / 255)
+        region, blend = pixel_array[self._region], self._buffer
+        np.multiply(region, self._inverse, out=blend)
+        blend += 128
+        blend += blend >> 8
+        blend >>= 8
+        blend += self._colors
+        region[...] = blend
+
+    def _rasterize(self, camera, pixel_array):
+        # 1. Draw the family into a transparent array with the camera's mapping
+        raster = np.zeros_like(pixel_array)
+        mobjects = camera.get_mobjects_to_display(self.submobjects)
+        for group_type, group in it.groupby(mobjects, camera.type_or_raise):
+            camera.display_funcs[group_type](list(group), raster)
+        # The camera caches a Cairo context per array id; this one is temporary
+        camera.pixel_array_to_cairo_context.pop(id(raster), None)
+
+        # 2. Keep only the covered rectangle
+        alpha = raster[..., 3]
+        rows = np.flatnonzero(alpha.any(axis=1))
+        cols = np.flatnonzero(alpha.any(axis=0))
+        if not len(rows):
+            self._region = None
+            return
+        self._region = (
+            slice(rows[0], rows[-1] + 1),
+            slice(cols[0], cols[-1] + 1),
+        )
+        self._colors = raster[self._region].astype(np.uint16)
+        self._inverse = 255 - self._colors[..., 3:]
+        self._buffer = np.empty_like(self._colors)
+
+
+def _display_backdrops(camera, backdrops, pixel_array):
+    for backdrop in backdrops:
+        backdrop.display(camera, pixel_array)
+
+
+def _install():
+    """Teaches Camera to draw each backdrop in place of its family"""
+    if _state["installed"]:
+        return
+    _state["installed"] = True
+
+    get_mobjects_to_display = Camera.get_mobjects_to_display
+    type_or_raise = Camera.type_or_raise
+
+    def display_backdrops(self, mobjects, *args, **kwargs):
+        mobjects = list(mobjects)
+        result = get_mobjects_to_display(self, mobjects, *args, **kwargs)
+        backdrops = [
+            m
+            for m in extract_mobject_family_members(mobjects)
+            if isinstance(m, StaticBackdrop)
+        ]
+        if not backdrops:
+            return result
+        owner = {
+            id(member): backdrop
+            for backdrop in backdrops
+            for member in backdrop.get_family()[1:]
+        }
+        displayed = []
+        drawn = set()
+        for mobject in result:
+            backdrop = owner.get(id(mobject))
+            if backdrop is None:
+                displayed.append(mobject)
+            elif id(backdrop) not in drawn:
+                # The whole raster goes where its first member would be drawn
+                drawn.add(id(backdrop))
+                displayed.append(backdrop)
+        return displayed
+
+    def backdrop_type(self, mobject):
+        mobject_type = type_or_raise(self, mobject)
+        # display_funcs is rebuilt by every call
+        self.display_funcs[StaticBackdrop] = functools.partial(_display_backdrops, self)
+        return StaticBackdrop if isinstance(mobject, StaticBackdrop) else mobject_type
+
+    Camera.get_mobjects_to_display = display_backdrops
+    Camera.type_or_raise = backdrop_type
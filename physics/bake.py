@@ -0,0 +1,199 @@
+"""
+Baking simulations to disk so re-renders replay them instead of simulating.
+
+A bake samples every body at every frame and stores positions, velocities
+and accelerations as NumPy arrays under a key derived from the system and
+bake parameters. Every phase of the motion (the stretch between two events,
+such as the mass touching down and the car coasting) has its own frame grid
+starting at the event, so an animation that starts at an event lands on
+baked frames. Small bakes go into one .npz, large ones into separate .npy
+files that are memory-mapped on load, so long runs never have to sit in RAM.
+"""
+
+import json
+
+import numpy as np
+
+from .cache import atomic_directory, cache_dir, params_hash
+from .trajectory import Trajectory
+
+FORMAT_VERSION = 2
+# Frames x bodies above which arrays are written as memory-mappable .npy files
+MMAP_THRESHOLD = 1 << 20
+# Frames sampled per chunk when writing large bakes
+_CHUNK = 1 << 16
+# Times closer than this fraction of a frame are the same frame
+_ON_GRID = 1e-6
+
+_FRAME_ARRAYS = ("positions", "velocities", "accelerations")
+_RAW_ARRAYS = ("times", "positions", "velocities", "accelerations")
+
+
+class BakedTrajectory(Trajectory):
+    """
+    A Trajectory with per-frame arrays. Sampling at frame times of a phase is
+    a plain index into the baked arrays; other times fall back to the exact
+    samples. The frames hold the state after an event, so side="left" at a
+    phase start uses the exact samples too.
+    """
+
+    def __init__(self, path, fps, frames, raw, names, events, phases):
+        super().__init__(
+            names,
+            raw["times"],
+            raw["positions"],
+            raw["velocities"],
+            raw["accelerations"],
+            events,
+        )
+        self.path = path
+        self.fps = fps
+        self.frame_positions = frames["positions"]
+        self.frame_velocities = frames["velocities"]
+        self.frame_accelerations = frames["accelerations"]
+        # Phase p has frames phase_offsets[p]:phase_offsets[p + 1], frame k
+        # of it at phase_starts[p] + k / fps
+        self.phase_starts = np.array([start for start, _ in phases], dtype=float)
+        self.phase_offsets = np.array(
+            [offset for _, offset in phases] + [len(self.frame_positions)]
+        )
+
+    @property
+    def frame_count(self):
+        return len(self.frame_positions)
+
+    def _frame_indices(self, t, side="right"):
+        """Baked frame index of every time in t, and whether it has one"""
+        # A time on a phase start belongs to the phase it starts
+        tolerance = _ON_GRID / self.fps
+        phase = np.searchsorted(self.phase_starts, t + tolerance, side="right") - 1
+        phase = np.clip(phase, 0, len(self.phase_starts) - 1)
+        frame = (t - self.phase_starts[phase]) * self.fps
+        k = np.rint(frame)
+        index = self.phase_offsets[phase] + k.astype(int)
+        on_grid = (np.abs(frame - k) < _ON_GRID) & (k >= 0)
+        on_grid &= index < self.phase_offsets[phase + 1]
+        if side == "left":
+            # The state arriving at an event is not baked
+            on_grid &= (k != 0) | (phase == 0)
+        return index, on_grid
+
+    def frame_index(self, t, side="right"):
+        """Index of the baked frame at time t, None if t is not on a frame"""
+        index, on_grid = self._frame_indices(np.asarray(t, dtype=float), side)
+        return int(index) if on_grid else None
+
+    def frame(self, i):
+        """(positions, velocities) of every body at frame i"""
+        return self.frame_positions[i], self.frame_velocities[i]
+
+    def sample(self, t, side="right"):
+        t = np.asarray(t, dtype=float)
+        index, on_grid = self._frame_indices(t, side)
+        if not np.all(on_grid):
+            return super().sample(t, side)
+
+        return (
+            np.asarray(self.frame_positions[index]),
+            np.asarray(self.frame_velocities[index]),
+            np.asarray(self.frame_accelerations[index]),
+        )
+
+
+def bake_key(system, fps, duration=None, dt=1 / 240, max_time=60.0):
+    return params_hash(
+        "pulley-trajectory",
+        FORMAT_VERSION,
+        system.signature(),
+        fps,
+        duration,
+        dt,
+        max_time,
+    )
+
+
+def bake_trajectory(system, fps, duration=None, dt=1 / 240, max_time=60.0):
+    """
+    Simulates the system once and stores it per frame at fps, or loads an
+    earlier bake with the same parameters.
+    """
+    path = cache_dir("trajectories") / bake_key(system, fps, duration, dt, max_time)
+    if not path.exists():
+        trajectory = system.simulate(duration=duration, dt=dt, max_time=max_time)
+        with atomic_directory(path) as tmp:
+            _write(tmp, trajectory, fps)
+    return load_baked(path)
+
+
+def _phases(trajectory, fps):
+    """(start, first frame) of every phase and the times of all frames"""
+    first, last = trajectory.times[0], trajectory.times[-1]
+    starts = sorted({first, *(t for t, _, _ in trajectory.events if first < t <= last)})
+    phases, times = [], []
+    for start, end in zip(starts, starts[1:] + [None]):
+        if end is None:
+            count = int(np.floor((last - start) * fps + 1e-9)) + 1
+        else:
+            # Frames strictly before the next phase's first frame
+            count = max(int(np.ceil((end - start) * fps - _ON_GRID)), 0)
+        phases.append([float(start), sum(len(t) for t in times)])
+        times.append(start + np.arange(count) / fps)
+    return phases, np.concatenate(times)
+
+
+def _write(path, trajectory, fps):
+    names = trajectory.names
+    phases, times = _phases(trajectory, fps)
+
+    meta = {
+        "format": FORMAT_VERSION,
+        "fps": fps,
+        "names": names,
+        "events": [[float(t), kind, name] for t, kind, name in trajectory.events],
+        "phases": phases,
+    }
+    (path / "meta.json").write_text(json.dumps(meta))
+
+    raw = {name: getattr(trajectory, name) for name in _RAW_ARRAYS}
+    shape = (len(times), len(names))
+
+    if len(times) * len(names) <= MMAP_THRESHOLD:
+        frames = dict(zip(_FRAME_ARRAYS, trajectory.sample(times)))
+        np.savez(
+            path / "bake.npz",
+            **{f"frame_{k}": frames[k] for k in _FRAME_ARRAYS},
+            **{f"raw_{k}": raw[k] for k in _RAW_ARRAYS},
+        )
+        return
+
+    frames = {
+        k: np.lib.format.open_memmap(path / f"frame_{k}.npy", "w+", float, shape)
+        for k in _FRAME_ARRAYS
+    }
+    for start in range(0, len(times), _CHUNK):
+        stop = min(start + _CHUNK, len(times))
+        for k, values in zip(_FRAME_ARRAYS, trajectory.sample(times[start:stop])):
+            frames[k][start:stop] = values
+    for array in frames.values():
+        array.flush()
+    for k in _RAW_ARRAYS:
+        np.save(path / f"raw_{k}.npy", raw[k])
+
+
+def load_baked(path):
+    meta = json.loads((path / "meta.json").read_text())
+
+    if (path / "bake.npz").exists():
+        with np.load(path / "bake.npz") as data:
+            frames = {k: data[f"frame_{k}"] for k in _FRAME_ARRAYS}
+            raw = {k: data[f"raw_{k}"] for k in _RAW_ARRAYS}
+    else:
+        frames = {
+            k: np.load(path / f"frame_{k}.npy", mmap_mode="r") for k in _FRAME_ARRAYS
+        }
+        raw = {k: np.load(path / f"raw_{k}.npy", mmap_mode="r") for k in _RAW_ARRAYS}
+
+    events = [tuple(event) for event in meta["events"]]
+    return BakedTrajectory(
+        path, meta["fps"], frames, raw, meta["names"], events, meta["phases"]
+    )
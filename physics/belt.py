@@ -0,0 +1,330 @@
+"""
+Batch tangent and belt routing geometry for pulley systems.
+
+Circles are described by a centre and a signed radius rho = direction * radius:
+direction 1 wraps the rope counter-clockwise, -1 clockwise, and plain points
+are circles with radius 0. Everything works on arrays, so a whole system of
+pulleys is solved in a handful of NumPy calls.
+"""
+
+import numpy as np
+
+__all__ = ["BeltPath"]
+
+TAU = 2 * np.pi
+
+
+def _as_points(points):
+    return np.atleast_2d(np.asarray(points, dtype=float))
+
+
+def tangent_points(points, centers, radii, directions=1):
+    """
+    Points on each circle where a line from the matching external point is
+    tangent. direction 1 gives the 'top/left' tangent, -1 the 'bottom/right'
+    one, as in PhysicsPulley.get_tangent_point. Points inside their circle are
+    returned unchanged. All arguments broadcast against each other.
+    """
+    points, centers = _as_points(points), _as_points(centers)
+    points, centers = np.broadcast_arrays(points, centers)
+    radii = np.broadcast_to(np.asarray(radii, dtype=float), len(points))
+    directions = np.broadcast_to(np.asarray(directions, dtype=float), len(points))
+
+    vec = points - centers
+    dist = np.hypot(vec[:, 0], vec[:, 1])
+    inside = dist <= radii
+
+    base_angle = np.arctan2(vec[:, 1], vec[:, 0])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        alpha = np.arccos(np.clip(radii / dist, -1, 1))
+    angle = base_angle - directions * alpha
+
+    result = centers + radii[:, None] * np.stack(
+        [np.cos(angle), np.sin(angle), np.zeros_like(angle)], axis=1
+    )
+    result[inside] = points[inside]
+    return result
+
+
+def span_tangents(c1, rho1, c2, rho2):
+    """
+    Tangent points of the straight spans leaving circles 1 towards circles 2.
+    With n the left normal of a span each tangent point is c - rho * n, which
+    puts counter-clockwise wraps (rho > 0) on the rope's left.
+    Returns (leave, enter), both shaped like c1.
+    """
+    c1, c2 = _as_points(c1), _as_points(c2)
+    rho1, rho2 = np.asarray(rho1, dtype=float), np.asarray(rho2, dtype=float)
+
+    d = c2 - c1
+    dist = np.hypot(d[:, 0], d[:, 1])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        alpha = np.arccos(np.clip((rho2 - rho1) / dist, -1, 1))
+    alpha = np.where(dist > 0, alpha, 0)
+
+    theta = np.arctan2(d[:, 1], d[:, 0]) + alpha
+    n = np.stack([np.cos(theta), np.sin(theta), np.zeros_like(theta)], axis=1)
+    return c1 - rho1[..., None] * n, c2 - rho2[..., None] * n
+
+
+def wrap_arcs(centers, rho, arrival, leave):
+    """Start angles and signed sweeps of the wraps from arrival to leave"""
+    centers = _as_points(centers)
+    arrival, leave = _as_points(arrival), _as_points(leave)
+    a_in = np.arctan2(arrival[:, 1] - centers[:, 1], arrival[:, 0] - centers[:, 0])
+    a_out = np.arctan2(leave[:, 1] - centers[:, 1], leave[:, 0] - centers[:, 0])
+    ccw = np.asarray(rho) > 0
+    sweep = np.where(ccw, (a_out - a_in) % TAU, -((a_in - a_out) % TAU))
+    return a_in, sweep
+
+
+def line_bezier_points(starts, ends):
+    """Straight cubic Beziers between matching points, shape (n, 4, 3)"""
+    starts, ends = _as_points(starts), _as_points(ends)
+    alphas = np.array([0, 1 / 3, 2 / 3, 1])[None, :, None]
+    return starts[:, None, :] + alphas * (ends - starts)[:, None, :]
+
+
+def arc_bezier_points(centers, radii, start_angles, sweeps, num_curves):
+    """Each arc split into num_curves cubic Beziers, shape (n, 4 * curves, 3)"""
+    centers = _as_points(centers)
+    radii = np.asarray(radii, dtype=float)[:, None, None]
+    delta = np.asarray(sweeps, dtype=float) / num_curves
+    a0 = np.asarray(start_angles)[:, None] + delta[:, None] * np.arange(num_curves)
+    a1 = a0 + delta[:, None]
+    handle = (4 / 3 * np.tan(delta / 4))[:, None, None] * radii
+
+    def on_circle(a):
+        return np.stack([np.cos(a), np.sin(a), np.zeros_like(a)], axis=-1)
+
+    def tangent(a):
+        return np.stack([-np.sin(a), np.cos(a), np.zeros_like(a)], axis=-1)
+
+    p0 = centers[:, None, :] + radii * on_circle(a0)
+    p3 = centers[:, None, :] + radii * on_circle(a1)
+    p1 = p0 + handle * tangent(a0)
+    p2 = p3 - handle * tangent(a1)
+    curves = np.stack([p0, p1, p2, p3], axis=2)
+    return curves.reshape(len(centers), 4 * num_curves, 3)
+
+
+class BeltPath:
+    """
+    Solved route of a rope or belt over an ordered list of circles.
+    Spans run from leave[i] to enter[i]; arc j wraps circle arc_index[j].
+    Circles with radius 0 (fixed points) get no arc.
+
+    The route keeps its arrays: update() re-solves it for moved circles in
+    place and bezier_points(out=...) writes into the caller's array, so a
+    path that is updated every frame allocates no new arrays after the first
+    one. Which circles have radius 0 is fixed when the path is built.
+    """
+
+    def __init__(self, centers, rho, closed=False):
+        self.centers = _as_points(centers).copy()
+        self.rho = np.array(rho, dtype=float)
+        self.closed = closed
+
+        n = len(self.centers)
+        wrapped = self.rho != 0
+        if closed:
+            self._start, self._end = np.arange(n), np.roll(np.arange(n), -1)
+            # Circle i is wrapped between the span arriving and the one leaving it
+            self.arc_index = np.flatnonzero(wrapped)
+            self._arriving = (self.arc_index - 1) % n
+        else:
+            self._start, self._end = np.arange(n - 1), np.arange(1, n)
+            self.arc_index = np.flatnonzero(wrapped[1:-1]) + 1
+            self._arriving = self.arc_index - 1
+        self._leaving = self.arc_index.copy()
+
+        spans, arcs = len(self._start), len(self.arc_index)
+        self.leave, self.enter = np.zeros((spans, 3)), np.zeros((spans, 3))
+        self.arc_start, self.arc_sweep = np.zeros(arcs), np.zeros(arcs)
+        self.span_lengths, self.arc_lengths = np.zeros(spans), np.zeros(arcs)
+        self.length = 0.0
+
+        # Work arrays for update
+        self._c1, self._c2, self._d, self._n = (np.zeros((spans, 3)) for _ in range(4))
+        self._r1, self._r2, self._dist, self._theta = (
+            np.zeros(spans) for _ in range(4)
+        )
+        self._degenerate = np.zeros(spans, dtype=bool)
+        self._arc_centers, self._arrival, self._departure = (
+            np.zeros((arcs, 3)) for _ in range(3)
+        )
+        self._arc_rho, self._a_out, self._dx, self._dy, self._cw_sweep = (
+            np.zeros(arcs) for _ in range(5)
+        )
+        self._cw = np.zeros(arcs, dtype=bool)
+        self._curves = {}
+
+        self.update(self.centers, self.rho)
+
+    def update(self, centers, rho):
+        """Re-solves the route in place for new centres and signed radii"""
+        self.centers[...] = centers
+        self.rho[...] = rho
+
+        # 1. Spans, as span_tangents: tangent points c - rho * n
+        c1, c2, d, n = self._c1, self._c2, self._d, self._n
+        r1, r2, dist, theta = self._r1, self._r2, self._dist, self._theta
+        np.take(self.centers, self._start, axis=0, out=c1)
+        np.take(self.centers, self._end, axis=0, out=c2)
+        np.take(self.rho, self._start, out=r1)
+        np.take(self.rho, self._end, out=r2)
+        np.subtract(c2, c1, out=d)
+        np.hypot(d[:, 0], d[:, 1], out=dist)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            np.subtract(r2, r1, out=theta)
+            np.divide(theta, dist, out=theta)
+        np.clip(theta, -1, 1, out=theta)
+        np.arccos(theta, out=theta)
+        np.less_equal(dist, 0, out=self._degenerate)
+        np.copyto(theta, 0, where=self._degenerate)
+        theta += np.arctan2(d[:, 1], d[:, 0], out=dist)
+        np.cos(theta, out=n[:, 0])
+        np.sin(theta, out=n[:, 1])
+        np.multiply(n, r1[:, None], out=d)
+        np.subtract(c1, d, out=self.leave)
+        np.multiply(n, r2[:, None], out=d)
+        np.subtract(c2, d, out=self.enter)
+
+        np.subtract(self.enter, self.leave, out=d)
+        np.einsum("ij,ij->i", d, d, out=self.span_lengths)
+        np.sqrt(self.span_lengths, out=self.span_lengths)
+
+        # 2. Wraps, as wrap_arcs: from the arriving to the leaving tangent point
+        if len(self.arc_index):
+            centers, arc_rho = self._arc_centers, self._arc_rho
+            np.take(self.centers, self.arc_index, axis=0, out=centers)
+            np.take(self.rho, self.arc_index, out=arc_rho)
+            np.take(self.enter, self._arriving, axis=0, out=self._arrival)
+            np.take(self.leave, self._leaving, axis=0, out=self._departure)
+            a_in, a_out, dx, dy = self.arc_start, self._a_out, self._dx, self._dy
+            for point, angle in ((self._arrival, a_in), (self._departure, a_out)):
+                np.subtract(point[:, 0], centers[:, 0], out=dx)
+                np.subtract(point[:, 1], centers[:, 1], out=dy)
+                np.arctan2(dy, dx, out=angle)
+
+            sweep, cw_sweep = self.arc_sweep, self._cw_sweep
+            np.subtract(a_out, a_in, out=sweep)
+            np.mod(sweep, TAU, out=sweep)
+            np.subtract(a_in, a_out, out=cw_sweep)
+            np.mod(cw_sweep, TAU, out=cw_sweep)
+            np.negative(cw_sweep, out=cw_sweep)
+            np.less_equal(arc_rho, 0, out=self._cw)
+            np.copyto(sweep, cw_sweep, where=self._cw)
+
+            np.multiply(sweep, arc_rho, out=self.arc_lengths)
+            np.abs(self.arc_lengths, out=self.arc_lengths)
+
+        self.length = float(self.span_lengths.sum() + self.arc_lengths.sum())
+        return self
+
+    def num_points(self, arc_segments=8):
+        num_spans, num_arcs = len(self.leave), len(self.arc_index)
+        return 4 * (num_spans + num_arcs * arc_segments)
+
+    def _layout(self, arc_segments):
+        """Work arrays and output rows of every span and arc, per arc_segments"""
+        if arc_segments in self._curves:
+            return self._curves[arc_segments]
+
+        k = 4 * arc_segments
+        arcs = {circle: j for j, circle in enumerate(self.arc_index.tolist())}
+        span_rows, arc_rows, row = [], [None] * len(arcs), 0
+
+        def add_arc(circle):
+            nonlocal row
+            if circle in arcs:
+                arc_rows[arcs[circle]] = np.arange(row, row + k)
+                row += k
+
+        for span in range(len(self.leave)):
+            if not self.closed and span > 0:
+                add_arc(span)  # the wrap before every span but the first
+            span_rows.append(np.arange(row, row + 4))
+            row += 4
+            if self.closed:
+                add_arc(int(self._end[span]))  # the wrap after every span
+
+        num_arcs = len(arcs)
+        layout = {
+            "span_rows": np.concatenate(span_rows),
+            "arc_rows": np.concatenate(arc_rows) if arc_rows else np.zeros(0, int),
+            "spans": np.zeros((len(self.leave), 4, 3)),
+            "arcs": np.zeros((num_arcs, arc_segments, 4, 3)),
+            "steps": np.arange(arc_segments, dtype=float),
+            "delta": np.zeros((num_arcs, 1)),
+            "radius": np.zeros((num_arcs, 1)),
+            "handle": np.zeros((num_arcs, 1)),
+            "angles": np.zeros((2, num_arcs, arc_segments)),
+            "cos": np.zeros((2, num_arcs, arc_segments)),
+            "sin": np.zeros((2, num_arcs, arc_segments)),
+        }
+        self._curves[arc_segments] = layout
+        return layout
+
+    def bezier_points(self, arc_segments=8, out=None):
+        """
+        Cubic Bezier points of the whole path in travel order. When out is
+        given (shape (num_points, 3)) it is filled in place and returned.
+        """
+        if out is None:
+            out = np.empty((self.num_points(arc_segments), 3))
+        layout = self._layout(arc_segments)
+
+        # Straight spans, as line_bezier_points
+        spans = layout["spans"]
+        for i, alpha in enumerate((0, 1 / 3, 2 / 3, 1)):
+            np.subtract(self.enter, self.leave, out=spans[:, i])
+            spans[:, i] *= alpha
+            spans[:, i] += self.leave
+        out[layout["span_rows"]] = spans.reshape(-1, 3)
+
+        if not len(self.arc_index):
+            return out
+
+        # Wraps split into arc_segments cubics each, as arc_bezier_points
+        arcs, delta, radius, handle = (
+            layout[key] for key in ("arcs", "delta", "radius", "handle")
+        )
+        angles, cos, sin = layout["angles"], layout["cos"], layout["sin"]
+        np.divide(self.arc_sweep[:, None], arc_segments, out=delta)
+        np.abs(self._arc_rho[:, None], out=radius)
+        np.multiply(delta, 0.25, out=handle)
+        np.tan(handle, out=handle)
+        handle *= 4 / 3
+        handle *= radius
+        np.multiply(delta, layout["steps"], out=angles[0])
+        angles[0] += self.arc_start[:, None]
+        np.add(angles[0], delta, out=angles[1])
+        np.cos(angles, out=cos)
+        np.sin(angles, out=sin)
+
+        centers = self._arc_centers[:, None, :]
+        for end, (corner, inner) in enumerate(((0, 1), (3, 2))):
+            point, control = arcs[:, :, corner], arcs[:, :, inner]
+            np.multiply(cos[end], radius, out=point[..., 0])
+            np.multiply(sin[end], radius, out=point[..., 1])
+            point[..., 2] = 0
+            point += centers
+            # Control points handle * (-sin, cos) after the start, before the end
+            np.multiply(sin[end], handle, out=control[..., 0])
+            np.multiply(cos[end], handle, out=control[..., 1])
+            np.negative(control[..., end], out=control[..., end])
+            control[..., 2] = 0
+            control += point
+        out[layout["arc_rows"]] = arcs.reshape(-1, 3)
+        return out
+
+
+def route_belt(centers, radii, directions, closed=False):
+    """
+    Solves the full path of a rope over an ordered list of circles: the
+    external/crossed tangent spans between consecutive circles, the wrap arcs
+    and the total length. Use radius 0 for fixed end points.
+    """
+    rho = np.asarray(directions, dtype=float) * np.asarray(radii, dtype=float)
+    return BeltPath(centers, rho, closed=closed)
@@ -0,0 +1,93 @@
+"""
+On-disk cache locations and parameter hashing shared by the physics layer.
+
+Everything lives under media/physics_cache next to manim's own caches, or
+under $PHYSICS_CACHE_DIR when it is set, so separate renders and worker
+processes find each other's results.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+
+import numpy as np
+
+CACHE_ENV = "PHYSICS_CACHE_DIR"
+
+
+def cache_root():
+    return Path(os.environ.get(CACHE_ENV, Path("media") / "physics_cache"))
+
+
+def cache_dir(kind):
+    """Directory for one kind of cached artefact, created on demand"""
+    path = cache_root() / kind
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def _canonical(obj):
+    """JSON-friendly form of obj with arrays reduced to a digest"""
+    if isinstance(obj, np.ndarray):
+        digest = hashlib.sha256(np.ascontiguousarray(obj).tobytes()).hexdigest()
+        return {"array": digest, "shape": list(obj.shape), "dtype": str(obj.dtype)}
+    if isinstance(obj, (np.floating, np.integer, np.bool_)):
+        return obj.item()
+    if isinstance(obj, dict):
+        return {str(k): _canonical(v) for k, v in sorted(obj.items())}
+    if isinstance(obj, (list, tuple)):
+        return [_canonical(v) for v in obj]
+    return obj
+
+
+def params_hash(*parts):
+    """Stable short hash of nested parameters (numbers, strings, arrays, ...)"""
+    payload = json.dumps(_canonical(list(parts)), sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+
+def file_hash(path, chunk_size=1 << 20):
+    """sha256 of a file's contents, read in chunks"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def atomic_save(path, array):
+    """np.save to path through a temporary file in the same directory"""
+    path = Path(path)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            np.save(f, np.ascontiguousarray(array))
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+@contextmanager
+def atomic_directory(path):
+    """
+    Yields a temporary directory that is renamed to path once the block
+    finishes, so readers never see a half-written entry. If another process
+    finished the same entry first, its copy wins and ours is discarded.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = Path(tempfile.mkdtemp(dir=path.parent, prefix=f".{path.name}."))
+    try:
+        yield tmp
+    except BaseException:
+        shutil.rmtree(tmp, ignore_errors=True)
+        raise
+    try:
+        os.replace(tmp, path)
+    except OSError:
+        shutil.rmtree(tmp, ignore_errors=True)
@@ -0,0 +1,158 @@
+from manim import *
+
+from .rope import PhysicsRope
+
+
+class PhysicsChain(VMobject):
+    """
+    A rope that can sag and go slack: a chain of point masses integrated with
+    position based Verlet, held together by distance constraints.
+
+    The ends are waypoints as in PhysicsRope: fixed points, callables such as
+    car.get_rope_anchor, or (pulley, direction) pairs, where the end sits on
+    the pulley's tangent point towards the next link. Moving ends are
+    interpolated across the fixed steps of a frame. Each step satisfies the
+    constraints of all even links at once, then all odd links (the links of
+    each half share no node), so one pass is a few array operations whatever
+    the number of links. The chain is drawn as one smooth curve through its
+    nodes, written into the point array allocated at construction.
+    """
+
+    def __init__(
+        self,
+        start,
+        end,
+        links=64,
+        length=None,
+        gravity=DOWN * 9.8,
+        damping=0.02,
+        iterations=16,
+        floor=None,
+        dt=1 / 240,
+        color=WHITE,
+        stroke_width=3,
+        **kwargs,
+    ):
+        super().__init__(color=color, stroke_width=stroke_width, **kwargs)
+        self.ends = [PhysicsRope._parse_waypoint(w) for w in (start, end)]
+        self.gravity = np.asarray(gravity, dtype=float)
+        self.damping = damping
+        self.iterations = iterations
+        self.floor = floor
+        self.dt = dt
+        self.time = 0.0
+        self._accumulator = 0.0
+
+        # 1. Nodes on the straight line between the ends, at rest
+        a, b = self._end_points(None)
+        if length is None:
+            length = np.linalg.norm(b - a)
+        self.positions = a + np.linspace(0, 1, links + 1)[:, None] * (b - a)
+        self.previous = self.positions.copy()
+        self._anchors = np.array([a, b])
+        self.set_length(length)
+
+        # 2. Links split into two halves without shared nodes, with the share
+        # of each correction taken by either node (none by the held ends)
+        weights = np.ones(links + 1)
+        weights[[0, -1]] = 0
+        self._halves = []
+        for parity in (0, 1):
+            a, b = slice(parity, links, 2), slice(parity + 1, links + 1, 2)
+            total = np.maximum(weights[a] + weights[b], 1e-12)
+            share_a, share_b = weights[a] / total, weights[b] / total
+            self._halves.append((a, b, share_a[:, None], share_b[:, None]))
+
+        # 3. One cubic per link, allocated once
+        self.set_points(np.zeros((4 * links, 3)))
+        self._redraw()
+        self.add_updater(self._advance)
+
+    def set_length(self, length):
+        """Changes the total rest length; the extra rope sags or is pulled taut"""
+        self.length = length
+        self.rest = length / (len(self.positions) - 1)
+        return self
+
+    def get_length(self):
+        return self.length
+
+    def get_stretched_length(self):
+        """Current length along the nodes; exceeds get_length when taut"""
+        return np.linalg.norm(np.diff(self.positions, axis=0), axis=1).sum()
+
+    def _end_points(self, positions):
+        """Where the two ends are held now"""
+        points = []
+        for k, (pulley, direction, source) in enumerate(self.ends):
+            if pulley is None:
+                points.append(np.asarray(source(), dtype=float))
+                continue
+            # Tangent towards the neighbouring node, or the other end at first
+            if positions is None:
+                other_pulley, _, other_source = self.ends[1 - k]
+                if other_pulley is None:
+                    neighbour = other_source()
+                else:
+                    neighbour = other_pulley.center_pos
+            else:
+                neighbour = positions[1] if k == 0 else positions[-2]
+            points.append(pulley.get_tangent_point(neighbour, direction))
+        return points
+
+    def step(self, anchors, dt=None):
+        """One Verlet step with the ends held at anchors (2, 3)"""
+        dt = self.dt if dt is None else dt
+        positions = self.positions
+
+        # 1. Inertia and gravity
+        velocity = (positions - self.previous) * (1 - self.damping)
+        self.previous = positions.copy()
+        positions += velocity + self.gravity * dt**2
+
+        # 2. Distance constraints, even then odd links; the ends do not move
+        positions[0], positions[-1] = anchors
+        for _ in range(self.iterations):
+            for a, b, share_a, share_b in self._halves:
+                # Slices are views, so the nodes are corrected in place
+                delta = positions[b] - positions[a]
+                distance = np.sqrt(np.einsum("ij,ij->i", delta, delta))[:, None]
+                delta *= 1 - self.rest / np.maximum(distance, 1e-12)
+                positions[a] += share_a * delta
+                positions[b] -= share_b * delta
+
+        # 3. The floor stops nodes and their vertical motion
+        if self.floor is not None:
+            below = positions[:, 1] < self.floor
+            positions[below, 1] = self.floor
+            self.previous[below, 1] = self.floor
+
+        self.time += dt
+        return self
+
+    def advance(self, duration):
+        """Runs as many fixed steps as fit in duration, carrying the rest"""
+        start, end = self._anchors, np.array(self._end_points(self.positions))
+        self._accumulator += duration
+        steps = int(self._accumulator / self.dt + 1e-9)
+        for k in range(1, steps + 1):
+            self.step(start + (end - start) * k / steps)
+        self._accumulator -= steps * self.dt
+        if steps:
+            self._anchors = end
+        self._redraw()
+        return self
+
+    def _advance(self, mob, dt):
+        self.advance(dt)
+
+    def _redraw(self):
+        """Catmull-Rom curve through the nodes as one cubic per link"""
+        nodes = self.positions
+        padded = np.concatenate([nodes[:1], nodes, nodes[-1:]])
+        tangents = (padded[2:] - padded[:-2]) / 6
+        points = self.points.reshape(-1, 4, 3)
+        points[:, 0] = nodes[:-1]
+        points[:, 1] = nodes[:-1] + tangents[:-1]
+        points[:, 2] = nodes[1:] - tangents[1:]
+        points[:, 3] = nodes[1:]
@@ -0,0 +1,321 @@
+"""
+Contacts between moving bodies and static surfaces.
+
+Bodies are the axis-aligned boxes around their mobjects; surfaces are line
+segments (the line of a PhysicsSurface, the outline of a PhysicsPlatform, or
+the chords of any other VMobject). Once per frame every body's box swept
+from its last position is hashed into a uniform grid together with the
+surface segments, so only pairs sharing a cell are tested: the cost grows
+with the number of bodies and segments, not with their product. Candidate
+pairs are tested exactly (segment / box clipping, box / box overlap) along
+the frame's motion, and the first touching time is found by sampling and
+bisection for all pairs at once, so events carry a sub-frame time.
+"""
+
+from collections import namedtuple
+
+from manim import *
+
+from .pobject import PhysicsPlatform
+from .surface import PhysicsSurface
+
+__all__ = ["Contact", "PhysicsCollisions"]
+
+# kind is "begin" or "end"; other is a surface or another body
+Contact = namedtuple("Contact", "time kind body other point normal")
+
+
+def _spatial_hash(cx, cy):
+    # Distinct cells may share a key; that only adds candidate pairs
+    return (cx * 73856093) ^ (cy * 19349663)
+
+
+def _cell_entries(boxes, cell):
+    """(key, item) for every grid cell touched by each (x0, y0, x1, y1) box"""
+    low = np.floor(boxes[:, :2] / cell).astype(np.int64)
+    span = np.floor(boxes[:, 2:] / cell).astype(np.int64) - low + 1
+    counts = span[:, 0] * span[:, 1]
+    item = np.repeat(np.arange(len(boxes)), counts)
+    local = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    cx = low[item, 0] + local % span[item, 0]
+    cy = low[item, 1] + local // span[item, 0]
+    return _spatial_hash(cx, cy), item
+
+
+def _join(keys_a, items_a, keys_b, items_b):
+    """Unique (a, b) item pairs that share a key, shape (P, 2)"""
+    order = np.argsort(keys_b, kind="stable")
+    keys_b, items_b = keys_b[order], items_b[order]
+    start = np.searchsorted(keys_b, keys_a, side="left")
+    counts = np.searchsorted(keys_b, keys_a, side="right") - start
+    local = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    pairs = np.stack(
+        [np.repeat(items_a, counts), items_b[np.repeat(start, counts) + local]], axis=1
+    )
+    return np.unique(pairs, axis=0)
+
+
+def _segment_touches_box(starts, ends, boxes):
+    """Liang-Barsky clipping of each segment against its box"""
+    d = ends - starts
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t0 = (boxes[:, :2] - starts) / d
+        t1 = (boxes[:, 2:] - starts) / d
+    near, far = np.minimum(t0, t1), np.maximum(t0, t1)
+
+    # A segment parallel to a slab is either inside it for its whole length or never
+    parallel = d == 0
+    inside = (starts >= boxes[:, :2]) & (starts <= boxes[:, 2:])
+    near = np.where(parallel, np.where(inside, -np.inf, np.inf), near)
+    far = np.where(parallel, np.where(inside, np.inf, -np.inf), far)
+    return np.maximum(near.max(axis=1), 0) <= np.minimum(far.min(axis=1), 1)
+
+
+def _boxes_overlap(a, b):
+    return np.all((a[:, :2] <= b[:, 2:]) & (b[:, :2] <= a[:, 2:]), axis=1)
+
+
+def _first_contact(touching, count, samples=8, iterations=20):
+    """
+    Smallest s in [0, 1] with touching(s) per pair (s is a (count,) array),
+    NaN for pairs that never touch. The frame is sampled first, so motions
+    that pass through a thin surface between frames are caught too, then
+    each bracket is bisected.
+    """
+    low = np.zeros(count)
+    high = np.full(count, np.nan)
+    found = touching(low)
+    high[found] = 0.0
+    for k in range(1, samples + 1):
+        hit = ~found & touching(np.full(count, k / samples))
+        low[hit], high[hit] = (k - 1) / samples, k / samples
+        found |= hit
+
+    search = found & (high > 0)
+    for _ in range(iterations):
+        mid = np.where(search, (low + high) / 2, 1.0)
+        hit = touching(mid)
+        high = np.where(search & hit, mid, high)
+        low = np.where(search & ~hit, mid, low)
+    return high
+
+
+def _box(mobject):
+    points = mobject.get_all_points()
+    if not len(points):
+        points = mobject.get_center()[None]
+    return np.concatenate([points[:, :2].min(axis=0), points[:, :2].max(axis=0)])
+
+
+def _surface_segments(mobject):
+    """(start x, start y, end x, end y) of every segment of a surface"""
+    if isinstance(mobject, PhysicsSurface):
+        parts = [mobject.main_line]
+    elif isinstance(mobject, PhysicsPlatform):
+        parts = [mobject.outline]
+    else:
+        parts = mobject.family_members_with_points()
+    # The chord of every cubic; exact for the straight edges used here
+    return np.vstack(
+        [np.hstack([m.points[0::4, :2], m.points[3::4, :2]]) for m in parts]
+    )
+
+
+class PhysicsCollisions(Mobject):
+    """
+    Detects contacts between registered bodies and surfaces every frame and
+    sends Contact events to the callbacks registered with on_contact.
+
+    The updater has to run after the bodies have moved, so the collision
+    mobject goes in front of them; `attach` adds it last. Surfaces are read
+    once when added; call `add_surface` again after moving one.
+    """
+
+    def __init__(self, cell_size=None, margin=0.0, samples=8, **kwargs):
+        super().__init__(**kwargs)
+        self.cell_size = cell_size
+        self.margin = margin
+        self.samples = samples
+
+        self.bodies = []
+        self.surfaces = []
+        self._segments = np.zeros((0, 4))
+        self._segment_owner = np.zeros(0, dtype=int)
+        self._previous = np.zeros((0, 4))
+
+        self.time = 0.0
+        self.active = set()
+        self.events = []
+        self.handlers = []
+
+        self.add_updater(self._detect)
+
+    def attach(self, scene):
+        """Adds the detector to the scene, after the bodies it watches"""
+        scene.add(self)
+        return self
+
+    def add_body(self, mobject):
+        self.bodies.append(mobject)
+        self._previous = np.vstack([self._previous, _box(mobject)])
+        return self
+
+    def add_surface(self, mobject):
+        """Adds a surface, or re-reads the segments of one that has moved"""
+        index = next((i for i, s in enumerate(self.surfaces) if s is mobject), None)
+        if index is None:
+            index = len(self.surfaces)
+            self.surfaces.append(mobject)
+        keep = self._segment_owner != index
+        segments = _surface_segments(mobject)
+        self._segments = np.vstack([self._segments[keep], segments])
+        self._segment_owner = np.concatenate(
+            [self._segment_owner[keep], np.full(len(segments), index)]
+        )
+        return self
+
+    def on_contact(self, callback, body=None, other=None, kind="begin"):
+        """
+        Calls callback(contact) for contacts of body (any body if None) with
+        other (any surface or body if None); kind is "begin" or "end".
+        """
+        self.handlers.append((callback, body, other, kind))
+        return self
+
+    def _detect(self, mob, dt):
+        start, self.time = self.time, self.time + dt
+        if not self.bodies:
+            return
+
+        # 1. Boxes at the start and end of the frame, and the swept box
+        current = np.array([_box(body) for body in self.bodies])
+        previous, self._previous = self._previous, current
+        margin = np.array([-1, -1, 1, 1]) * self.margin
+        swept = np.hstack(
+            [
+                np.minimum(previous[:, :2], current[:, :2]),
+                np.maximum(previous[:, 2:], current[:, 2:]),
+            ]
+        )
+        swept += margin
+
+        def box_at(index, s):
+            return previous[index] + s[:, None] * (current - previous)[index] + margin
+
+        # 2. Broad phase: bodies and segments meeting in a grid cell
+        cell = self.cell_size
+        if cell is None:
+            sizes = np.max(current[:, 2:] - current[:, :2], axis=1)
+            cell = max(2 * np.median(sizes), 1e-3)
+        body_keys, body_items = _cell_entries(swept, cell)
+
+        candidates = []
+        if len(self._segments):
+            segments = self._segments
+            bounds = np.hstack(
+                [
+                    np.minimum(segments[:, :2], segments[:, 2:]),
+                    np.maximum(segments[:, :2], segments[:, 2:]),
+                ]
+            )
+            pairs = _join(body_keys, body_items, *_cell_entries(bounds, cell))
+            body, segment = pairs.T
+
+            def touching(s):
+                return _segment_touches_box(
+                    segments[segment, :2], segments[segment, 2:], box_at(body, s)
+                )
+
+            owner = self._segment_owner[segment]
+            candidates.append(("surface", body, owner, segment, touching))
+
+        pairs = _join(body_keys, body_items, body_keys, body_items)
+        pairs = pairs[pairs[:, 0] < pairs[:, 1]]
+        first, second = pairs.T
+
+        def touching_bodies(s):
+            return _boxes_overlap(box_at(first, s), box_at(second, s))
+
+        candidates.append(("body", first, second, None, touching_bodies))
+
+        # 3. Narrow phase: first touching time and end state of every contact
+        contacts = {}
+        for kind, body, other, segment, touching in candidates:
+            if not len(body):
+                continue
+            toi = _first_contact(touching, len(body), self.samples)
+            now = touching(np.ones(len(body)))
+            for k in np.flatnonzero(~np.isnan(toi)):
+                key = (body[k], kind, other[k])
+                s, touches, nearest = contacts.get(key, (np.inf, False, None))
+                if toi[k] < s:
+                    s, nearest = toi[k], None if segment is None else segment[k]
+                contacts[key] = (s, touches or now[k], nearest)
+
+        # 4. Events for contacts that began or ended during the frame
+        events = []
+        touching_now = set()
+        for key, (s, touches, segment) in contacts.items():
+            if touches:
+                touching_now.add(key)
+            if key not in self.active:
+                time = start + s * dt
+                events.append(self._contact(time, "begin", key, s, box_at, segment))
+                if not touches:
+                    events.append(self._contact(self.time, "end", key, 1.0, box_at))
+        for key in self.active - touching_now:
+            events.append(self._contact(self.time, "end", key, 1.0, box_at))
+        self.active = touching_now
+
+        for event in sorted(events, key=lambda e: e.time):
+            self.events.append(event)
+            for callback, body, other, kind in self.handlers:
+                if (
+                    kind == event.kind
+                    and (body is None or body is event.body)
+                    and (other is None or other is event.other)
+                ):
+                    callback(event)
+
+    def _contact(self, time, kind, key, s, box_at, segment=None):
+        """Contact event with the point and normal at fraction s of the frame"""
+        body, other_kind, other = key
+        box = box_at(np.array([body]), np.array([s]))[0]
+        center = (box[:2] + box[2:]) / 2
+
+        if other_kind == "surface":
+            # The segment hit first, or the nearest one of the surface
+            if segment is None:
+                segments = self._segments[self._segment_owner == other]
+            else:
+                segments = self._segments[[segment]]
+            starts, ends = segments[:, :2], segments[:, 2:]
+            d = ends - starts
+            t = np.einsum("ij,ij->i", center - starts, d) / np.einsum("ij,ij->i", d, d)
+            closest = starts + np.clip(t, 0, 1)[:, None] * d
+            nearest = np.argmin(np.linalg.norm(center - closest, axis=1))
+            point = closest[nearest]
+            normal = center - point
+            if not np.any(normal):
+                normal = np.array([-d[nearest, 1], d[nearest, 0]])
+            other_mobject = self.surfaces[other]
+        else:
+            other_box = box_at(np.array([other]), np.array([s]))[0]
+            low = np.maximum(box[:2], other_box[:2])
+            high = np.minimum(box[2:], other_box[2:])
+            point = (low + high) / 2
+            # Normal along the axis of least overlap, pointing towards the body
+            axis = np.argmin(high - low)
+            normal = np.zeros(2)
+            normal[axis] = np.sign(center[axis] - point[axis]) or 1.0
+            other_mobject = self.bodies[other]
+
+        normal = normal / np.linalg.norm(normal)
+        return Contact(
+            time,
+            kind,
+            self.bodies[body],
+            other_mobject,
+            np.array([*point, 0.0]),
+            np.array([*normal, 0.0]),
+        )
@@ -0,0 +1,352 @@
+"""
+Numeric dry runs of physics scenes.
+
+A dry run plays a scene's whole timeline at the target frame rate, running
+every animation and updater, but nothing is rasterized, no TeX is compiled
+and no video or audio is written. Trajectories are still baked into the
+physics cache (see physics.cache), as in a render, so a later render reuses
+them. After every frame the state of the physics objects is recorded: the
+value, velocity and acceleration of each tracker and the center of each
+body in a PhysicsWorld. Channels are named after the mobjects' names
+(manim's name argument, the class name by default), so for a scene that
+names its trackers and bodies a test can do
+
+    run = dry_run(FullPhysicsDemoLightMood, fps=30)
+    run["mass_tracker.velocity"][-1], run.sample("car", 2.5)
+
+Voiceover scenes get a silent speech service with fixed word timing, so
+their durations do not depend on a network service. Its clips go to a
+temporary voiceover cache that is removed afterwards. From the shell:
+
+    PYTHONPATH=. python -m physics.dryrun example/car_pulley.py \\
+        FullPhysicsDemoLightMood --fps 30
+"""
+
+import argparse
+import hashlib
+import inspect
+import re
+import shutil
+import tempfile
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+
+from manim_voiceover import VoiceoverScene
+
+from manim import *
+from manim.renderer.cairo_renderer import CairoRenderer
+from manim.scene.scene_file_writer import SceneFileWriter
+
+from .motion import PhysicsTracker
+from .readout import _GLYPH_CACHE
+from .voiceover import LocalSpeechService
+from .world import PhysicsWorld
+
+__all__ = [
+    "DryRun",
+    "DryRunRenderer",
+    "SilentSpeechService",
+    "dry_run",
+    "placeholder_tex",
+]
+
+# One silent MPEG-1 Layer III frame: 128 kbps, 48 kHz, mono, 24 ms
+_MP3_FRAME = bytes([0xFF, 0xFB, 0x94, 0xC0]) + bytes(380)
+_MP3_FRAME_TIME = 1152 / 48000
+
+# What counts as one glyph of a placeholder TeX expression. Tokens never span
+# whitespace, so MathTex parts add up to the glyphs of the joined expression.
+_TEX_GLYPH = re.compile(r"\\[a-zA-Z]+|\\.|[^\s{}^_&\\]")
+
+
+class SilentSpeechService(LocalSpeechService):
+    """
+    LocalSpeechService writing silent MP3 frames instead of tones: no
+    encoder is needed and every clip lasts exactly its word timing.
+    """
+
+    service_name = "silent"
+
+    def _write_audio(self, path, samples):
+        frames = max(1, round(len(samples) / self.sample_rate / _MP3_FRAME_TIME))
+        path.write_bytes(_MP3_FRAME * frames)
+
+
+@contextmanager
+def _silent_narration():
+    """SilentSpeechService with its own voiceover cache, removed on exit"""
+    directory = Path(tempfile.mkdtemp(prefix="physics_voiceovers_"))
+    try:
+        yield SilentSpeechService(cache_dir=directory)
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+class _NullFileWriter(SceneFileWriter):
+    """Keeps sections and subcaptions, writes nothing, notes the sounds"""
+
+    def __init__(self, renderer, scene_name, **kwargs):
+        super().__init__(renderer, scene_name, **kwargs)
+        self.sounds = []
+
+    def add_partial_movie_file(self, hash_animation):
+        pass
+
+    def is_already_cached(self, hash_invocation):
+        return False
+
+    def begin_animation(self, allow_write=False, file_path=None):
+        pass
+
+    def end_animation(self, allow_write=False):
+        pass
+
+    def write_frame(self, frame_or_renderer, num_frames=1):
+        pass
+
+    def add_sound(self, sound_file, time=None, gain=None, **kwargs):
+        self.sounds.append((sound_file, time))
+
+    def save_image(self, image):
+        pass
+
+    def finish(self):
+        pass
+
+
+class DryRunRenderer(CairoRenderer):
+    """
+    CairoRenderer that never skips an animation and never draws: each frame
+    only advances the clock and records the physics state of the scene.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(file_writer_class=_NullFileWriter, **kwargs)
+        self.scene = None
+        self.times = []
+        self.frames = []
+        self.plays = []
+        self._labels = {}  # id -> (label, mobject), which keeps the id in use
+
+    def init_scene(self, scene):
+        super().init_scene(scene)
+        self.scene = scene
+
+    def play(self, scene, *args, **kwargs):
+        start = self.time
+        super().play(scene, *args, **kwargs)
+        self.plays.append((start, self.time - start))
+
+    def update_skipping_status(self):
+        pass
+
+    def update_frame(self, *args, **kwargs):
+        pass
+
+    def get_frame(self):
+        return None
+
+    def render(self, scene, time, moving_mobjects=None):
+        self.add_frame(None)
+
+    def add_frame(self, frame, num_frames=1):
+        state = self._state()
+        dt = 1 / self.camera.frame_rate
+        for _ in range(num_frames):
+            self.times.append(self.time)
+            self.frames.append(state)
+            self.time += dt
+
+    def _label(self, mobject):
+        """The mobject's name, numbered when an earlier mobject has it"""
+        if id(mobject) not in self._labels:
+            taken = {label for label, _ in self._labels.values()}
+            label, n = mobject.name, 1
+            while label in taken:
+                n += 1
+                label = f"{mobject.name}#{n}"
+            self._labels[id(mobject)] = (label, mobject)
+        return self._labels[id(mobject)][0]
+
+    def _state(self):
+        state = {}
+
+        def track(tracker):
+            label = self._label(tracker)
+            state[label] = tracker.get_value()
+            if isinstance(tracker, PhysicsTracker):
+                state[f"{label}.velocity"] = tracker.get_velocity()
+                state[f"{label}.acceleration"] = tracker.get_acceleration()
+
+        for mobject in self.scene.mobjects:
+            if isinstance(mobject, PhysicsWorld):
+                for tracker in mobject.trackers:
+                    track(tracker)
+                for body, _ in mobject.bodies:
+                    state[self._label(body)] = body.get_center()
+            elif isinstance(mobject, ValueTracker):
+                track(mobject)
+        return state
+
+
+class DryRun:
+    """
+    Result of a dry run: times (one per frame), channels (name -> array with
+    one row per frame, NaN before the channel existed), plays as (start,
+    duration), the sounds that would have been added, and the scene itself.
+    """
+
+    def __init__(self, scene, renderer):
+        self.scene = scene
+        self.times = np.array(renderer.times)
+        self.plays = renderer.plays
+        self.sounds = renderer.file_writer.sounds
+
+        frames = renderer.frames
+        self.channels = {}
+        for name in dict.fromkeys(key for state in frames for key in state):
+            shape = np.shape(next(s[name] for s in frames if name in s))
+            values = np.full((len(frames), *shape), np.nan)
+            for i, state in enumerate(frames):
+                if name in state:
+                    values[i] = state[name]
+            self.channels[name] = values
+
+    def __getitem__(self, name):
+        return self.channels[name]
+
+    def __contains__(self, name):
+        return name in self.channels
+
+    @property
+    def duration(self):
+        return sum(duration for _, duration in self.plays)
+
+    def sample(self, name, t):
+        """Value of a channel in the frame shown at time t"""
+        i = np.searchsorted(self.times, t, side="right") - 1
+        return self.channels[name][max(i, 0)]
+
+
+def _placeholder_svg(glyphs):
+    paths = "".join(f'<path d="M{6 * i} 0h5v-7h-5z"/>' for i in range(glyphs))
+    return (
+        '<svg xmlns="http://www.w3.org/2000/svg" '
+        f'viewBox="0 -8 {max(6 * glyphs, 1)} 10">{paths}</svg>'
+    )
+
+
+@contextmanager
+def placeholder_tex():
+    """Typesets Tex/MathTex as one box per glyph, without running LaTeX"""
+    from manim.mobject.text import tex_mobject
+
+    directory = Path(tempfile.mkdtemp(prefix="physics_tex_"))
+    tex_to_svg_file = tex_mobject.tex_to_svg_file
+
+    def placeholder(expression, environment=None, tex_template=None):
+        path = directory / f"{hashlib.sha256(expression.encode()).hexdigest()}.svg"
+        if not path.exists():
+            path.write_text(_placeholder_svg(len(_TEX_GLYPH.findall(expression))))
+        return path
+
+    # Readout glyphs typeset from placeholders must not outlive the dry run
+    glyphs = dict(_GLYPH_CACHE)
+    _GLYPH_CACHE.clear()
+    tex_mobject.tex_to_svg_file = placeholder
+    try:
+        yield
+    finally:
+        tex_mobject.tex_to_svg_file = tex_to_svg_file
+        _GLYPH_CACHE.clear()
+        _GLYPH_CACHE.update(glyphs)
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def _camera_class(scene_class):
+    """The camera_class default of the nearest __init__ declaring one"""
+    for cls in scene_class.__mro__:
+        if "__init__" in cls.__dict__:
+            parameter = inspect.signature(cls.__init__).parameters.get("camera_class")
+            if parameter is not None:
+                return parameter.default
+    return Camera
+
+
+def _play_headless(
+    scene_class, renderer_class, settings, speech_service, tex, **kwargs
+):
+    """
+    Renders scene_class with renderer_class under settings and returns the
+    (scene, renderer). Voiceover scenes use speech_service in place of their
+    own unless it is None.
+    """
+    tex_context = nullcontext() if tex else placeholder_tex()
+    with tempconfig(settings), tex_context:
+        renderer = renderer_class(camera_class=_camera_class(scene_class), **kwargs)
+        scene = scene_class(renderer=renderer)
+
+        if isinstance(scene, VoiceoverScene) and speech_service is not None:
+            set_speech_service = type(scene).set_speech_service
+
+            def mocked(_, *args, **kwargs):
+                return set_speech_service(scene, speech_service, *args, **kwargs)
+
+            scene.set_speech_service = mocked
+
+        scene.render()
+    return scene, renderer
+
+
+def dry_run(scene_class, fps=None, speech_service=None, tex=False):
+    """
+    Plays scene_class without rendering and returns its DryRun. fps defaults
+    to the configured frame rate. Voiceover scenes use speech_service in
+    place of their own (a SilentSpeechService on a temporary cache by
+    default, so DryRun.sounds name files that no longer exist). With
+    tex=True real LaTeX is used instead of placeholder glyphs.
+    """
+    settings = {
+        "dry_run": True,
+        "disable_caching": True,
+        "write_to_movie": False,
+        "save_last_frame": False,
+        "progress_bar": "none",
+        "verbosity": "WARNING",
+        "pixel_width": 160,
+        "pixel_height": 90,
+    }
+    if fps is not None:
+        settings["frame_rate"] = fps
+
+    narration = nullcontext(speech_service) if speech_service else _silent_narration()
+    with narration as service:
+        scene, renderer = _play_headless(
+            scene_class, DryRunRenderer, settings, service, tex
+        )
+    return DryRun(scene, renderer)
+
+
+def main():
+    from .parallel import load_scene_class
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("file")
+    parser.add_argument("scene")
+    parser.add_argument("--fps", type=float)
+    parser.add_argument("--tex", action="store_true", help="typeset real LaTeX")
+    parser.add_argument("--save", help="write the channels to this .npz file")
+    args = parser.parse_args()
+
+    run = dry_run(load_scene_class(args.file, args.scene), args.fps, tex=args.tex)
+    print(f"{len(run.plays)} animations, {len(run.times)} frames, {run.duration:.2f}s")
+    for i, (start, duration) in enumerate(run.plays):
+        print(f"  {i:>3}  {start:8.3f}s  +{duration:.3f}s")
+    for name, values in run.channels.items():
+        print(f"{name:<32} {np.array2string(values[-1], precision=4)}")
+    if args.save:
+        np.savez(args.save, times=run.times, **run.channels)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,335 @@
+"""
+Content hashes of physics mobjects for manim's partial movie cache.
+
+manim names every partial movie after a hash of its play call: the camera,
+the animations and the mobjects on screen, serialized to JSON. A function is
+serialized as its source and every global and nonlocal it reads, any other
+object as its whole __dict__. For physics scenes that pulls in the tracker
+behind every body with the animation last driving it and whatever an
+always_redraw lambda closes over, and the source carries its position in
+the file, so the hash of an unchanged section moves with edits elsewhere
+and the section is rendered again.
+
+install_hashing() gives manim's encoder a declarative description of the
+objects and functions of the physics package instead:
+
+* a physics mobject is its type, a digest of its family's points and style,
+  the state it keeps besides its points (trackers by value, other mobjects
+  by digest) and its updaters;
+* a function is its name, a digest of its bytecode and constants, what it
+  closes over, its defaults and every global it reads: data by value,
+  functions and classes by their code, modules and the code of Python and
+  installed packages by name. Line numbers are not part of it, so editing
+  code above a function does not change it.
+
+Nothing is cut off at a depth; an object met again inside itself is marked
+as a cycle. Objects this module has no description for, and everything
+outside the physics package, are serialized by manim as before. It is
+installed as soon as a manim-based name is imported from the physics
+package, unless PHYSICS_HASHING=0.
+"""
+
+import functools
+import hashlib
+import inspect
+import sys
+import sysconfig
+import types
+from pathlib import Path
+
+from manim import *
+
+from .bake import BakedTrajectory
+from .motion import PhysicsTracker
+
+__all__ = ["HASHING_ENV", "family_fingerprint", "install_hashing", "physics_signature"]
+
+HASHING_ENV = "PHYSICS_HASHING"
+
+_state = {"installed": False, "default": None}
+_PACKAGE = __name__.partition(".")[0]
+_FUNCTIONS = (types.FunctionType, types.MethodType, functools.partial)
+_SITE_PACKAGES = {Path(sysconfig.get_paths()[key]) for key in ("purelib", "platlib")}
+# Class attributes that say nothing about its behaviour
+_CLASS_NOISE = {
+    "__dict__",
+    "__weakref__",
+    "__doc__",
+    "__module__",
+    "__qualname__",
+    "__firstlineno__",
+    "__static_attributes__",
+}
+
+# Caches rebuilt from the state that is hashed
+_DERIVED = {
+    "StaticBackdrop": {"_key", "_region", "_colors", "_inverse", "_buffer"},
+    "PhysicsChain": {"_halves"},
+    "PhysicsRope": {"path", "_centers", "_rho"},
+}
+
+
+def family_fingerprint(mobject):
+    """Digest of everything the camera reads when drawing the family"""
+    digest = hashlib.blake2b(digest_size=16)
+    for member in mobject.family_members_with_points():
+        digest.update(type(member).__name__.encode())
+        digest.update(np.ascontiguousarray(member.points).tobytes())
+        for name in ("fill_rgbas", "stroke_rgbas", "background_stroke_rgbas"):
+            value = getattr(member, name, None)
+            if value is not None:
+                digest.update(np.ascontiguousarray(value).tobytes())
+        style = [getattr(member, name, None) for name in ("stroke_width", "z_index")]
+        style += [getattr(member, "background_stroke_width", None)]
+        style += [getattr(member, "sheen_factor", None)]
+        digest.update(repr(style).encode())
+    return digest.digest()
+
+
+def _name(obj):
+    return f"{getattr(obj, '__module__', None)}.{getattr(obj, '__qualname__', '?')}"
+
+
+@functools.cache
+def _is_physics(cls):
+    return any(base.__module__.partition(".")[0] == _PACKAGE for base in cls.__mro__)
+
+
+def _in_package(func):
+    """Whether func is defined in the physics package or bound to its objects"""
+    owner = getattr(func, "__self__", None)
+    if owner is not None and _is_physics(type(owner)):
+        return True
+    func = inspect.unwrap(getattr(func, "func", func))
+    module = getattr(func, "__module__", None) or ""
+    return module.partition(".")[0] == _PACKAGE
+
+
+@functools.cache
+def _is_library(module):
+    """Whether a module belongs to Python itself or an installed package"""
+    top = (module or "builtins").partition(".")[0]
+    if top == "builtins" or top in sys.stdlib_module_names:
+        return True
+    path = getattr(sys.modules.get(top), "__file__", None)
+    return path is not None and any(
+        Path(path).is_relative_to(site) for site in _SITE_PACKAGES
+    )
+
+
+@functools.cache
+def _mobject_keys():
+    """Attributes of every VMobject: covered by the fingerprint or irrelevant"""
+    return frozenset(vars(Mobject())) | frozenset(vars(VMobject()))
+
+
+@functools.cache
+def _code_digest(code):
+    """Bytecode, names and constants of a code object, without line numbers"""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(code.co_code)
+    digest.update(repr(code.co_names).encode())
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            digest.update(_code_digest(const).encode())
+        else:
+            digest.update(repr(const).encode())
+    return digest.hexdigest()
+
+
+@functools.cache
+def _global_names(code):
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names.update(_global_names(const))
+    return tuple(sorted(names))
+
+
+def _array_digest(array, memo):
+    if array.dtype == object:
+        return [_describe(value, memo) for value in array.ravel().tolist()]
+    digest = hashlib.blake2b(np.ascontiguousarray(array).tobytes(), digest_size=16)
+    return f"{array.dtype}{list(array.shape)}:{digest.hexdigest()}"
+
+
+def _key(key, memo):
+    if key is None or isinstance(key, (bool, int, float, str)):
+        return str(key)
+    return repr(_describe(key, memo))
+
+
+def _describe_function(func, memo, this=None):
+    """Declarative description of a function; `this` is the mobject it updates"""
+    func = inspect.unwrap(func)  # profiling timers
+    if isinstance(func, functools.partial):
+        return {
+            "partial": _describe(func.func, memo),
+            "args": _describe(func.args, memo),
+            "keywords": _describe(func.keywords, memo),
+        }
+    owner = getattr(func, "__self__", None)
+    function = getattr(func, "__func__", func)
+    code = getattr(function, "__code__", None)
+    if code is None:
+        return {"function": _name(function)}
+
+    description = {"function": _name(function), "code": _code_digest(code)}
+    if owner is not None and owner is not this and not inspect.ismodule(owner):
+        description["self"] = _describe(owner, memo)
+    cells = []
+    for cell in function.__closure__ or ():
+        try:
+            cells.append(_describe(cell.cell_contents, memo))
+        except ValueError:  # a cell that is not bound yet
+            cells.append(None)
+    if cells:
+        description["closure"] = cells
+    if function.__defaults__ or function.__kwdefaults__:
+        defaults = [function.__defaults__, function.__kwdefaults__]
+        description["defaults"] = _describe(defaults, memo)
+
+    # Library code is versioned with its package; its globals are left to it
+    if _is_library(getattr(function, "__module__", None)):
+        return description
+    scope = getattr(function, "__globals__", {})
+    names = {}
+    for name in _global_names(code):
+        if name in scope and scope[name] is not function:
+            names[name] = _describe(scope[name], memo)
+    if names:
+        description["globals"] = names
+    return description
+
+
+def _describe_class(cls, memo):
+    """A class by name if it is library code, otherwise by its contents"""
+    if _is_library(cls.__module__):
+        return _name(cls)
+    return {
+        "class": _name(cls),
+        "bases": [_describe(base, memo) for base in cls.__bases__],
+        "attributes": {
+            name: _describe(value, memo)
+            for name, value in vars(cls).items()
+            if name not in _CLASS_NOISE
+        },
+    }
+
+
+def _mobject_signature(mobject, memo):
+    derived = set()
+    for cls in type(mobject).__mro__:
+        derived |= _DERIVED.get(cls.__name__, set())
+    state = {
+        key: value
+        for key, value in vars(mobject).items()
+        if key not in _mobject_keys() and key not in derived
+    }
+    updaters = [
+        [index, [_describe_function(u, memo, this=member) for u in member.updaters]]
+        for index, member in enumerate(mobject.get_family())
+        if member.updaters
+    ]
+    return {
+        "type": _name(type(mobject)),
+        "family": family_fingerprint(mobject).hex(),
+        "state": _describe(state, memo),
+        "updaters": updaters,
+    }
+
+
+def _describe(value, memo, top=False):
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray) and value.dtype != object:
+        return _array_digest(value, memo)
+    if isinstance(value, bytes):
+        return hashlib.blake2b(value, digest_size=16).hexdigest()
+    if isinstance(value, Path):
+        return str(value)
+    if inspect.ismodule(value):
+        return value.__name__
+
+    # Containers and objects are described once per signature. The entry
+    # keeps the value alive so that its id is not reused meanwhile.
+    seen = memo.get(id(value))
+    if seen is not None:
+        return seen[1] if seen[1] is not None else ["cycle", _name(type(value))]
+    memo[id(value)] = (value, None)
+    description = _describe_object(value, memo, top)
+    memo[id(value)] = (value, description)
+    return description
+
+
+def _describe_object(value, memo, top):
+    if isinstance(value, np.ndarray):
+        return _array_digest(value, memo)
+    if isinstance(value, _FUNCTIONS) or hasattr(value, "__wrapped__"):
+        return _describe_function(value, memo)
+    if isinstance(value, type):
+        return _describe_class(value, memo)
+    if isinstance(value, (list, tuple)):
+        return [_describe(item, memo) for item in value]
+    if isinstance(value, (set, frozenset)):
+        return sorted((_describe(item, memo) for item in value), key=repr)
+    if isinstance(value, dict):
+        return {_key(key, memo): _describe(item, memo) for key, item in value.items()}
+    if isinstance(value, property):
+        return [_describe(f, memo) for f in (value.fget, value.fset, value.fdel)]
+    if isinstance(value, Mobject):
+        if top:
+            return _mobject_signature(value, memo)
+        if isinstance(value, ValueTracker):
+            # Any get_* attribute of a mobject resolves, so a plain
+            # ValueTracker is told apart by its type
+            moving = isinstance(value, PhysicsTracker)
+            return {
+                "tracker": _name(type(value)),
+                "value": _describe(value.get_value(), memo),
+                "velocity": _describe(value.get_velocity(), memo) if moving else None,
+            }
+        return [_name(type(value)), family_fingerprint(value).hex()]
+    if isinstance(value, BakedTrajectory):
+        # Baked trajectories are stored under a hash of everything they came from
+        return [_name(type(value)), value.path.name]
+    if isinstance(value, Scene):
+        return "scene"  # manim leaves the scene out of the hash too
+    if hasattr(value, "__dict__"):
+        return [_name(type(value)), _describe(vars(value), memo)]
+    # manim's encoder serializes what is left (see install_hashing)
+    return value
+
+
+def physics_signature(obj):
+    """
+    JSON-ready description of a physics object or a function, the same for
+    equal content in any process or session
+    """
+    return _describe(obj, {}, top=True)
+
+
+def install_hashing():
+    """
+    Makes manim's play-call hashes serialize physics objects and the
+    functions of the physics package by physics_signature
+    """
+    if _state["installed"]:
+        return
+    _state["installed"] = True
+
+    from manim.utils.hashing import _CustomEncoder
+
+    default = _state["default"] = _CustomEncoder.default
+
+    def physics_default(self, obj):
+        if _is_physics(type(obj)) or (isinstance(obj, _FUNCTIONS) and _in_package(obj)):
+            signature = physics_signature(obj)
+            # Objects without a description are handed back as they are
+            if signature is not obj:
+                return signature
+        return default(self, obj)
+
+    _CustomEncoder.default = physics_default
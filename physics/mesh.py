@@ -0,0 +1,226 @@
+from manim import *
+
+from .belt import line_bezier_points
+from .cache import atomic_directory, atomic_save, cache_dir, file_hash, params_hash
+
+MESH_FORMAT = 1
+
+
+def _as_single_mesh(mesh):
+    import trimesh
+
+    # Some GLBs contain scenes
+    if isinstance(mesh, trimesh.Scene):
+        mesh = trimesh.util.concatenate(tuple(mesh.geometry.values()))
+    return mesh
+
+
+def _save_mesh(path, prefix, mesh):
+    # faces go last: their file marks the entry as complete
+    atomic_save(path / f"{prefix}vertices.npy", np.asarray(mesh.vertices, float))
+    atomic_save(path / f"{prefix}normals.npy", np.asarray(mesh.face_normals, float))
+    atomic_save(path / f"{prefix}faces.npy", np.asarray(mesh.faces, np.int64))
+
+
+def _load_arrays(path, prefix):
+    return tuple(
+        np.load(path / f"{prefix}{name}.npy", mmap_mode="r")
+        for name in ("vertices", "faces", "normals")
+    )
+
+
+def load_mesh(path, face_count=None):
+    """
+    (vertices, faces, normals) of a mesh file as read-only memory maps.
+
+    The first load parses the file with trimesh (concatenating scenes) and
+    stores the arrays under media/physics_cache/meshes, keyed by the file's
+    content hash; decimated levels of detail are added to the same entry per
+    face_count. Later loads map the .npy files without parsing or copying.
+    """
+    entry = cache_dir("meshes") / params_hash(
+        "mesh", MESH_FORMAT, file_hash(path), {"concatenate": True}
+    )
+    if not entry.exists():
+        import trimesh
+
+        mesh = _as_single_mesh(trimesh.load(path))
+        with atomic_directory(entry) as tmp:
+            _save_mesh(tmp, "", mesh)
+
+    base = _load_arrays(entry, "")
+    if face_count is None or len(base[1]) <= face_count:
+        return base
+
+    prefix = f"lod{face_count}_"
+    if not (entry / f"{prefix}faces.npy").exists():
+        import trimesh
+
+        mesh = trimesh.Trimesh(np.asarray(base[0]), np.asarray(base[1]), process=False)
+        _save_mesh(
+            entry, prefix, mesh.simplify_quadric_decimation(face_count=face_count)
+        )
+    return _load_arrays(entry, prefix)
+
+
+class PhysicsMesh(VMobject):
+    """
+    A triangle mesh drawn as a handful of batched VMobjects.
+
+    Every face lives in one vertex/face array. For the current camera the
+    faces are back-face culled, depth sorted and shaded in NumPy, then split
+    into depth slabs x shade levels; each (slab, shade) bucket is one pooled
+    VMobject holding all its triangles as subpaths, drawn far to near. manim's
+    own 3D shading and z sorting are bypassed, so 50k+ faces stay cheap.
+    """
+
+    def __init__(
+        self,
+        vertices,
+        faces,
+        fill_color=BLUE,
+        fill_opacity=0.8,
+        stroke_color=WHITE,
+        stroke_width=0.2,
+        depth_slabs=16,
+        shade_levels=8,
+        light_direction=(-1, 1, 2),
+        cull=True,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+
+        # Memory-mapped arrays from load_mesh are used as they are
+        self.vertices = np.asarray(vertices, dtype=float)
+        self.faces = np.asarray(faces, dtype=np.int64)
+        self.depth_slabs = depth_slabs
+        self.shade_levels = shade_levels
+        self.cull = cull
+        self.light_direction = np.asarray(light_direction, float)
+        self.light_direction /= np.linalg.norm(self.light_direction)
+        self.camera = None
+        self._view_key = None
+
+        # 1. Local geometry and a tiny reference frame that follows every
+        # scale/shift/rotate applied to the mesh
+        self._center = (self.vertices.min(axis=0) + self.vertices.max(axis=0)) / 2
+        self._unit = 1e-3
+        self.frame = VMobject(stroke_width=0, stroke_opacity=0, fill_opacity=0)
+        self.frame.set_points(
+            self._center + np.vstack([ORIGIN, self._unit * np.eye(3)])
+        )
+
+        # 2. One pooled VMobject per (depth slab, shade level)
+        shades = [
+            interpolate_color(
+                BLACK,
+                ManimColor(fill_color),
+                0.35 + 0.65 * i / max(shade_levels - 1, 1),
+            )
+            for i in range(shade_levels)
+        ]
+        self.pool = [
+            VMobject(
+                fill_color=shades[i % shade_levels],
+                fill_opacity=fill_opacity,
+                stroke_color=stroke_color,
+                stroke_width=stroke_width,
+                shade_in_3d=False,
+            )
+            for i in range(depth_slabs * shade_levels)
+        ]
+        self.add(self.frame, *self.pool)
+
+        # 3. Front view until a camera is attached
+        self._render_view(np.eye(3), ORIGIN, np.inf)
+
+    @classmethod
+    def from_trimesh(cls, mesh, face_count=None, **kwargs):
+        """
+        Builds from a trimesh Mesh or Scene. With face_count the mesh is first
+        reduced by quadric decimation (needs fast_simplification installed).
+        """
+        mesh = _as_single_mesh(mesh)
+        if face_count is not None and len(mesh.faces) > face_count:
+            mesh = mesh.simplify_quadric_decimation(face_count=face_count)
+        return cls(mesh.vertices, mesh.faces, **kwargs)
+
+    @classmethod
+    def from_file(cls, path, face_count=None, cache=True, **kwargs):
+        """Loads a mesh file, through the mesh cache unless cache=False"""
+        if cache:
+            vertices, faces, _ = load_mesh(path, face_count)
+            return cls(vertices, faces, **kwargs)
+
+        import trimesh
+
+        return cls.from_trimesh(trimesh.load(path), face_count, **kwargs)
+
+    def attach(self, scene):
+        """Adds the mesh to the scene and keeps it sorted for its camera"""
+        self.camera = scene.renderer.camera
+        self.update_view(self.camera)
+        self.add_updater(lambda m: m.update_view(m.camera))
+        scene.add(self)
+        return self
+
+    def update_view(self, camera):
+        """Re-culls and re-sorts the faces if the camera or mesh moved"""
+        rotation = getattr(camera, "generate_rotation_matrix", lambda: np.eye(3))()
+        focal = getattr(camera, "get_focal_distance", lambda: np.inf)()
+        center = np.asarray(camera.frame_center, dtype=float)
+
+        key = (rotation.tobytes(), center.tobytes(), focal, self.frame.points.tobytes())
+        if key != self._view_key:
+            self._view_key = key
+            self._render_view(rotation, center, focal)
+        return self
+
+    def _render_view(self, rotation, center, focal):
+        # 1. Vertices in world space (following the frame) and camera space
+        origin, axes = self.frame.points[0], self.frame.points[1:4]
+        transform = (axes - origin) / self._unit
+        world = self.vertices @ transform + (origin - self._center @ transform)
+        view = (world - center) @ rotation.T
+
+        a, b, c = (view[self.faces[:, i]] for i in range(3))
+        normals = np.cross(b - a, c - a)
+
+        # 2. Back-face culling against the eye at (0, 0, focal)
+        if self.cull:
+            if np.isfinite(focal):
+                facing = np.einsum("ij,ij->i", normals, np.array([0, 0, focal]) - a)
+            else:
+                facing = normals[:, 2]
+            keep = np.flatnonzero(facing > 0)
+        else:
+            keep = np.arange(len(self.faces))
+
+        # 3. Depth slab and shade level of every kept face
+        depth = (a[keep, 2] + b[keep, 2] + c[keep, 2]) / 3
+        slabs = self.depth_slabs
+        if len(depth):
+            span = max(depth.max() - depth.min(), 1e-9)
+            slab = ((depth - depth.min()) / span * slabs).astype(int)
+            slab = np.clip(slab, 0, slabs - 1)
+        else:
+            slab = np.zeros(0, dtype=int)
+
+        lengths = np.linalg.norm(normals[keep], axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            light = np.abs(normals[keep] @ self.light_direction) / lengths
+        light = np.nan_to_num(light)
+        shade = np.rint(light * (self.shade_levels - 1)).astype(int)
+
+        # 4. Painter's order: buckets far to near, triangles as closed subpaths
+        bucket = slab * self.shade_levels + shade
+        order = np.argsort(bucket, kind="stable")
+        counts = np.bincount(bucket, minlength=len(self.pool))
+        bounds = 12 * np.concatenate([[0], np.cumsum(counts)])
+
+        tri = world[self.faces[keep[order]]]
+        points = line_bezier_points(
+            tri.reshape(-1, 3), np.roll(tri, -1, axis=1).reshape(-1, 3)
+        ).reshape(-1, 3)
+        for member, start, end in zip(self.pool, bounds[:-1], bounds[1:]):
+            member.points = points[start:end]
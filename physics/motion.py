@@ -0,0 +1,140 @@
+from manim import *
+from manim.utils import rate_functions
+
+# Exact (first, second) derivatives for the rate functions we drive physics with.
+# Anything else falls back to central differences of the rate function itself.
+_RATE_DERIVATIVES = {
+    rate_functions.linear: lambda t: (1.0, 0.0),
+    rate_functions.ease_in_quad: lambda t: (2 * t, 2.0),
+    rate_functions.ease_out_quad: lambda t: (2 * (1 - t), -2.0),
+    rate_functions.ease_in_out_quad: lambda t: (
+        (4 * t, 4.0) if t < 0.5 else (4 * (1 - t), -4.0)
+    ),
+    rate_functions.ease_in_cubic: lambda t: (3 * t**2, 6 * t),
+    rate_functions.ease_out_cubic: lambda t: (3 * (1 - t) ** 2, -6 * (1 - t)),
+}
+
+
+def rate_derivatives(rate_func, alpha, h=1e-4):
+    """First and second derivative of a rate function at alpha"""
+    if rate_func in _RATE_DERIVATIVES:
+        return _RATE_DERIVATIVES[rate_func](alpha)
+
+    # Keep the stencil inside [0, 1]; rate functions are not defined outside it
+    c = min(max(alpha, h), 1 - h)
+    before, here, after = rate_func(c - h), rate_func(c), rate_func(c + h)
+    return (after - before) / (2 * h), (after - 2 * here + before) / h**2
+
+
+class PhysicsTracker(ValueTracker):
+    """
+    ValueTracker that knows the motion it is being driven along.
+
+    Velocity and acceleration come from the driving animation itself (the
+    derivative of its rate function), not from differencing frames, so they
+    are identical at every frame rate. After a motion finishes its terminal
+    velocity is held until the next one starts.
+    """
+
+    def __init__(self, value=0, **kwargs):
+        super().__init__(value, **kwargs)
+        self.motion = None
+
+    def drive(self, target, run_time=1, rate_func=smooth, **kwargs):
+        """Animation moving the tracker to target along rate_func"""
+        return DriveTracker(
+            self, target, run_time=run_time, rate_func=rate_func, **kwargs
+        )
+
+    def follow(self, trajectory, name, start=0, end=None, scale=1, **kwargs):
+        """Animation replaying body `name` of a Trajectory from start to end"""
+        return FollowTrajectory(self, trajectory, name, start, end, scale, **kwargs)
+
+    def get_velocity(self):
+        return self.motion.get_velocity() if self.motion is not None else 0.0
+
+    def get_acceleration(self):
+        return self.motion.get_acceleration() if self.motion is not None else 0.0
+
+
+class DriveTracker(Animation):
+    """Moves a PhysicsTracker to a target value and exposes its derivatives"""
+
+    def __init__(self, tracker, target, **kwargs):
+        super().__init__(tracker, **kwargs)
+        self.target = target
+        self.start_value = tracker.get_value()
+        self.alpha = 0.0
+
+    def begin(self):
+        self.start_value = self.mobject.get_value()
+        self.mobject.motion = self
+        super().begin()
+
+    def create_starting_mobject(self):
+        # The start value is all we need; skip copying the tracker
+        return self.mobject
+
+    def interpolate_mobject(self, alpha):
+        self.alpha = alpha
+        self.mobject.set_value(
+            self.start_value + (self.target - self.start_value) * self.rate_func(alpha)
+        )
+
+    def get_velocity(self):
+        if self.run_time <= 0:
+            return 0.0
+        first, _ = rate_derivatives(self.rate_func, self.alpha)
+        return (self.target - self.start_value) * first / self.run_time
+
+    def get_acceleration(self):
+        if self.run_time <= 0:
+            return 0.0
+        _, second = rate_derivatives(self.rate_func, self.alpha)
+        return (self.target - self.start_value) * second / self.run_time**2
+
+
+class FollowTrajectory(Animation):
+    """
+    Replays one body of a Trajectory on a PhysicsTracker in real time.
+    The tracker keeps its current value at the start and then moves by
+    scale times the body's displacement; velocity and acceleration are read
+    from the trajectory at the exact animation time.
+    """
+
+    def __init__(self, tracker, trajectory, name, start=0, end=None, scale=1, **kwargs):
+        end = trajectory.times[-1] if end is None else end
+        super().__init__(tracker, run_time=end - start, rate_func=linear, **kwargs)
+        self.trajectory = trajectory
+        self.name = name
+        self.start = start
+        self.end = end
+        self.scale = scale
+        self.offset = 0.0
+        self.time = start
+        self.side = "right"
+
+    def begin(self):
+        start_position = self.trajectory.position(self.name, self.start)
+        self.offset = self.mobject.get_value() - self.scale * start_position
+        self.mobject.motion = self
+        super().begin()
+
+    def create_starting_mobject(self):
+        return self.mobject
+
+    def interpolate_mobject(self, alpha):
+        self.time = self.start + alpha * (self.end - self.start)
+        # At the very end report the state arriving at `end`, before any event there
+        self.side = "left" if alpha >= 1 else "right"
+        self.mobject.set_value(self.offset + self.scale * self._sample(0))
+
+    def _sample(self, quantity):
+        state = self.trajectory.sample(self.time, self.side)[quantity]
+        return state[self.trajectory.index(self.name)]
+
+    def get_velocity(self):
+        return self.scale * self._sample(1)
+
+    def get_acceleration(self):
+        return self.scale * self._sample(2)
@@ -0,0 +1,185 @@
+"""
+Segment-parallel rendering through manim's partial movie cache.
+
+manim writes every play() to its own partial movie file, named by a hash of
+the scene state at that point, and concatenates them at the end. Here a dry
+pass first counts the animations (and warms the TeX and voiceover caches),
+then every animation is rendered by its own worker process, which fast
+forwards through the earlier animations exactly like a cached render does.
+A final ordinary render finds every partial movie in the cache and only
+concatenates them, so the result is the same file a serial render writes.
+
+    PYTHONPATH=. python -m physics.parallel example/car_pulley.py \\
+        FullPhysicsDemoLightMood -j 32 -qh
+"""
+
+import argparse
+import hashlib
+import importlib.util
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Workers must not evict each other's partial movies from the cache
+_CACHE_CONFIG = "[CLI]\nmax_files_cached = -1\n"
+
+
+def load_scene_class(path, scene_name):
+    spec = importlib.util.spec_from_file_location(Path(path).stem, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return getattr(module, scene_name)
+
+
+def animation_durations(path, scene_name):
+    """Run time of every play()/wait() of the scene, from a dry run"""
+    from manim import tempconfig
+
+    with tempconfig({"dry_run": True}):
+        scene = load_scene_class(path, scene_name)()
+        durations = []
+        play = scene.renderer.play
+
+        def recording_play(scene, *args, **kwargs):
+            play(scene, *args, **kwargs)
+            durations.append(scene.duration)
+
+        scene.renderer.play = recording_play
+        scene.render()
+    return durations
+
+
+def _without_preview(args):
+    """Drops -p/--preview (also inside combined flags like -pqh)"""
+    result = []
+    for arg in args:
+        if arg in ("-p", "--preview"):
+            continue
+        if arg.startswith("-") and not arg.startswith("--") and "p" in arg[1:]:
+            arg = "-" + arg[1:].replace("p", "")
+        result.append(arg)
+    return result
+
+
+def _manim(args):
+    return [sys.executable, "-m", "manim", "render", *args]
+
+
+def _render_segment(first, last, manim_args):
+    """
+    Worker entry: renders animations first..last into the partial movie
+    cache. Earlier animations are skipped (fast-forwarded), and the segment
+    is not combined into a movie of its own.
+    """
+    from manim.__main__ import main
+    from manim.renderer.cairo_renderer import CairoRenderer
+    from manim.scene.scene_file_writer import SceneFileWriter
+    from manim.utils.exceptions import EndSceneEarlyException
+
+    update_skipping_status = CairoRenderer.update_skipping_status
+
+    def segment_skipping_status(self):
+        update_skipping_status(self)
+        if self.num_plays < first:
+            self.skip_animations = True
+        if self.num_plays > last:
+            self.skip_animations = True
+            raise EndSceneEarlyException()
+
+    CairoRenderer.update_skipping_status = segment_skipping_status
+    SceneFileWriter.combine_to_movie = lambda self: None
+
+    sys.argv = ["manim", "render", *manim_args]
+    main()
+
+
+def _movie_path(media_dir, scene_name):
+    movies = [
+        p
+        for p in Path(media_dir, "videos").rglob(f"{scene_name}.*")
+        if "partial_movie_files" not in p.parts
+    ]
+    return max(movies, key=lambda p: p.stat().st_mtime)
+
+
+def _digest(path):
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
+def render_parallel(path, scene_name, manim_args=(), jobs=None, verify=False):
+    """
+    Renders scene_name from path with one worker per animation, at most
+    jobs at a time, then concatenates them with a cached serial render.
+    With verify a cold serial render is made too and the files compared.
+    """
+    jobs = jobs or os.cpu_count()
+    with tempfile.NamedTemporaryFile("w", suffix=".cfg", delete=False) as f:
+        f.write(_CACHE_CONFIG)
+    manim_args = [*manim_args, "--config_file", f.name]
+    worker_args = [*_without_preview(manim_args), path, scene_name]
+
+    try:
+        # 1. Dry pass: animation count and warm TeX / voiceover caches
+        start = time.perf_counter()
+        durations = animation_durations(path, scene_name)
+        elapsed = time.perf_counter() - start
+        print(f"{len(durations)} animations, dry pass {elapsed:.1f}s")
+
+        # 2. Longest animations first, each in its own process
+        def render(i):
+            segment = ["-m", "physics.parallel", "_segment", str(i), str(i)]
+            command = [sys.executable, *segment, *worker_args]
+            subprocess.run(command, check=True, capture_output=True)
+
+        start = time.perf_counter()
+        order = sorted(range(len(durations)), key=lambda i: -durations[i])
+        with ThreadPoolExecutor(jobs) as pool:
+            list(pool.map(render, order))
+        elapsed = time.perf_counter() - start
+        print(f"Segments rendered in {elapsed:.1f}s with {jobs} jobs")
+
+        # 3. Serial pass: every animation is a cache hit, only concatenation runs
+        start = time.perf_counter()
+        subprocess.run(_manim([*manim_args, path, scene_name]), check=True)
+        print(f"Concatenated in {time.perf_counter() - start:.1f}s")
+
+        if verify:
+            with tempfile.TemporaryDirectory() as media_dir:
+                cold = ["--disable_caching", "--media_dir", media_dir]
+                serial = [*_without_preview(manim_args), *cold, path, scene_name]
+                subprocess.run(_manim(serial), check=True, capture_output=True)
+                same = _digest(_movie_path("media", scene_name)) == _digest(
+                    _movie_path(media_dir, scene_name)
+                )
+            print(
+                "Identical to serial render" if same else "Differs from serial render"
+            )
+            return same
+        return True
+    finally:
+        os.unlink(f.name)
+
+
+def main():
+    if sys.argv[1:2] == ["_segment"]:
+        first, last = int(sys.argv[2]), int(sys.argv[3])
+        return _render_segment(first, last, sys.argv[4:])
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("file")
+    parser.add_argument("scene")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count())
+    parser.add_argument(
+        "--verify", action="store_true", help="compare with a cold serial render"
+    )
+    args, manim_args = parser.parse_known_args()
+    ok = render_parallel(args.file, args.scene, manim_args, args.jobs, args.verify)
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+from manim import *
+
+# Unit circle as 4 cubic Beziers (16 points), the standard quarter-arc handles
+_KAPPA = 4 / 3 * (np.sqrt(2) - 1)
+_QUARTER = np.array([[1, 0, 0], [1, _KAPPA, 0], [_KAPPA, 1, 0], [0, 1, 0]], float)
+_UNIT_CIRCLE = np.concatenate(
+    [_QUARTER @ rotation_matrix(i * PI / 2, OUT).T for i in range(4)]
+)
+
+
+class PhysicsParticles(VMobject):
+    """
+    N point masses held as structure-of-arrays state: positions, velocities,
+    masses and radii are (N, 3) / (N,) arrays, and every step works on whole
+    arrays. Gravity, linear drag, springs between particle pairs and contacts
+    with an optional floor and walls are integrated with semi-implicit Euler
+    at a fixed step; frame time is accumulated, so the state after a given
+    time does not depend on how it was split into frames.
+
+    All particles are drawn as one VMobject of circle subpaths, rewritten in
+    place every frame. Particles with infinite mass stay pinned.
+    """
+
+    def __init__(
+        self,
+        positions,
+        velocities=None,
+        masses=1.0,
+        radii=0.05,
+        gravity=DOWN * 9.8,
+        drag=0.0,
+        floor=None,
+        walls=None,
+        restitution=0.5,
+        friction=0.1,
+        dt=1 / 240,
+        color=BLUE,
+        fill_opacity=1.0,
+        stroke_width=0,
+        **kwargs,
+    ):
+        super().__init__(
+            fill_color=color,
+            fill_opacity=fill_opacity,
+            stroke_color=color,
+            stroke_width=stroke_width,
+            **kwargs,
+        )
+
+        # 1. State, one row per particle
+        self.positions = np.array(positions, dtype=float).reshape(-1, 3)
+        count = len(self.positions)
+        self.velocities = np.zeros((count, 3))
+        if velocities is not None:
+            self.velocities[:] = velocities
+        self.masses = np.broadcast_to(np.asarray(masses, float), count).copy()
+        self.radii = np.broadcast_to(np.asarray(radii, float), count).copy()
+        with np.errstate(divide="ignore"):
+            self.inverse_masses = 1 / self.masses
+        self.free = (self.inverse_masses > 0)[:, None]
+
+        # 2. Environment and integrator settings
+        self.gravity = np.asarray(gravity, dtype=float)
+        self.drag = drag
+        self.floor = floor
+        self.walls = walls
+        self.restitution = restitution
+        self.friction = friction
+        self.dt = dt
+        self.time = 0.0
+        self._accumulator = 0.0
+
+        # 3. Springs as index / parameter arrays
+        self.spring_i = np.zeros(0, dtype=int)
+        self.spring_j = np.zeros(0, dtype=int)
+        self.spring_rest = np.zeros(0)
+        self.spring_stiffness = np.zeros(0)
+        self.spring_damping = np.zeros(0)
+
+        # 4. One preallocated point array: 16 points per particle
+        self.set_points(np.zeros((16 * count, 3)))
+        self._redraw()
+        self.add_updater(self._advance)
+
+    def add_springs(self, i, j, stiffness, rest_lengths=None, damping=0.0):
+        """
+        Connects particles i[k] and j[k] with damped springs. Rest lengths
+        default to the current distances.
+        """
+        i, j = np.atleast_1d(i).astype(int), np.atleast_1d(j).astype(int)
+        if rest_lengths is None:
+            rest_lengths = np.linalg.norm(self.positions[j] - self.positions[i], axis=1)
+        count = len(i)
+        self.spring_i = np.concatenate([self.spring_i, i])
+        self.spring_j = np.concatenate([self.spring_j, j])
+        self.spring_rest = np.concatenate(
+            [self.spring_rest, np.broadcast_to(rest_lengths, count)]
+        )
+        self.spring_stiffness = np.concatenate(
+            [self.spring_stiffness, np.broadcast_to(stiffness, count)]
+        )
+        self.spring_damping = np.concatenate(
+            [self.spring_damping, np.broadcast_to(damping, count)]
+        )
+        return self
+
+    def get_kinetic_energy(self):
+        free = self.free[:, 0]
+        speed_squared = np.einsum("ij,ij->i", self.velocities, self.velocities)
+        return 0.5 * np.sum(self.masses[free] * speed_squared[free])
+
+    def get_center_of_mass(self):
+        free = self.free[:, 0]
+        weights = self.masses[free]
+        return weights @ self.positions[free] / weights.sum()
+
+    def step(self, dt=None):
+        """Advances the simulation by one fixed step"""
+        dt = self.dt if dt is None else dt
+        acceleration = self._forces() * self.inverse_masses[:, None]
+        acceleration = np.where(self.free, acceleration + self.gravity, 0.0)
+        self.velocities += acceleration * dt
+        self.positions += self.velocities * dt
+        self._contacts()
+        self.time += dt
+        return self
+
+    def advance(self, duration):
+        """Runs as many fixed steps as fit in duration, carrying the rest"""
+        self._accumulator += duration
+        steps = int(self._accumulator / self.dt + 1e-9)
+        for _ in range(steps):
+            self.step()
+        self._accumulator -= steps * self.dt
+        self._redraw()
+        return self
+
+    def _advance(self, mob, dt):
+        self.advance(dt)
+
+    def _forces(self):
+        forces = -self.drag * self.velocities
+        if len(self.spring_i):
+            i, j = self.spring_i, self.spring_j
+            delta = self.positions[j] - self.positions[i]
+            length = np.linalg.norm(delta, axis=1)
+            direction = delta / np.maximum(length, 1e-12)[:, None]
+            closing = np.einsum(
+                "ij,ij->i", self.velocities[j] - self.velocities[i], direction
+            )
+            magnitude = (
+                self.spring_stiffness * (length - self.spring_rest)
+                + self.spring_damping * closing
+            )
+            pull = direction * magnitude[:, None]
+            # Scatter-add both ends at once; bincount is the fast np.add.at
+            count = len(self.positions)
+            for axis in range(3):
+                forces[:, axis] += np.bincount(i, pull[:, axis], count)
+                forces[:, axis] -= np.bincount(j, pull[:, axis], count)
+        return forces
+
+    def _contacts(self):
+        """Pushes particles out of the floor and walls and bounces them"""
+        planes = []
+        if self.floor is not None:
+            planes.append((1, self.floor, 1))
+        if self.walls is not None:
+            left, right = self.walls
+            planes += [(0, left, 1), (0, right, -1)]
+        rest_speed = 2 * np.linalg.norm(self.gravity) * self.dt
+
+        for axis, level, side in planes:
+            # side 1: particles must stay above/right of level, -1 below/left
+            depth = side * (level - self.positions[:, axis]) + self.radii
+            hit = np.flatnonzero((depth > 0) & self.free[:, 0])
+            if not len(hit):
+                continue
+            self.positions[hit, axis] += side * depth[hit]
+
+            # Normal speed change: bounce when fast, come to rest when slow
+            normal = side * self.velocities[hit, axis]
+            bounce = np.where(normal < -rest_speed, self.restitution, 0.0)
+            change = np.where(normal < 0, -(1 + bounce) * normal, 0.0)
+            self.velocities[hit, axis] += side * change
+
+            # Coulomb friction: tangential speed drops by friction * change
+            tangent = np.ix_(hit, [a for a in range(3) if a != axis])
+            sliding = self.velocities[tangent]
+            speed = np.linalg.norm(sliding, axis=1)
+            scale = 1 - self.friction * change / np.maximum(speed, 1e-12)
+            self.velocities[tangent] = sliding * np.clip(scale, 0, 1)[:, None]
+
+    def _redraw(self):
+        points = self.points.reshape(len(self.positions), 16, 3)
+        np.multiply(self.radii[:, None, None], _UNIT_CIRCLE, out=points)
+        points += self.positions[:, None, :]
@@ -1,5 +1,9 @@
+from functools import cache
+
 from manim import *
 
+from .belt import tangent_points
+
 
 class PhysicsCar(VGroup):
     def __init__(self, width=2.0, height=1.0, wheel_radius=0.25, color=BLUE, **kwargs):
@@ -8,24 +12,13 @@ class PhysicsCar(VGroup):
 
         self.delta_x = 0
         self.velocity = 0
+        # Set by attach_physics or PhysicsWorld.add_car; at rest until then
+        self.tracker = None
+        self.speed_ratio = 1
 
-        self.body = Rectangle(width=width, height=height, color=color, fill_opacity=0.5)
-
-        def create_wheel():
-            g = VGroup()
-            tire = Circle(radius=wheel_radius, color=color, stroke_width=4)
-            axle = Dot(color=color, radius=wheel_radius / 8)
-            spoke = Line(UP * wheel_radius, DOWN * wheel_radius, color=color)
-            g.add(tire, spoke, axle)
-            return g
-
-        self.wheel_left = create_wheel()
-        self.wheel_right = create_wheel()
-
-        y_pos = -height / 2
-        x_offset = width / 3
-        self.wheel_left.move_to(self.body.get_center() + LEFT * x_offset + UP * y_pos)
-        self.wheel_right.move_to(self.body.get_center() + RIGHT * x_offset + UP * y_pos)
+        # Identical cars share one template; each instance copies its points
+        parts = _clone(_car_parts(width, height, wheel_radius, _color_key(color)))
+        self.body, self.wheel_left, self.wheel_right = parts.submobjects
 
         self.add(self.body, self.wheel_left, self.wheel_right)
 
@@ -57,7 +50,25 @@ class PhysicsCar(VGroup):
     def get_rope_anchor(self):
         return self.body.get_right()
 
+    def get_distance(self):
+        """Distance travelled, straight from the driving tracker"""
+        if self.tracker is None:
+            return 0.0
+        return self.tracker.get_value() * self.speed_ratio
+
+    def get_velocity(self):
+        """Exact velocity; needs a PhysicsTracker as the driving tracker"""
+        if self.tracker is None:
+            return 0.0
+        return self.tracker.get_velocity() * self.speed_ratio
+
+    def get_acceleration(self):
+        if self.tracker is None:
+            return 0.0
+        return self.tracker.get_acceleration() * self.speed_ratio
+
     def calculate_speed(self, dt):
+        """Finite-difference speed of the last frame; prefer get_velocity"""
         if dt > 0:
             self.velocity = abs(self.delta_x / dt)
             return self.velocity
@@ -73,34 +84,12 @@ class PhysicsPulley(VGroup):
         self.center_pos = position
         self.mount_point = mount_point
 
-        self.mount_rod = Line(
-            start=mount_point, end=position, color=GREY, stroke_width=5
-        )
-
-        self.axle_pin = Dot(point=position, color=GREY_A, radius=0.08)
-
-        self.wheel = VGroup()
-
-        rim = Circle(radius=radius, color=color, stroke_width=4)
-
-        inner = Circle(
-            radius=radius * 0.8, color=color, stroke_width=1, stroke_opacity=0.5
-        )
-
-        spoke_h = Line(LEFT * radius, RIGHT * radius, color=color, stroke_width=2)
-        spoke_v = Line(UP * radius, DOWN * radius, color=color, stroke_width=2)
-
-        self.wheel.add(rim, inner, spoke_h, spoke_v)
-        self.wheel.move_to(position)
-
-        self.rope_arc = Arc(
-            radius=radius,
-            start_angle=90 * DEGREES,  # Top
-            angle=90 * DEGREES,  # To Left
-            arc_center=position,
-            color=rope_color,
-            stroke_width=4,
-        )
+        # Built around the origin once per shape, then copied and moved here
+        mount_offset = tuple(np.asarray(mount_point, float) - position)
+        colors = _color_key(color), _color_key(rope_color)
+        parts = _clone(_pulley_parts(radius, mount_offset, *colors))
+        parts.shift(position)
+        self.mount_rod, self.wheel, self.rope_arc, self.axle_pin = parts.submobjects
 
         self.add(self.mount_rod, self.wheel, self.rope_arc, self.axle_pin)
 
@@ -112,9 +101,17 @@ class PhysicsPulley(VGroup):
         Note: The pulley stays in place, but the wheel rotates.
         """
         self.tracker = tracker
+        self.speed_ratio = 1
         self.last_distance = tracker.get_value()
         self.add_updater(self._update_rotation)
 
+    def get_angular_velocity(self):
+        """Exact wheel spin rate; needs a PhysicsTracker as the driving tracker"""
+        return -self.tracker.get_velocity() * self.speed_ratio / self.radius
+
+    def get_angular_acceleration(self):
+        return -self.tracker.get_acceleration() * self.speed_ratio / self.radius
+
     def _update_rotation(self, mob):
         current_dist = self.tracker.get_value()
         delta_x = current_dist - self.last_distance
@@ -132,28 +129,7 @@ class PhysicsPulley(VGroup):
         point: The [x,y,z] coordinate of the external point
         direction: 1 for 'top/left' tangent, -1 for 'bottom/right' tangent
         """
-        vec = point - self.center_pos
-        dist = np.linalg.norm(vec)
-
-        if dist <= self.radius:
-            return point  # Point is inside circle; return point itself to avoid error
-
-        # 1. Angle of the vector connecting Center -> Point
-        base_angle = np.arctan2(vec[1], vec[0])
-
-        # 2. Angle offset for the tangent point (Standard Trig)
-        # cos(alpha) = Adjacent / Hypotenuse = radius / dist
-        alpha = np.arccos(self.radius / dist)
-
-        # 3. Calculate final angle
-        tangent_angle = base_angle + (-direction * alpha)
-
-        # 4. Convert polar back to cartesian [x,y,z]
-        tangent_point = self.center_pos + self.radius * np.array(
-            [np.cos(tangent_angle), np.sin(tangent_angle), 0]
-        )
-
-        return tangent_point
+        return tangent_points(point, self.center_pos, self.radius, direction)[0]
 
     def update_position(self, new_position, new_mount_point=None):
         """Update pulley position and optionally mount point"""
@@ -168,6 +144,89 @@ class PhysicsPulley(VGroup):
         self.rope_arc.move_arc_center_to(new_position)
 
 
+def _color_key(color):
+    return ManimColor(color).to_hex()
+
+
+def _clone(template):
+    """
+    Copy of a template family without running any __init__ or deepcopy:
+    every member gets its own points, colour arrays and lists, and
+    attributes pointing into the family are redirected to the copies.
+    """
+    copies = {}
+
+    def copy(mobject):
+        clone = object.__new__(type(mobject))
+        copies[id(mobject)] = clone
+        clone.__dict__ = {
+            key: value.copy() if isinstance(value, (np.ndarray, list, dict)) else value
+            for key, value in mobject.__dict__.items()
+        }
+        clone.submobjects = [copy(submobject) for submobject in mobject.submobjects]
+        return clone
+
+    root = copy(template)
+    for clone in copies.values():
+        for key, value in clone.__dict__.items():
+            if isinstance(value, Mobject) and id(value) in copies:
+                clone.__dict__[key] = copies[id(value)]
+    return root
+
+
+@cache
+def _car_parts(width, height, wheel_radius, color):
+    """Template body and wheels of a car centred on the origin; only ever cloned"""
+    body = Rectangle(width=width, height=height, color=color, fill_opacity=0.5)
+
+    def create_wheel():
+        g = VGroup()
+        tire = Circle(radius=wheel_radius, color=color, stroke_width=4)
+        axle = Dot(color=color, radius=wheel_radius / 8)
+        spoke = Line(UP * wheel_radius, DOWN * wheel_radius, color=color)
+        g.add(tire, spoke, axle)
+        return g
+
+    wheel_left = create_wheel()
+    wheel_right = create_wheel()
+
+    y_pos = -height / 2
+    x_offset = width / 3
+    wheel_left.move_to(body.get_center() + LEFT * x_offset + UP * y_pos)
+    wheel_right.move_to(body.get_center() + RIGHT * x_offset + UP * y_pos)
+    return VGroup(body, wheel_left, wheel_right)
+
+
+@cache
+def _pulley_parts(radius, mount_offset, color, rope_color):
+    """Template rod, wheel, rope arc and pin of a pulley at the origin"""
+    mount_rod = Line(start=mount_offset, end=ORIGIN, color=GREY, stroke_width=5)
+
+    axle_pin = Dot(point=ORIGIN, color=GREY_A, radius=0.08)
+
+    wheel = VGroup()
+
+    rim = Circle(radius=radius, color=color, stroke_width=4)
+
+    inner = Circle(radius=radius * 0.8, color=color, stroke_width=1, stroke_opacity=0.5)
+
+    spoke_h = Line(LEFT * radius, RIGHT * radius, color=color, stroke_width=2)
+    spoke_v = Line(UP * radius, DOWN * radius, color=color, stroke_width=2)
+
+    wheel.add(rim, inner, spoke_h, spoke_v)
+    wheel.move_to(ORIGIN)
+
+    rope_arc = Arc(
+        radius=radius,
+        start_angle=90 * DEGREES,  # Top
+        angle=90 * DEGREES,  # To Left
+        arc_center=ORIGIN,
+        color=rope_color,
+        stroke_width=4,
+    )
+    return VGroup(mount_rod, wheel, rope_arc, axle_pin)
+
+
 class PhysicsPlatform(VGroup):
     def __init__(
         self,
@@ -183,14 +242,9 @@ class PhysicsPlatform(VGroup):
 
         d = 1 if wall_side is LEFT else -1
 
-        p1 = [0, 0, 0]  # Bottom-Left (Outer corner)
-        p2 = [d * length, 0, 0]  # Bottom-Right
-        p3 = [d * length, thickness, 0]  # Top-Right (The "Open" end)
-        p4 = [d * thickness, thickness, 0]  # Inner Corner
-        p5 = [d * thickness, wall_height, 0]  # Top of Wall (Inner)
-        p6 = [0, wall_height, 0]  # Top of Wall (Outer)
+        vertices = _platform_vertices(length, thickness, wall_height, d)
 
-        self.outline = Polygon(p1, p2, p3, p4, p5, p6, color=color, stroke_width=4)  # type: ignore
+        self.outline = Polygon(*vertices, color=color, stroke_width=4)  # type: ignore
         if fill_opacity > 0:
             self.outline.set_fill(color, opacity=fill_opacity)
 
@@ -199,32 +253,15 @@ class PhysicsPlatform(VGroup):
         self.add_hatching(length, wall_height, color)
 
     def add_hatching(self, length, height, color):
-        """Creates diagonal lines inside the shape"""
-        # Create a large rectangle of hash lines covering the whole area
-        hatching_group = VGroup()
-        step = 0.3
-
-        max_dim = max(length, height)
-        for i in range(int(-max_dim / step), int(max_dim / step) * 2):
-            line = Line(
-                start=UP * 5 + RIGHT * (i * step),
-                end=DOWN * 5 + LEFT * 5 + RIGHT * (i * step),
-                stroke_width=2,
-                color=color,
-                stroke_opacity=0.5,
-            )
-            hatching_group.add(line)
-
-        try:
-            mask = self.outline.copy().set_fill(WHITE, 1).set_stroke(width=0)
-
-            hashed_shape = Intersection(
-                mask, hatching_group, color=color, stroke_width=2
-            )
-            self.add(hashed_shape)
-
-        except Exception:
-            pass
+        """Creates diagonal lines inside the shape as a single VMobject"""
+        # The lines are clipped to the outline itself, so length and height
+        # no longer bound the area they cover
+        corners = self.outline.get_vertices()[:, :2]
+        points = _hatching_points(tuple(map(tuple, np.round(corners, 9))), 0.3)
+
+        self.hatching = VMobject(stroke_color=color, stroke_width=2)
+        self.hatching.set_points(points.copy())
+        self.add(self.hatching)
 
     def get_floor_y(self):
         return self.outline.get_vertices()[2][1] + self.get_y()
@@ -235,3 +272,62 @@ class PhysicsPlatform(VGroup):
             + self.get_center()
             - self.outline.get_center()
         )
+
+
+def _platform_vertices(length, thickness, wall_height, d):
+    """Outline corners of an L-shaped platform, wall on the left for d=1"""
+    return np.array(
+        [
+            [0, 0, 0],  # Bottom-Left (Outer corner)
+            [d * length, 0, 0],  # Bottom-Right
+            [d * length, thickness, 0],  # Top-Right (The "Open" end)
+            [d * thickness, thickness, 0],  # Inner Corner
+            [d * thickness, wall_height, 0],  # Top of Wall (Inner)
+            [0, wall_height, 0],  # Top of Wall (Outer)
+        ],
+        dtype=float,
+    )
+
+
+@cache
+def _hatching_points(corners, step):
+    """
+    Bezier points of the hatch lines clipped to the polygon with these (x, y)
+    corners.
+    Every hatch line x - y / 2 = c is intersected with all polygon edges at once;
+    sorting the crossings along the line and pairing them (even-odd rule)
+    gives the inside spans. Memoized, so identical platforms share the result.
+    """
+    start = np.array(corners, dtype=float)
+    end = np.roll(start, -1, axis=0)
+
+    # Hatch lines have slope 2 and sit on a grid of offsets c = i * step - 2.5
+    start_c = start[:, 0] - start[:, 1] / 2
+    end_c = end[:, 0] - end[:, 1] / 2
+    first = np.ceil((start_c.min() + 2.5) / step)
+    last = np.floor((start_c.max() + 2.5) / step)
+    offsets = np.arange(first, last + 1) * step - 2.5
+
+    # Signed offsets of every edge endpoint from every hatch line, shape (lines, edges)
+    f_start = start_c[None, :] - offsets[:, None]
+    f_end = end_c[None, :] - offsets[:, None]
+    crosses = (f_start > 0) != (f_end > 0)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = f_start / (f_start - f_end)
+    y = np.where(crosses, start[:, 1] + t * (end[:, 1] - start[:, 1]), np.nan)
+    y = np.sort(y, axis=1)  # NaNs (no crossing) go last
+
+    y_in, y_out = y[:, 0::2], y[:, 1::2]
+    valid = ~np.isnan(y_in) & ~np.isnan(y_out)
+    c = np.broadcast_to(offsets[:, None], y_in.shape)[valid]
+    y_in, y_out = y_in[valid], y_out[valid]
+
+    a = np.stack([c + y_in / 2, y_in, np.zeros_like(c)], axis=1)
+    b = np.stack([c + y_out / 2, y_out, np.zeros_like(c)], axis=1)
+
+    # One straight cubic Bezier per span; discontinuities split the subpaths
+    alphas = np.array([0, 1 / 3, 2 / 3, 1])[None, :, None]
+    points = (a[:, None, :] + alphas * (b - a)[:, None, :]).reshape(-1, 3)
+    points.flags.writeable = False
+    return points
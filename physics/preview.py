@@ -0,0 +1,257 @@
+"""
+Keyframe previews of physics scenes.
+
+A preview plays the whole timeline like a dry run, stepping every frame so
+the physics state is exactly that of a full render, but rasterizes only
+keyframes: the first frame of every animation (phase boundaries and
+voiceover bookmarks, which end in waits), the first frame showing a
+collision contact or a new voiceover, every nth frame, the final frame and
+every trajectory event at its exact time. For an event the animations
+being played are put at the event time between two frames, which a
+PhysicsWorld follows exactly since it places bodies from the tracker
+values alone; the frame is put back before playing on. Collision
+detection is stepped by frame time, so contacts are shown on the first
+frame after them, with the exact contact time in the caption. The
+keyframes are written as a captioned contact sheet and a short GIF to
+media/physics_preview/<Scene>.png / .gif:
+
+    PYTHONPATH=. python -m physics.preview example/car_pulley.py \\
+        FullPhysicsDemoLightMood --every 2
+"""
+
+import argparse
+from collections import namedtuple
+from contextlib import nullcontext
+from pathlib import Path
+
+from PIL import Image, ImageDraw
+
+from manim import *
+from manim.renderer.cairo_renderer import CairoRenderer
+
+from .collision import PhysicsCollisions
+from .dryrun import DryRun, DryRunRenderer, _play_headless, _silent_narration
+from .motion import FollowTrajectory
+
+__all__ = ["Keyframe", "Preview", "PreviewRenderer", "keyframe_preview"]
+
+Keyframe = namedtuple("Keyframe", "time reasons image")
+# Events within this of a frame time count as on that frame
+_ON_FRAME = 1e-6
+
+
+class PreviewRenderer(DryRunRenderer):
+    """
+    DryRunRenderer that rasterizes keyframes; every other frame only
+    advances the clock and records the physics state.
+    """
+
+    def __init__(self, every=None, **kwargs):
+        super().__init__(**kwargs)
+        self.every = every
+        self.keyframes = []
+        self._play_start = False
+        self._play_time = 0.0
+        self._frame_t = None  # time within the play of the last rendered frame
+        self._pending = []  # (time, label) of trajectory events still ahead
+        self._contacts = {}
+        self._sounds = 0
+
+    def play(self, scene, *args, **kwargs):
+        self._play_start = True
+        self._play_time = self.time
+        self._frame_t = None
+        super().play(scene, *args, **kwargs)
+
+    def render(self, scene, time, moving_mobjects=None):
+        self._frame_t = time
+        super().render(scene, time, moving_mobjects)
+
+    def begin_events(self, scene):
+        """Queues the trajectory events of the animations being played"""
+        for animation in scene.animations:
+            if not isinstance(animation, FollowTrajectory):
+                continue
+            for time, kind, name in animation.trajectory.events:
+                if animation.start < time <= animation.end:
+                    when = self.time + time - animation.start
+                    self._pending.append((when, f"{kind} {name} @ {when:.3f}s"))
+        # Bodies following the same trajectory share its events
+        self._pending = sorted(set(self._pending))
+
+    def add_frame(self, frame, num_frames=1):
+        if self._play_start:
+            self.begin_events(self.scene)
+        reasons = self._reasons()
+        # A multiple of every among this frame's indices
+        periodic = self.every and -len(self.times) % self.every < num_frames
+        time = self.time
+        super().add_frame(frame, num_frames)
+        if reasons or periodic:
+            self.capture(time, reasons)
+        if self._frame_t is not None:
+            self._capture_events(self.time)
+
+    def _capture_events(self, until):
+        """Captures each event before the next frame at its exact time"""
+        events = []
+        while self._pending and self._pending[0][0] <= until + _ON_FRAME:
+            events.append(self._pending.pop(0))
+        if not events:
+            return
+        for when, reason in events:
+            self._pose(when - self._play_time)
+            self.capture(when, [reason])
+        self._pose(self._frame_t)
+
+    def _pose(self, t):
+        """
+        Puts the animations being played at time t of the play, as manim's
+        Scene.update_to_time does, without advancing time-based updaters
+        """
+        scene = self.scene
+        for animation in scene.animations:
+            animation.interpolate(t / animation.run_time)
+        for mobject in scene.mobjects:
+            # Collision detection sweeps from the previous call
+            if not isinstance(mobject, PhysicsCollisions):
+                mobject.update(0)
+
+    def _reasons(self):
+        reasons = []
+        if self._play_start:
+            reasons.append(f"play {self.num_plays}")
+            self._play_start = False
+
+        # Events up to this frame's time that could not be put at their own
+        # (frozen frames); the frame shows their outcome
+        while self._pending and self._pending[0][0] <= self.time + _ON_FRAME:
+            reasons.append(self._pending.pop(0)[1])
+
+        for mobject in self.scene.mobjects:
+            if isinstance(mobject, PhysicsCollisions):
+                seen = self._contacts.get(id(mobject), 0)
+                for contact in mobject.events[seen:]:
+                    if contact.kind == "begin":
+                        reasons.append(f"contact @ {contact.time:.3f}s")
+                self._contacts[id(mobject)] = len(mobject.events)
+
+        if len(self.file_writer.sounds) > self._sounds:
+            self._sounds = len(self.file_writer.sounds)
+            reasons.append("voiceover")
+        return reasons
+
+    def capture(self, time, reasons):
+        CairoRenderer.update_frame(self, self.scene, ignore_skipping=True)
+        self.keyframes.append(Keyframe(time, reasons, self.camera.get_image().copy()))
+
+    def scene_finished(self, scene):
+        super().scene_finished(scene)
+        # Events at the very end of the last animation
+        reasons = [reason for _, reason in self._pending]
+        self._pending = []
+        self.capture(self.time, reasons + ["end"])
+
+
+class Preview(DryRun):
+    """DryRun with the keyframes (time, reasons, PIL image) of the timeline"""
+
+    def __init__(self, scene, renderer):
+        super().__init__(scene, renderer)
+        self.keyframes = renderer.keyframes
+
+    def contact_sheet(self, columns=4, caption_height=18):
+        """All keyframes in one captioned grid image"""
+        width, height = self.keyframes[0].image.size
+        rows = -(-len(self.keyframes) // columns)
+        cell = height + caption_height
+        sheet = Image.new("RGB", (columns * width, rows * cell), "black")
+        draw = ImageDraw.Draw(sheet)
+        for i, (time, reasons, image) in enumerate(self.keyframes):
+            x, y = (i % columns) * width, (i // columns) * cell
+            sheet.paste(image.convert("RGB"), (x, y))
+            caption = f"{time:7.3f}s  {', '.join(reasons)}"
+            draw.text((x + 4, y + height + 3), caption, fill="white")
+        return sheet
+
+    def save(self, directory=None, columns=4, frame_time=0.5):
+        """Writes <Scene>.png (contact sheet) and <Scene>.gif; returns both paths"""
+        directory = Path(directory or Path(config.media_dir) / "physics_preview")
+        directory.mkdir(parents=True, exist_ok=True)
+        name = type(self.scene).__name__
+        sheet, gif = directory / f"{name}.png", directory / f"{name}.gif"
+        self.contact_sheet(columns).save(sheet)
+        images = [keyframe.image.convert("RGB") for keyframe in self.keyframes]
+        images[0].save(
+            gif,
+            save_all=True,
+            append_images=images[1:],
+            duration=int(frame_time * 1000),
+            loop=0,
+        )
+        return sheet, gif
+
+
+def keyframe_preview(
+    scene_class, every=2.0, fps=None, width=480, voice=False, tex=True
+):
+    """
+    Plays scene_class at fps (the configured frame rate by default),
+    rasterizing only keyframes at width x 9/16 width pixels, one at least
+    every `every` seconds. Voiceover scenes use silent narration with fixed
+    word timing unless voice is True. Returns a Preview.
+    """
+    settings = {
+        "dry_run": True,
+        "disable_caching": True,
+        "write_to_movie": False,
+        "save_last_frame": False,
+        "progress_bar": "none",
+        "verbosity": "WARNING",
+        "pixel_width": width,
+        "pixel_height": round(width * 9 / 16),
+    }
+    if fps is not None:
+        settings["frame_rate"] = fps
+    frames = None
+    if every:
+        frames = max(1, round(every * (fps or config.frame_rate)))
+
+    with nullcontext() if voice else _silent_narration() as speech_service:
+        scene, renderer = _play_headless(
+            scene_class, PreviewRenderer, settings, speech_service, tex, every=frames
+        )
+    return Preview(scene, renderer)
+
+
+def main():
+    from .parallel import load_scene_class
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("file")
+    parser.add_argument("scene")
+    parser.add_argument("--every", type=float, default=2.0, help="seconds, 0 for none")
+    parser.add_argument("--fps", type=float)
+    parser.add_argument("--width", type=int, default=480)
+    parser.add_argument("--columns", type=int, default=4)
+    parser.add_argument("--voice", action="store_true", help="use the scene's voice")
+    parser.add_argument("--placeholder-tex", action="store_true")
+    args = parser.parse_args()
+
+    result = keyframe_preview(
+        load_scene_class(args.file, args.scene),
+        every=args.every,
+        fps=args.fps,
+        width=args.width,
+        voice=args.voice,
+        tex=not args.placeholder_tex,
+    )
+    sheet, gif = result.save(columns=args.columns)
+    print(f"{len(result.keyframes)} keyframes of {len(result.times)} frames")
+    for time, reasons, _ in result.keyframes:
+        print(f"  {time:8.3f}s  {', '.join(reasons)}")
+    print(f"Wrote {sheet} and {gif}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,263 @@
+"""
+Opt-in profiling of updaters and frames.
+
+With PHYSICS_PROFILE set (or after install_profiling()), every updater added
+to a mobject or a scene is wrapped in a timer, and each frame's update and
+render phases are timed. At the end of Scene.render a table is logged and
+written to media/physics_profile/<Scene>.txt, next to <Scene>.trace.json for
+chrome://tracing or Perfetto. PHYSICS_PROFILE=alloc also records the peak
+memory allocated by every updater call (through tracemalloc, which is slow).
+
+    PHYSICS_PROFILE=1 manim render -ql example/car_pulley.py FullPhysicsDemoLightMood
+"""
+
+import functools
+import json
+import os
+import tracemalloc
+import types
+import weakref
+from collections import defaultdict
+from pathlib import Path
+from time import perf_counter_ns
+
+import numpy as np
+
+from manim import *
+from manim.renderer.cairo_renderer import CairoRenderer
+
+__all__ = ["PROFILE_ENV", "install_profiling", "profile_report"]
+
+PROFILE_ENV = "PHYSICS_PROFILE"
+# Trace events kept per render; the statistics are always complete
+MAX_TRACE_EVENTS = 1_000_000
+
+_state = {"installed": False, "alloc": False}
+
+
+class _Records:
+    """Timings of one Scene.render"""
+
+    def __init__(self):
+        self.start = perf_counter_ns()
+        self.calls = defaultdict(list)  # (updater, mobject) -> [ns]
+        self.allocs = defaultdict(int)  # (updater, mobject) -> bytes
+        self.phases = defaultdict(list)  # "update" / "render" -> [ns]
+        self.events = []
+        self.labels = weakref.WeakKeyDictionary()
+        self.counts = defaultdict(int)
+
+    def label(self, mobject):
+        """Type#n, numbered per type in order of first update"""
+        if mobject is None:
+            return "scene"
+        try:
+            return self.labels[mobject]
+        except KeyError:
+            name = type(mobject).__name__
+            self.counts[name] += 1
+            label = self.labels[mobject] = f"{name}#{self.counts[name]}"
+            return label
+
+    def event(self, name, category, start, end, **args):
+        if len(self.events) < MAX_TRACE_EVENTS:
+            self.events.append(
+                {
+                    "name": name,
+                    "cat": category,
+                    "ph": "X",
+                    "ts": (start - self.start) / 1e3,
+                    "dur": (end - start) / 1e3,
+                    "pid": 0,
+                    "tid": 0,
+                    "args": args,
+                }
+            )
+
+
+_records = _Records()
+
+
+def _updater_name(func):
+    """qualname (file:line); always_redraw's lambda is named after its func"""
+    func = getattr(func, "__func__", func)
+    name = getattr(func, "__qualname__", type(func).__name__)
+    if getattr(func, "__name__", "") == "<lambda>" and func.__closure__:
+        inner = [
+            cell.cell_contents
+            for cell in func.__closure__
+            if isinstance(cell.cell_contents, types.FunctionType)
+        ]
+        if inner:
+            outer = name.split(".<locals>")[0]
+            name = f"{outer}({inner[0].__qualname__})"
+            func = inner[0]
+    code = getattr(func, "__code__", None)
+    if code is None:
+        return name
+    return f"{name} ({Path(code.co_filename).name}:{code.co_firstlineno})"
+
+
+class _Timed:
+    """
+    Updater wrapper. It compares equal to the function it wraps, so
+    remove_updater keeps working, and inspect.signature sees the wrapped
+    signature, so dt is still passed to time based updaters.
+    """
+
+    def __init__(self, func):
+        functools.update_wrapper(self, func)
+        self.name = _updater_name(func)
+
+    def __call__(self, *args):
+        func, records = self.__wrapped__, _records
+        # Scene updaters only get dt; mobject updaters get the mobject first
+        mobject = args[0] if args and isinstance(args[0], Mobject) else None
+
+        if _state["alloc"]:
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+        start = perf_counter_ns()
+        result = func(*args)
+        end = perf_counter_ns()
+
+        key = (self.name, records.label(mobject))
+        records.calls[key].append(end - start)
+        if _state["alloc"]:
+            records.allocs[key] += tracemalloc.get_traced_memory()[1] - before
+        records.event(self.name, "updater", start, end, mobject=key[1])
+        return result
+
+    def __eq__(self, other):
+        if isinstance(other, _Timed):
+            other = other.__wrapped__
+        return self.__wrapped__ == other
+
+    def __hash__(self):
+        return hash(self.__wrapped__)
+
+
+def _timed(func):
+    return func if isinstance(func, _Timed) else _Timed(func)
+
+
+def _phase(name, method):
+    @functools.wraps(method)
+    def timed(self, *args, **kwargs):
+        start = perf_counter_ns()
+        result = method(self, *args, **kwargs)
+        end = perf_counter_ns()
+        _records.phases[name].append(end - start)
+        _records.event(name, "frame", start, end)
+        return result
+
+    return timed
+
+
+def _row(name, durations, frame_total, alloc=None, width=24):
+    durations = np.asarray(durations, dtype=float) / 1e3  # µs
+    total = durations.sum() / 1e3
+    share = 100 * total / frame_total if frame_total else 0.0
+    row = (
+        f"{name:<{width}} {len(durations):>7} {total:>10.1f} {durations.mean():>9.1f} "
+        f"{np.percentile(durations, 95):>9.1f} {share:>6.1f}%"
+    )
+    return row if alloc is None else f"{row} {alloc / 1024:>10.1f}"
+
+
+def profile_report(records=None):
+    """The profile table of the current (or given) render as text"""
+    records = records or _records
+    frame_total = sum(sum(d) for d in records.phases.values()) / 1e6  # ms
+    alloc = _state["alloc"]
+    names = [f"{name} [{mobject}]" for name, mobject in records.calls]
+    width = max(map(len, names), default=24)
+    row = functools.partial(_row, frame_total=frame_total, width=width)
+    header = (
+        f"{'':<{width}} {'calls':>7} {'total ms':>10} {'mean µs':>9} "
+        f"{'p95 µs':>9} {'frame':>7}"
+    ) + (f" {'alloc KB':>10}" if alloc else "")
+
+    lines = ["Frames", header]
+    for phase, durations in records.phases.items():
+        lines.append(row(phase, durations))
+
+    def by_total(items):
+        return sorted(items, key=lambda item: -sum(item[1]))
+
+    lines += ["", "Updaters", header]
+    for (name, mobject), durations in by_total(records.calls.items()):
+        used = records.allocs[name, mobject] if alloc else None
+        lines.append(row(f"{name} [{mobject}]", durations, alloc=used))
+
+    per_mobject = defaultdict(list)
+    allocs = defaultdict(int)
+    for (name, mobject), durations in records.calls.items():
+        per_mobject[mobject] += durations
+        allocs[mobject] += records.allocs.get((name, mobject), 0)
+    lines += ["", "Mobjects", header]
+    for mobject, durations in by_total(per_mobject.items()):
+        lines.append(row(mobject, durations, alloc=allocs[mobject] if alloc else None))
+    return "\n".join(lines)
+
+
+def _write_report(scene):
+    global _records
+    records, _records = _records, _Records()
+
+    directory = Path(config.media_dir) / "physics_profile"
+    directory.mkdir(parents=True, exist_ok=True)
+    name = type(scene).__name__
+    report = profile_report(records)
+    (directory / f"{name}.txt").write_text(report + "\n")
+    trace = {"traceEvents": records.events, "displayTimeUnit": "ms"}
+    (directory / f"{name}.trace.json").write_text(json.dumps(trace))
+    logger.info(f"Profile of {name} written to {directory}\n{report}")
+
+
+def install_profiling(alloc=False):
+    """
+    Wraps every updater added from now on, times the update and render of
+    each frame, and writes the report when a scene finishes rendering.
+    """
+    _state["alloc"] = _state["alloc"] or alloc
+    if _state["alloc"] and not tracemalloc.is_tracing():
+        tracemalloc.start()
+    if _state["installed"]:
+        return
+    _state["installed"] = True
+
+    mobject_add_updater = Mobject.add_updater
+    scene_add_updater = Scene.add_updater
+    scene_render = Scene.render
+
+    @functools.wraps(mobject_add_updater)
+    def add_updater(self, update_function, *args, **kwargs):
+        return mobject_add_updater(self, _timed(update_function), *args, **kwargs)
+
+    @functools.wraps(scene_add_updater)
+    def add_scene_updater(self, func):
+        return scene_add_updater(self, _timed(func))
+
+    def remove_scene_updater(self, func):
+        # Scene.remove_updater compares by identity, which the wrapper breaks
+        self.updaters = [f for f in self.updaters if f != func]
+
+    @functools.wraps(scene_render)
+    def render(self, *args, **kwargs):
+        global _records
+        _records = _Records()
+        result = scene_render(self, *args, **kwargs)
+        _write_report(self)
+        return result
+
+    Mobject.add_updater = add_updater
+    Scene.add_updater = add_scene_updater
+    Scene.remove_updater = remove_scene_updater
+    Scene.render = render
+    Scene.update_to_time = _phase("update", Scene.update_to_time)
+    CairoRenderer.render = _phase("render", CairoRenderer.render)
+
+
+if os.environ.get(PROFILE_ENV):
+    install_profiling(alloc=os.environ[PROFILE_ENV] == "alloc")
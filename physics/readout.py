@@ -0,0 +1,117 @@
+from manim import *
+
+_GLYPH_CHARS = "0123456789.-"
+
+# font_size -> {char: (points relative to the cell centre/baseline, cell width)}
+_GLYPH_CACHE = {}
+
+
+def _glyphs(font_size):
+    """Typesets every numeric glyph once per font size and keeps its points"""
+    if font_size in _GLYPH_CACHE:
+        return _GLYPH_CACHE[font_size]
+
+    tex = MathTex(*_GLYPH_CHARS, font_size=font_size)
+    parts = [
+        np.vstack([m.points for m in part.family_members_with_points()]) for part in tex
+    ]
+
+    # Digits are tabular in TeX: a fixed advance with the ink centred in each cell
+    digit_centers = np.array([part.get_center()[0] for part in tex[:10]])
+    advance = (digit_centers[-1] - digit_centers[0]) / 9
+    bearing = (advance - np.mean([part.width for part in tex[:10]])) / 2
+    baseline = tex[0].get_bottom()[1]
+
+    glyphs = {}
+    for char, part, points in zip(_GLYPH_CHARS, tex, parts):
+        center = np.array([part.get_center()[0], baseline, 0])
+        cell = advance if char.isdigit() else part.width + 2 * bearing
+        glyphs[char] = (points - center, cell)
+
+    _GLYPH_CACHE[font_size] = glyphs
+    return glyphs
+
+
+class PhysicsReadout(VGroup):
+    """
+    Live numeric label such as v_{car} = 1.23.
+    The prefix is typeset once and the number is assembled from cached glyphs,
+    so a frame costs a few point-array copies instead of a TeX round trip.
+    """
+
+    def __init__(
+        self,
+        prefix,
+        value,
+        num_decimal_places=2,
+        color=WHITE,
+        font_size=DEFAULT_FONT_SIZE,
+        target=None,
+        direction=DOWN,
+        buff=0.5,
+        max_chars=8,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.value = value if callable(value) else value.get_value
+        self.num_decimal_places = num_decimal_places
+        self.font_size = font_size
+        self.target = target
+        self.direction = direction
+        self.buff = buff
+        self.color = color
+
+        prefix = [prefix] if isinstance(prefix, str) else list(prefix)
+        # Typeset with a placeholder digit to learn where the number starts
+        reference = MathTex(*prefix, "0", color=color, font_size=font_size)
+        self.prefix = VGroup(*reference[:-1])
+
+        glyphs = _glyphs(font_size)
+        zero_points, zero_cell = glyphs["0"]
+        zero_left = reference[-1].get_center()[0] - zero_cell / 2
+        zero_bottom = reference[-1].get_bottom()[1] - zero_points[:, 1].min()
+        origin = np.array([zero_left, zero_bottom, 0])
+        self._origin_offset = origin - self.prefix.get_corner(DL)
+        self._prefix_width = self.prefix.width
+
+        self.digits = VGroup(*(self._new_slot() for _ in range(max_chars)))
+        self.add(self.prefix, self.digits)
+
+        self._text = None
+        self._update_readout(self)
+        self.add_updater(self._update_readout)
+
+    def _new_slot(self):
+        return VMobject(fill_color=self.color, fill_opacity=1, stroke_width=0)
+
+    def _update_readout(self, mob):
+        """Internal function called every frame"""
+        text = f"{self.value():.{self.num_decimal_places}f}"
+        if text == "-0." + "0" * self.num_decimal_places:
+            text = text[1:]
+
+        if text != self._text:
+            self._set_text(text)
+            self._text = text
+
+        if self.target is not None:
+            self.next_to(self.target, self.direction, buff=self.buff)
+
+    def _set_text(self, text):
+        while len(self.digits) < len(text):
+            self.digits.add(self._new_slot())
+
+        glyphs = _glyphs(self.font_size)
+        scale = self.prefix.width / self._prefix_width
+        x = self.prefix.get_corner(DL) + self._origin_offset * scale
+
+        for slot, char in zip(self.digits, text.ljust(len(self.digits))):
+            if char == " ":
+                slot.set_points(np.zeros((0, 3)))
+                continue
+            points, cell = glyphs[char]
+            slot.set_points(points * scale + x + RIGHT * (cell * scale / 2))
+            x = x + RIGHT * (cell * scale)
+
+    def get_text(self):
+        return self._text
@@ -0,0 +1,71 @@
+from manim import *
+
+from .belt import BeltPath
+from .pobject import PhysicsPulley
+
+
+class PhysicsRope(VMobject):
+    """
+    A rope routed through anchors and pulleys that rewrites its own points.
+
+    Waypoints can be fixed points, callables returning a point (such as
+    car.get_rope_anchor) or (pulley, direction) pairs: direction 1 wraps the
+    rope counter-clockwise around the pulley, -1 clockwise. A pulley at either
+    end only supplies the tangent point, pulleys in between get a wrap arc.
+    The whole route is solved in one batch per frame (see belt.py), in place
+    in the BeltPath built at construction, and written into the point array
+    allocated with it. Fixed points in between get no arc.
+    """
+
+    def __init__(
+        self, *waypoints, color=WHITE, stroke_width=3, arc_segments=8, **kwargs
+    ):
+        super().__init__(color=color, stroke_width=stroke_width, **kwargs)
+        if len(waypoints) < 2:
+            raise ValueError("A rope needs at least two waypoints")
+
+        self.waypoints = [self._parse_waypoint(w) for w in waypoints]
+        self.arc_segments = arc_segments
+
+        # Pulleys keep their radius, so the route only has to be built once
+        self._centers = np.zeros((len(self.waypoints), 3))
+        self._rho = np.zeros(len(self.waypoints))
+        self.path = BeltPath(*self._circles())
+        self.set_points(np.zeros((self.path.num_points(arc_segments), 3)))
+
+        self.length = 0.0
+        self._update_rope(self)
+        self.add_updater(self._update_rope)
+
+    @staticmethod
+    def _parse_waypoint(waypoint):
+        """Normalises a waypoint to (pulley or None, direction, point source)"""
+        if isinstance(waypoint, PhysicsPulley):
+            return waypoint, 1, None
+        if isinstance(waypoint, tuple) and isinstance(waypoint[0], PhysicsPulley):
+            pulley, direction = waypoint
+            return pulley, direction, None
+        if callable(waypoint):
+            return None, 0, waypoint
+        point = np.array(waypoint, dtype=float)
+        return None, 0, lambda: point
+
+    def _circles(self):
+        """Centres and signed radii (direction * radius, 0 for points)"""
+        centers, rho = self._centers, self._rho
+        for i, (pulley, direction, source) in enumerate(self.waypoints):
+            if pulley is None:
+                centers[i] = source()
+            else:
+                centers[i] = pulley.center_pos
+                rho[i] = direction * pulley.radius
+        return centers, rho
+
+    def _update_rope(self, mob):
+        """Internal function called every frame"""
+        self.path.update(*self._circles())
+        self.path.bezier_points(self.arc_segments, out=self.points)
+        self.length = self.path.length
+
+    def get_length(self):
+        return self.length
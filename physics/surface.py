@@ -15,6 +15,7 @@ class PhysicsSurface(VGroup):
         super().__init__(**kwargs)
 
         main_line = Line(start, end, color=color, stroke_width=stroke_width)
+        self.main_line = main_line
         self.add(main_line)
 
         line_vec = main_line.get_vector()
@@ -26,14 +27,14 @@ class PhysicsSurface(VGroup):
 
         num_hashes = int(line_length / hash_spacing)
 
-        for i in range(num_hashes + 1):
-            alpha = i / num_hashes if num_hashes > 0 else 0.5
-            point_on_line = main_line.point_from_proportion(alpha)
-
-            tick = Line(
-                point_on_line,
-                point_on_line + hash_vec,
-                color=color,
-                stroke_width=stroke_width * 0.5,
-            )
-            self.add(tick)
+        # All tick anchors in one pass, then one straight cubic Bezier per tick
+        if num_hashes > 0:
+            alphas = np.linspace(0, 1, num_hashes + 1)
+        else:
+            alphas = np.array([0.5])
+        tick_starts = main_line.get_start() + alphas[:, None] * line_vec
+        handles = np.array([0, 1 / 3, 2 / 3, 1])[None, :, None] * hash_vec
+
+        self.ticks = VMobject(stroke_color=color, stroke_width=stroke_width * 0.5)
+        self.ticks.set_points((tick_starts[:, None, :] + handles).reshape(-1, 3))
+        self.add(self.ticks)
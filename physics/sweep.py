@@ -0,0 +1,228 @@
+"""
+Parameter sweeps: one scene rendered for every point of a parameter grid.
+
+Each variant is a subclass of the scene with some class attributes
+overridden (the example scene keeps its masses, friction, colours and voice
+there), named after a hash of its parameters. Identical variants are
+rendered once. Before any rendering, every distinct variant is played once
+in the driver process with all animations skipped, which compiles its TeX,
+synthesizes its voiceovers and bakes its trajectories into the shared
+on-disk caches, so each of those sub-results is produced exactly once and
+never raced for. The variants are then rendered by a process pool; on
+platforms that fork, the workers also inherit the driver's in-memory
+prototype, hatching and glyph caches.
+
+    PYTHONPATH=. python -m physics.sweep example/car_pulley.py \\
+        FullPhysicsDemoLightMood -g HANGING_MASS=0.5,1,2 -g DECEL_RATE=0.25,0.5 -j 8
+"""
+
+import argparse
+import ast
+import itertools
+import json
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import cache
+from pathlib import Path
+
+from .cache import params_hash
+from .parallel import load_scene_class
+
+QUALITIES = {
+    "l": "low_quality",
+    "m": "medium_quality",
+    "h": "high_quality",
+    "p": "production_quality",
+    "k": "fourk_quality",
+}
+
+
+def expand_grid(grid):
+    """Every combination of a {name: [values]} grid, as a list of dicts"""
+    names = list(grid)
+    return [dict(zip(names, values)) for values in itertools.product(*grid.values())]
+
+
+def _canonical(value):
+    # 1 and 1.0 are the same variant; colours and other objects go by repr
+    if value is None or isinstance(value, (bool, str)):
+        return value
+    if isinstance(value, (int, float)):
+        return float(value)
+    return repr(value)
+
+
+def variant_name(scene_name, params):
+    if not params:
+        return scene_name
+    key = {name: _canonical(value) for name, value in params.items()}
+    return f"{scene_name}_{params_hash(key)[:8]}"
+
+
+@cache
+def _scene_class(path, scene_name):
+    # Cached, so forked workers reuse the driver's module
+    return load_scene_class(path, scene_name)
+
+
+def variant_class(scene_class, params):
+    """Subclass of scene_class with params as class attributes"""
+    missing = [name for name in params if not hasattr(scene_class, name)]
+    if missing:
+        raise AttributeError(f"{scene_class.__name__} has no parameter {missing}")
+    name = variant_name(scene_class.__name__, params)
+    return type(name, (scene_class,), {**params, "__module__": scene_class.__module__})
+
+
+def _play(path, scene_name, params, settings):
+    from manim import tempconfig
+
+    scene_class = variant_class(_scene_class(path, scene_name), params)
+    start = time.perf_counter()
+    with tempconfig(settings):
+        scene = scene_class()
+        scene.render()
+    return time.perf_counter() - start, scene
+
+
+def _warm(path, scene_name, params, settings):
+    """Plays the variant with every animation skipped; fills the disk caches"""
+    skipped = {
+        **settings,
+        "save_last_frame": True,
+        "write_to_movie": False,
+        "dry_run": True,
+        "progress_bar": "none",
+    }
+    elapsed, _ = _play(path, scene_name, params, skipped)
+    return elapsed
+
+
+def _render(path, scene_name, params, settings):
+    """Worker entry: renders one variant, returns (seconds, movie path)"""
+    elapsed, scene = _play(path, scene_name, params, settings)
+    movie = scene.renderer.file_writer.movie_file_path
+    return elapsed, str(movie) if movie else None
+
+
+def _pool(jobs):
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context("fork" if "fork" in methods else None)
+    return ProcessPoolExecutor(jobs, mp_context=context)
+
+
+def sweep(path, scene_name, grid, jobs=None, settings=None, warm=True):
+    """
+    Renders scene_name from path once per distinct point of grid, a
+    {class attribute: [values]} dict or a list of parameter dicts, with at
+    most jobs processes. settings are manim config overrides for every
+    render. Returns one record per requested variant.
+    """
+    settings = dict(settings or {})
+    requested = expand_grid(grid) if isinstance(grid, dict) else list(grid)
+
+    # 1. Identical parameter sets are one variant
+    variants = {}
+    for params in requested:
+        variants.setdefault(variant_name(scene_name, params), params)
+    records = {
+        name: {"variant": name, "params": params, "copies": 0}
+        for name, params in variants.items()
+    }
+    for params in requested:
+        records[variant_name(scene_name, params)]["copies"] += 1
+
+    # 2. Shared sub-results (TeX, voiceovers, trajectories) once, serially
+    start = time.perf_counter()
+    if warm:
+        for name, params in variants.items():
+            records[name]["warm"] = _warm(path, scene_name, params, settings)
+    warm_time = time.perf_counter() - start
+
+    # 3. Render in parallel, longest warm pass first
+    start = time.perf_counter()
+    order = sorted(variants, key=lambda name: -records[name].get("warm", 0))
+    with _pool(jobs or os.cpu_count()) as pool:
+        futures = {
+            pool.submit(_render, path, scene_name, variants[name], settings): name
+            for name in order
+        }
+        for future in as_completed(futures):
+            record = records[futures[future]]
+            record["render"], record["movie"] = future.result()
+    render_time = time.perf_counter() - start
+
+    print(report(records.values(), warm_time, render_time))
+    return [records[variant_name(scene_name, params)] for params in requested]
+
+
+def report(records, warm_time, render_time):
+    """Per-variant timing table"""
+    records = list(records)
+    width = max((len(r["variant"]) for r in records), default=8)
+    header = f"{'variant':<{width}} {'copies':>6} {'warm s':>8} {'render s':>9}"
+    lines = [f"{header}  params"]
+    for r in sorted(records, key=lambda r: r["variant"]):
+        params = ", ".join(f"{k}={v!r}" for k, v in r["params"].items())
+        lines.append(
+            f"{r['variant']:<{width}} {r['copies']:>6} {r.get('warm', 0):>8.2f} "
+            f"{r.get('render', 0):>9.2f}  {params}"
+        )
+    renders = sum(r.get("render", 0) for r in records)
+    lines.append(
+        f"{len(records)} variants: warm {warm_time:.1f}s, render {render_time:.1f}s "
+        f"wall ({renders:.1f}s of work, {renders / max(render_time, 1e-9):.1f}x)"
+    )
+    return "\n".join(lines)
+
+
+def _parse_value(text):
+    try:
+        return ast.literal_eval(text)
+    except (ValueError, SyntaxError):
+        return text  # colour names, voices, ...
+
+
+def _parse_grid(items):
+    grid = {}
+    for item in items:
+        name, _, values = item.partition("=")
+        grid[name] = [_parse_value(v) for v in values.split(",")]
+    return grid
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("file")
+    parser.add_argument("scene")
+    parser.add_argument(
+        "-g",
+        "--grid",
+        action="append",
+        default=[],
+        metavar="NAME=V1,V2",
+        help="values of one class attribute; repeat for more",
+    )
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count())
+    parser.add_argument("-q", "--quality", choices=QUALITIES, default="l")
+    parser.add_argument("--no-warm", action="store_true")
+    parser.add_argument("--save", help="write the per-variant records to this JSON")
+    args = parser.parse_args()
+
+    settings = {"quality": QUALITIES[args.quality], "progress_bar": "none"}
+    records = sweep(
+        args.file,
+        args.scene,
+        _parse_grid(args.grid),
+        args.jobs,
+        settings,
+        warm=not args.no_warm,
+    )
+    if args.save:
+        Path(args.save).write_text(json.dumps(records, indent=1, default=str))
+
+
+if __name__ == "__main__":
+    main()
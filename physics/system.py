@@ -0,0 +1,329 @@
+"""
+Rope-constrained pulley systems solved as a precomputed linear map.
+
+Every body moves along one fixed axis, so the whole state is a vector of
+positions q. Ropes are inextensible: for each rope the sum over its spans of
+(span direction) . (end velocity - start velocity) must vanish while it is
+taut, which gives a constant constraint matrix A with A q' = 0. Velocity
+ratios follow from the null space of A, and the constrained accelerations
+from a projection matrix that only depends on which ropes are taut and which
+bodies are stopped, so it is computed once per phase and cached.
+"""
+
+from itertools import pairwise
+
+import numpy as np
+
+from .belt import span_tangents
+from .trajectory import Trajectory
+
+_DOWN = np.array([0.0, -1.0, 0.0])
+_EPS = 1e-9
+
+
+def _first_root(c0, c1, c2, limit):
+    """
+    Smallest root in (0, limit] of c0 + c1 * t + c2 * t^2 / 2 = 0 per element,
+    inf where there is none.
+    """
+    c0, c1, c2 = np.broadcast_arrays(*map(np.asarray, (c0, c1, c2)))
+    roots = np.full(c0.shape, np.inf)
+
+    linear = np.abs(c2) < _EPS
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t_lin = -c0 / c1
+        disc = c1**2 - 2 * c2 * c0
+        sq = np.sqrt(np.where(disc >= 0, disc, np.nan))
+        t1 = (-c1 - sq) / c2
+        t2 = (-c1 + sq) / c2
+
+    for candidate in (np.where(linear, t_lin, t1), np.where(linear, np.nan, t2)):
+        ok = (candidate > _EPS) & (candidate <= limit) & (candidate < roots)
+        roots = np.where(ok, candidate, roots)
+    return roots
+
+
+class Body:
+    """A point mass moving along a fixed axis"""
+
+    def __init__(
+        self,
+        name,
+        mass=1.0,
+        axis=(1, 0, 0),
+        friction=0.0,
+        limits=(None, None),
+        position=0.0,
+        velocity=0.0,
+    ):
+        self.name = name
+        self.mass = float(mass)
+        self.axis = np.asarray(axis, dtype=float) / np.linalg.norm(axis)
+        self.friction = float(friction)
+        low, high = limits
+        self.limits = (
+            -np.inf if low is None else float(low),
+            np.inf if high is None else float(high),
+        )
+        self.position = float(position)
+        self.velocity = float(velocity)
+
+
+class PulleySystem:
+    """
+    Bodies connected by ropes over fixed and moving pulleys.
+
+    Ropes are given as a chain of nodes in the initial configuration: a plain
+    point is a fixed anchor, a (body, point) pair moves with the body (a
+    hanging mass). A pulley is a (body, centre, rho) triple, with body None
+    for a fixed pulley and rho = direction * radius as in PhysicsRope:
+    direction 1 wraps the rope counter-clockwise. Spans run between the
+    tangent points of consecutive nodes, which is exact as long as the spans
+    keep their direction, as in the usual textbook setups.
+    """
+
+    def __init__(self, gravity=9.81):
+        self.gravity = gravity
+        self.bodies = []
+        self.ropes = []
+        self.rope_names = []
+        self._maps = {}
+
+    def add_body(self, name, mass=1.0, axis=(1, 0, 0), **kwargs):
+        body = Body(name, mass=mass, axis=axis, **kwargs)
+        self.bodies.append(body)
+        self._maps.clear()
+        return body
+
+    def add_rope(self, *nodes, name=None):
+        if len(nodes) < 2:
+            raise ValueError("A rope needs at least two nodes")
+        self.ropes.append([self._parse_node(node) for node in nodes])
+        self.rope_names.append(name or f"rope{len(self.ropes) - 1}")
+        self._maps.clear()
+        return self
+
+    @staticmethod
+    def _parse_node(node):
+        """(body or None, point, rho) of a rope node"""
+        if isinstance(node, tuple) and len(node) == 3:
+            body, center, rho = node
+            return body, np.asarray(center, dtype=float), float(rho)
+        if isinstance(node, tuple) and len(node) == 2 and isinstance(node[0], Body):
+            body, point = node
+            return body, np.asarray(point, dtype=float), 0.0
+        return None, np.asarray(node, dtype=float), 0.0
+
+    @property
+    def names(self):
+        return [body.name for body in self.bodies]
+
+    def signature(self):
+        """Plain description of every parameter that affects the motion"""
+        bodies = [
+            [b.name, b.mass, b.axis, b.friction, b.limits, b.position, b.velocity]
+            for b in self.bodies
+        ]
+        ropes = [
+            [
+                [None if body is None else body.name, point, rho]
+                for body, point, rho in rope
+            ]
+            for rope in self.ropes
+        ]
+        return {
+            "gravity": self.gravity,
+            "bodies": bodies,
+            "ropes": ropes,
+            "rope_names": self.rope_names,
+        }
+
+    def constraint_matrix(self):
+        """A with one row per rope: the rate of change of its length is A q'"""
+        index = {id(body): i for i, body in enumerate(self.bodies)}
+        A = np.zeros((len(self.ropes), len(self.bodies)))
+        for r, rope in enumerate(self.ropes):
+            bodies, points, rho = zip(*rope)
+            leave, enter = span_tangents(points[:-1], rho[:-1], points[1:], rho[1:])
+            directions = enter - leave
+            directions /= np.linalg.norm(directions, axis=1, keepdims=True)
+            for (start_body, end_body), direction in zip(pairwise(bodies), directions):
+                if end_body is not None:
+                    A[r, index[id(end_body)]] += direction @ end_body.axis
+                if start_body is not None:
+                    A[r, index[id(start_body)]] -= direction @ start_body.axis
+        return A
+
+    def velocity_map(self):
+        """
+        Matrix K whose columns span the admissible velocities (A K = 0), so
+        every motion is q' = K u for the free coordinates u.
+        """
+        A = self.constraint_matrix()
+        _, s, vt = np.linalg.svd(A)
+        rank = int(np.sum(s > _EPS * max(1.0, s.max(initial=0))))
+        return vt[rank:].T
+
+    def velocity_ratio(self, name, driver):
+        """Speed of body `name` per unit speed of `driver` in a one-DOF system"""
+        K = self.velocity_map()
+        if K.shape[1] != 1:
+            raise ValueError(f"System has {K.shape[1]} degrees of freedom, not 1")
+        names = self.names
+        return K[names.index(name), 0] / K[names.index(driver), 0]
+
+    def _linear_map(self, free, taut):
+        """
+        (P, R) for a phase: accelerations of the free bodies are P F and the
+        rope tensions R F for generalized forces F. Cached per phase.
+        """
+        key = (free.tobytes(), taut.tobytes())
+        if key not in self._maps:
+            inv_mass = np.diag(1 / self._mass[free])
+            A = self._A[taut][:, free]
+            R = np.linalg.pinv(A @ inv_mass @ A.T) @ A @ inv_mass
+            P = inv_mass - inv_mass @ A.T @ R
+            self._maps[key] = (P, R)
+        return self._maps[key]
+
+    def _solve(self, forces, free, taut):
+        a = np.zeros(len(forces))
+        tension = np.zeros(len(taut))
+        P, R = self._linear_map(free, taut)
+        a[free] = P @ forces[free]
+        tension[taut] = R @ forces[free]
+        return a, tension
+
+    def _accelerations(self, v, free, taut, t, events):
+        """Accelerations for the current phase, slackening ropes that would push"""
+        friction = self._friction_force * free
+        sliding = friction > 0
+
+        while True:
+            forces = self._gravity_force.copy()
+            a0, _ = self._solve(forces, free, taut)
+            direction = np.where(v != 0, np.sign(v), np.sign(a0))
+            forces -= friction * direction
+            a, tension = self._solve(forces, free, taut)
+
+            pushing = taut & (tension < -_EPS)
+            if pushing.any():
+                for r in np.flatnonzero(pushing):
+                    events.append((t, "slack", self.rope_names[r]))
+                taut = taut & ~pushing
+                continue
+
+            # Bodies at rest whose friction would reverse them are stuck
+            stuck = sliding & (v == 0) & (np.sign(a) != direction)
+            if stuck.any():
+                free = free & ~stuck
+                continue
+            return a, free, taut
+
+    def _settle_ropes(self, v, free, taut, slack, t, events):
+        """After an impact: ropes now shortening go slack, stretching ones jerk taut"""
+        rate = self._A @ v
+        shortening = taut & (rate < -_EPS)
+        for r in np.flatnonzero(shortening):
+            events.append((t, "slack", self.rope_names[r]))
+        taut = taut & ~shortening
+
+        if (taut & (np.abs(rate) > _EPS)).any():
+            inv_mass = np.diag(1 / self._mass[free])
+            A = self._A[taut][:, free]
+            impulse = np.linalg.pinv(A @ inv_mass @ A.T) @ A @ v[free]
+            v[free] -= inv_mass @ A.T @ impulse
+        slack[taut] = 0
+        return taut
+
+    def simulate(self, duration=None, dt=1 / 240, max_time=60.0):
+        """
+        Integrates the system with exact constant-acceleration steps of dt.
+        Phase changes (a body reaching a limit, friction stopping a body, a
+        rope going slack or taut again) are located inside the step and
+        recorded as events. Without a duration the run stops once everything
+        is at rest.
+        """
+        self._A = self.constraint_matrix()
+        self._mass = np.array([b.mass for b in self.bodies])
+        axes = np.array([b.axis for b in self.bodies])
+        self._gravity_force = self._mass * self.gravity * (axes @ _DOWN)
+        self._friction_force = np.array(
+            [b.friction * b.mass * self.gravity for b in self.bodies]
+        )
+        low = np.array([b.limits[0] for b in self.bodies])
+        high = np.array([b.limits[1] for b in self.bodies])
+
+        x = np.array([b.position for b in self.bodies])
+        v = np.array([b.velocity for b in self.bodies])
+        free = np.ones(len(self.bodies), dtype=bool)
+        taut = np.ones(len(self.ropes), dtype=bool)
+        slack = np.zeros(len(self.ropes))
+
+        events = []
+        end = max_time if duration is None else duration
+        t = 0.0
+        taut = self._settle_ropes(v, free, taut, slack, t, events)
+
+        times, positions, velocities, accelerations = [t], [x.copy()], [v.copy()], []
+
+        while True:
+            a, moving, taut = self._accelerations(v, free, taut, t, events)
+            v[~moving] = 0
+            accelerations.append(a)
+
+            at_rest = not v.any() and not a.any()
+            if t >= end - _EPS or (duration is None and at_rest):
+                break
+
+            next_grid = (np.floor(t / dt + _EPS) + 1) * dt
+            step = min(next_grid, end) - t
+
+            # Earliest phase change inside the step
+            hit_high = _first_root(x - high, v, a, step)
+            hit_low = _first_root(x - low, v, a, step)
+            hit_high[~moving], hit_low[~moving] = np.inf, np.inf
+            stops = np.where(
+                (self._friction_force > 0) & moving & (v * a < 0),
+                _first_root(v, a, 0, step),
+                np.inf,
+            )
+            rate, rate_change = self._A @ v, self._A @ a
+            retaut = np.where(
+                ~taut, _first_root(slack, -rate, -rate_change, step), np.inf
+            )
+            candidates = [step, hit_high.min(), hit_low.min(), stops.min()]
+            candidates.append(retaut.min() if len(retaut) else np.inf)
+            tau = min(candidates)
+
+            x += v * tau + a * tau**2 / 2
+            slack[~taut] -= (rate * tau + rate_change * tau**2 / 2)[~taut]
+            v += a * tau
+            t = float(t + tau)
+
+            impact = False
+            for i in np.flatnonzero(
+                np.isclose(hit_high, tau) | np.isclose(hit_low, tau)
+            ):
+                x[i] = high[i] if np.isclose(hit_high[i], tau) else low[i]
+                v[i] = 0
+                free[i] = False
+                impact = True
+                events.append((t, "contact", self.bodies[i].name))
+            for i in np.flatnonzero(np.isclose(stops, tau)):
+                v[i] = 0
+                events.append((t, "stop", self.bodies[i].name))
+            for r in np.flatnonzero(np.isclose(retaut, tau)):
+                taut[r] = True
+                impact = True
+                events.append((t, "taut", self.rope_names[r]))
+            if impact:
+                taut = self._settle_ropes(v, free, taut, slack, t, events)
+
+            times.append(t)
+            positions.append(x.copy())
+            velocities.append(v.copy())
+
+        return Trajectory(
+            self.names, times, positions, velocities, accelerations, events
+        )
@@ -0,0 +1,63 @@
+"""
+Sampled motion of a set of one-dimensional bodies.
+"""
+
+import numpy as np
+
+
+class Trajectory:
+    """
+    Positions, velocities and accelerations of named bodies over time.
+
+    Samples are sorted by time and the acceleration at sample i holds until
+    sample i + 1, so states in between are reconstructed exactly for the
+    piecewise constant accelerations the integrators produce. Events are
+    (time, kind, name) tuples, e.g. (1.2, "contact", "mass").
+    """
+
+    def __init__(self, names, times, positions, velocities, accelerations, events=()):
+        self.names = list(names)
+        self.times = np.asarray(times, dtype=float)
+        self.positions = np.asarray(positions, dtype=float)
+        self.velocities = np.asarray(velocities, dtype=float)
+        self.accelerations = np.asarray(accelerations, dtype=float)
+        self.events = list(events)
+
+    @property
+    def duration(self):
+        return self.times[-1] - self.times[0]
+
+    def index(self, name):
+        return self.names.index(name)
+
+    def sample(self, t, side="right"):
+        """
+        (positions, velocities, accelerations) at the times t.
+        At a discontinuity side="right" returns the state just after it and
+        side="left" the state just before it.
+        """
+        t = np.asarray(t, dtype=float)
+        k = np.searchsorted(self.times, t, side=side) - 1
+        k = np.clip(k, 0, len(self.times) - 1)
+
+        tau = (t - self.times[k])[..., None]
+        a = self.accelerations[k]
+        v = self.velocities[k] + a * tau
+        x = self.positions[k] + self.velocities[k] * tau + a * tau**2 / 2
+        return x, v, a
+
+    def position(self, name, t, side="right"):
+        return self.sample(t, side)[0][..., self.index(name)]
+
+    def velocity(self, name, t, side="right"):
+        return self.sample(t, side)[1][..., self.index(name)]
+
+    def acceleration(self, name, t, side="right"):
+        return self.sample(t, side)[2][..., self.index(name)]
+
+    def event_time(self, kind, name=None):
+        """Time of the first matching event, None if it never happens"""
+        for time, event_kind, event_name in self.events:
+            if event_kind == kind and (name is None or event_name == name):
+                return time
+        return None
@@ -0,0 +1,237 @@
+"""
+Synthesizing every voiceover of a scene up front, in parallel.
+
+VoiceoverScene calls the speech service when each `with self.voiceover(...)`
+block is reached, so narration is synthesized one clip at a time. Here the
+scene's construct source is scanned for those calls first, the clips are
+generated concurrently into the voiceover cache, and construct then only
+gets cache hits.
+"""
+
+import ast
+import inspect
+import re
+import textwrap
+import time
+import wave
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+from manim_voiceover import VoiceoverScene
+from manim_voiceover.defaults import DEFAULT_VOICEOVER_CACHE_JSON_FILENAME
+from manim_voiceover.helper import append_to_json_file, remove_bookmarks, wav2mp3
+from manim_voiceover.services.base import SpeechService
+from manim_voiceover.tracker import AUDIO_OFFSET_RESOLUTION
+
+from manim import *
+
+__all__ = [
+    "LocalSpeechService",
+    "PrefetchVoiceoverScene",
+    "bookmarks",
+    "collect_voiceovers",
+    "prefetch_voiceovers",
+]
+
+BOOKMARK_RE = re.compile(r"<bookmark\s*mark\s*=['\"](\w*)[\"']\s*/>")
+# voiceover() arguments consumed by the scene, not the speech service
+_SCENE_KWARGS = {"subcaption", "max_subcaption_len", "subcaption_buff"}
+
+
+def _self_calls(tree, name):
+    for node in ast.walk(tree):
+        if (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Attribute)
+            and node.func.attr == name
+            and isinstance(node.func.value, ast.Name)
+            and node.func.value.id == "self"
+        ):
+            yield node
+
+
+def collect_voiceovers(scene_class):
+    """
+    (texts, waits) found in scene_class.construct: texts is a list of
+    (text, service_kwargs) for every self.voiceover(text=...) whose
+    arguments are literals, waits the marks passed to wait_until_bookmark.
+    """
+    source = textwrap.dedent(inspect.getsource(scene_class.construct))
+    tree = ast.parse(source)
+
+    texts = []
+    for call in _self_calls(tree, "voiceover"):
+        arguments = {kw.arg: kw.value for kw in call.keywords if kw.arg}
+        if call.args:
+            arguments.setdefault("text", call.args[0])
+        if "text" not in arguments:
+            continue
+        try:
+            values = {k: ast.literal_eval(v) for k, v in arguments.items()}
+        except ValueError:
+            continue
+        text = values.pop("text")
+        kwargs = {k: v for k, v in values.items() if k not in _SCENE_KWARGS}
+        if (text, kwargs) not in texts:
+            texts.append((text, kwargs))
+
+    waits = []
+    for call in _self_calls(tree, "wait_until_bookmark"):
+        if call.args and isinstance(call.args[0], ast.Constant):
+            waits.append(call.args[0].value)
+    return texts, waits
+
+
+def bookmarks(text):
+    return BOOKMARK_RE.findall(text)
+
+
+def prefetch_voiceovers(service, texts, max_workers=8):
+    """
+    Generates every (text, kwargs) clip with the service on a thread pool
+    and returns their voiceover cache entries. Clips already in the cache
+    come back immediately.
+
+    Only generate_from_text runs concurrently; it writes the audio but not
+    the cache JSON, which is read and rewritten without a lock. The new
+    entries are then appended one at a time. Transcription and speed
+    adjustment still happen when the scene reaches each voiceover, which
+    finds its clip in the cache.
+    """
+    start = time.perf_counter()
+    cache_dir = Path(service.cache_dir)
+    # The scene normalizes whitespace the same way before generating
+    texts = [(" ".join(text.split()), kwargs) for text, kwargs in texts]
+    with ThreadPoolExecutor(max_workers) as pool:
+        futures = [
+            pool.submit(service.generate_from_text, text, cache_dir, **kwargs)
+            for text, kwargs in texts
+        ]
+        generated = [future.result() for future in futures]
+
+    results = []
+    for result in generated:
+        entry = service.get_cached_result(result["input_data"], cache_dir)
+        if entry is None:
+            entry = {**result, "final_audio": result["original_audio"]}
+            append_to_json_file(
+                cache_dir / DEFAULT_VOICEOVER_CACHE_JSON_FILENAME, entry
+            )
+        results.append(entry)
+    logger.info(
+        f"Prefetched {len(results)} voiceovers in {time.perf_counter() - start:.2f}s"
+    )
+    return results
+
+
+class PrefetchVoiceoverScene(VoiceoverScene):
+    """
+    VoiceoverScene that synthesizes all of construct's voiceovers as soon as
+    the speech service is set, and warns about bookmarks that are waited for
+    but never spoken.
+    """
+
+    prefetch_workers = 8
+
+    def set_speech_service(self, speech_service, create_subcaption=True):
+        super().set_speech_service(speech_service, create_subcaption)
+
+        texts, waits = collect_voiceovers(type(self))
+        marks = {mark for text, _ in texts for mark in bookmarks(text)}
+        for mark in waits:
+            if mark not in marks:
+                logger.warning(f"wait_until_bookmark('{mark}') has no bookmark")
+        prefetch_voiceovers(speech_service, texts, self.prefetch_workers)
+
+
+class LocalSpeechService(SpeechService):
+    """
+    Offline stand-in speech service: every word becomes a short tone, with
+    word boundaries so bookmarks work. latency (seconds) is slept per clip to
+    stand in for a network service. Clips are MP3, like every other service,
+    since the voiceover tracker reads their duration as MP3.
+    """
+
+    service_name = "local"
+
+    def __init__(self, latency=0.0, words_per_minute=160, sample_rate=22050, **kwargs):
+        SpeechService.__init__(self, **kwargs)
+        self.latency = latency
+        self.words_per_minute = words_per_minute
+        self.sample_rate = sample_rate
+
+    def generate_from_text(self, text, cache_dir=None, path=None, **kwargs):
+        # get_cached_result joins cache_dir with /, which needs a Path
+        cache_dir = Path(self.cache_dir if cache_dir is None else cache_dir)
+
+        input_data = {
+            "input_text": text,
+            "service": self.service_name,
+            "config": {
+                "words_per_minute": self.words_per_minute,
+                "sample_rate": self.sample_rate,
+            },
+        }
+        cached_result = self.get_cached_result(input_data, cache_dir)
+        if cached_result is not None:
+            return cached_result
+
+        if path is None:
+            audio_path = self.get_audio_basename(input_data) + ".mp3"
+        else:
+            audio_path = path
+
+        time.sleep(self.latency)
+        samples, word_boundaries = self._synthesize(remove_bookmarks(text))
+        self._write_audio(cache_dir / audio_path, samples)
+
+        return {
+            "input_text": text,
+            "input_data": input_data,
+            "original_audio": audio_path,
+            "word_boundaries": word_boundaries,
+        }
+
+    def _write_audio(self, path, samples):
+        wav_path = path.with_suffix(".wav")
+        with wave.open(str(wav_path), "wb") as f:
+            f.setnchannels(1)
+            f.setsampwidth(2)
+            f.setframerate(self.sample_rate)
+            f.writeframes(samples.tobytes())
+        wav2mp3(wav_path, path)
+
+    def _synthesize(self, text):
+        word_time = 60 / self.words_per_minute
+        n = int(word_time * self.sample_rate)
+        t = np.arange(n) / self.sample_rate
+        envelope = np.sin(np.pi * np.arange(n) / n) ** 2
+
+        chunks, word_boundaries = [], []
+        for i, match in enumerate(re.finditer(r"\S+", text)):
+            word = match.group()
+            pitch = 180 + zlib.crc32(word.encode()) % 120
+            chunks.append(0.3 * envelope * np.sin(2 * np.pi * pitch * t))
+            word_boundaries.append(
+                {
+                    "audio_offset": int(i * word_time * AUDIO_OFFSET_RESOLUTION),
+                    "text_offset": match.start(),
+                    "word_length": len(word),
+                    "text": word,
+                    "boundary_type": "Word",
+                }
+            )
+        # Closing boundary so bookmarks after the last word interpolate too
+        word_boundaries.append(
+            {
+                "audio_offset": int(len(chunks) * word_time * AUDIO_OFFSET_RESOLUTION),
+                "text_offset": len(text),
+                "word_length": 0,
+                "text": "",
+                "boundary_type": "Word",
+            }
+        )
+        audio = np.concatenate(chunks) if chunks else np.zeros(n)
+        return (audio * 32767).astype(np.int16), word_boundaries
@@ -0,0 +1,191 @@
+from manim import *
+
+from .pobject import PhysicsCar, PhysicsPulley
+
+
+class PhysicsWorld(Mobject):
+    """
+    Drives every registered body from its ValueTracker with one updater.
+
+    Each frame the tracker values are read once, and the distances and
+    wheel/pulley angles of all bodies are evaluated together in NumPy before
+    the transforms are applied.  The world has to come before the bodies in
+    the scene so manim treats them as moving; `attach` takes care of that.
+
+    Bodies are placed from a snapshot of their points taken when they are
+    registered, so their state depends only on the tracker values and not on
+    how many frames led there; skipped and rendered animations end up in
+    exactly the same state. Call `rebase` after transforming a bound body
+    directly.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+        self.bodies = []
+        self.trackers = []
+
+        self._tracker_index = np.zeros(0, dtype=int)
+        self._ratios = np.zeros(0)
+        self._directions = np.zeros((0, 3))
+        self._radii = np.zeros(0)
+        self._last_distance = np.zeros(0)
+        self._base_distance = np.zeros(0)
+        self._rest = []
+
+        self.add_updater(self._step)
+
+    def attach(self, scene):
+        """Adds the world to the scene, in front of everything it drives"""
+        scene.add(self)
+        scene.bring_to_back(self)
+        return self
+
+    def add_car(self, car, tracker, speed_ratio=1):
+        """Moves the car right by tracker * speed_ratio and rolls its wheels"""
+        car.tracker = tracker
+        car.speed_ratio = speed_ratio
+        car.last_distance = tracker.get_value() * speed_ratio
+        return self._register(
+            car,
+            tracker,
+            speed_ratio,
+            direction=RIGHT,
+            radius=car.wheel_radius,
+            wheels=(car.wheel_left, car.wheel_right),
+        )
+
+    def add_pulley(self, pulley, tracker, speed_ratio=1, direction=None):
+        """
+        Spins the pulley wheel as rope runs over it.
+        With a direction the whole pulley (and its mount) also travels along it,
+        without one it stays in place.
+        """
+        if direction is None:
+            direction, wheels = ORIGIN, (pulley.wheel,)
+        else:
+            wheels = ()
+        pulley.tracker = tracker
+        pulley.speed_ratio = speed_ratio
+        pulley.last_distance = tracker.get_value() * speed_ratio
+        return self._register(
+            pulley,
+            tracker,
+            speed_ratio,
+            direction=direction,
+            radius=pulley.radius if wheels else 0,
+            wheels=wheels,
+        )
+
+    def add_body(self, mobject, tracker, direction=DOWN, speed_ratio=1):
+        """Translates any mobject along direction by tracker * speed_ratio"""
+        return self._register(mobject, tracker, speed_ratio, direction=direction)
+
+    def remove_body(self, mobject):
+        keep = [i for i, body in enumerate(self.bodies) if body[0] is not mobject]
+        self.bodies = [self.bodies[i] for i in keep]
+        self._tracker_index = self._tracker_index[keep]
+        self._ratios = self._ratios[keep]
+        self._directions = self._directions[keep]
+        self._radii = self._radii[keep]
+        self._last_distance = self._last_distance[keep]
+        self._base_distance = self._base_distance[keep]
+        self._rest = [self._rest[i] for i in keep]
+        return self
+
+    def rebase(self, mobject=None):
+        """Re-snapshots the rest pose of one body, or of all of them"""
+        for i, (body, wheels) in enumerate(self.bodies):
+            if mobject is None or body is mobject:
+                self._base_distance[i] = self._last_distance[i]
+                self._rest[i] = self._snapshot(body, wheels)
+        return self
+
+    def get_velocity(self, mobject):
+        """Exact velocity vector of a registered body (PhysicsTracker drivers)"""
+        i = self._index_of(mobject)
+        tracker = self.trackers[self._tracker_index[i]]
+        return tracker.get_velocity() * self._ratios[i] * self._directions[i]
+
+    def get_acceleration(self, mobject):
+        i = self._index_of(mobject)
+        tracker = self.trackers[self._tracker_index[i]]
+        return tracker.get_acceleration() * self._ratios[i] * self._directions[i]
+
+    def _index_of(self, mobject):
+        for i, (body, _) in enumerate(self.bodies):
+            if body is mobject:
+                return i
+        raise ValueError(f"{mobject} is not registered with this world")
+
+    def _register(self, mobject, tracker, speed_ratio, direction, radius=0, wheels=()):
+        if tracker not in self.trackers:
+            self.trackers.append(tracker)
+        index = self.trackers.index(tracker)
+
+        self.bodies.append((mobject, tuple(wheels)))
+        self._tracker_index = np.append(self._tracker_index, index)
+        self._ratios = np.append(self._ratios, speed_ratio)
+        self._directions = np.vstack([self._directions, np.asarray(direction, float)])
+        self._radii = np.append(self._radii, radius)
+        distance = tracker.get_value() * speed_ratio
+        self._last_distance = np.append(self._last_distance, distance)
+        self._base_distance = np.append(self._base_distance, distance)
+        self._rest.append(self._snapshot(mobject, wheels))
+        return self
+
+    @staticmethod
+    def _snapshot(mobject, wheels):
+        """Rest points of every family member, with the pivot of its wheel"""
+        pivots = {}
+        for wheel in wheels:
+            center = wheel.get_center()
+            for member in wheel.get_family():
+                pivots[id(member)] = center
+
+        members = [
+            (member, member.points.copy(), pivots.get(id(member)))
+            for member in mobject.get_family()
+        ]
+        anchors = None
+        if isinstance(mobject, PhysicsPulley):
+            anchors = (np.array(mobject.center_pos), np.array(mobject.mount_point))
+        return members, anchors
+
+    def _step(self, mob):
+        """Internal function called every frame"""
+        if not self.bodies:
+            return
+
+        values = np.array([tracker.get_value() for tracker in self.trackers])
+        distance = values[self._tracker_index] * self._ratios
+        delta = distance - self._last_distance
+        self._last_distance = distance
+
+        offset = distance - self._base_distance
+        shifts = offset[:, None] * self._directions
+        angles = np.divide(
+            -offset, self._radii, out=np.zeros_like(offset), where=self._radii > 0
+        )
+
+        for i, (mobject, wheels) in enumerate(self.bodies):
+            if delta[i] != 0:
+                self._place(mobject, self._rest[i], shifts[i], angles[i])
+            if isinstance(mobject, (PhysicsCar, PhysicsPulley)):
+                mobject.last_distance = distance[i]
+            if isinstance(mobject, PhysicsCar):
+                mobject.delta_x = delta[i]
+
+    @staticmethod
+    def _place(mobject, rest, shift, angle):
+        members, anchors = rest
+        rotation = rotation_matrix(angle, OUT)
+        for member, points, pivot in members:
+            if pivot is None:
+                member.points = points + shift
+            else:
+                member.points = (points - pivot) @ rotation.T + pivot + shift
+
+        if anchors is not None:
+            mobject.center_pos = anchors[0] + shift
+            mobject.mount_point = anchors[1] + shift
@@ -0,0 +1,103 @@
+import numpy as np
+import pytest
+
+from manim import DOWN, LEFT, RIGHT, UP, Line, Square
+from physics.collision import (
+    PhysicsCollisions,
+    _boxes_overlap,
+    _cell_entries,
+    _first_contact,
+    _join,
+    _segment_touches_box,
+)
+
+
+def _random_boxes(rng, count, spread=20.0, size=1.0):
+    low = rng.uniform(-spread, spread, (count, 2))
+    return np.hstack([low, low + rng.uniform(0.01, size, (count, 2))])
+
+
+def test_broad_phase_keeps_every_overlapping_pair():
+    rng = np.random.default_rng(0)
+    a, b = _random_boxes(rng, 200), _random_boxes(rng, 300)
+    pairs = _join(*_cell_entries(a, 1.0), *_cell_entries(b, 1.0))
+
+    overlapping = np.argwhere(
+        np.all(
+            (a[:, None, :2] <= b[None, :, 2:]) & (b[None, :, :2] <= a[:, None, 2:]),
+            axis=2,
+        )
+    )
+    assert len(overlapping)
+    candidates = set(map(tuple, pairs))
+    assert set(map(tuple, overlapping)) <= candidates
+    # Far fewer pairs than the 60000 a brute-force test would check
+    assert len(candidates) < 0.05 * len(a) * len(b)
+
+
+def test_segment_touches_box():
+    boxes = np.array([[-1.0, -1, 1, 1]] * 4)
+    starts = np.array([[-2.0, 0], [-2.0, 2], [0.0, -3], [1.0, -2]])
+    ends = np.array([[2.0, 0], [2.0, 2], [0.0, -1.5], [1.0, 2]])
+    touches = _segment_touches_box(starts, ends, boxes)
+    # Through, above, short of and along the edge of the box
+    assert touches.tolist() == [True, False, False, True]
+
+
+def test_first_contact_catches_tunnelling():
+    # A unit box moving from y = 1 to y = -3 through the line y = 0
+    start = np.array([[-0.5, 1.0, 0.5, 2.0]])
+    shift = np.array([[0.0, -4.0, 0.0, -4.0]])
+    line = np.array([[-2.0, 0.0]]), np.array([[2.0, 0.0]])
+
+    def touching(s):
+        return _segment_touches_box(*line, start + s[:, None] * shift)
+
+    # Neither end of the frame touches the line
+    assert not touching(np.zeros(1)).any() and not touching(np.ones(1)).any()
+    assert _first_contact(touching, 1)[0] == pytest.approx(0.25, abs=1e-6)
+
+
+def test_boxes_overlap():
+    a = np.array([[0.0, 0, 1, 1], [0.0, 0, 1, 1]])
+    b = np.array([[1.0, 0.5, 2, 2], [1.5, 0, 2, 1]])
+    assert _boxes_overlap(a, b).tolist() == [True, False]
+
+
+def test_contact_events_with_a_surface():
+    floor = Line(2 * LEFT, 2 * RIGHT)
+    box = Square(side_length=0.5).move_to(UP)
+    collisions = PhysicsCollisions().add_body(box).add_surface(floor)
+    received = []
+    collisions.on_contact(received.append, body=box, other=floor)
+
+    # The bottom reaches the floor three quarters into the frame
+    box.shift(DOWN)
+    collisions.update(1.0)
+    (begin,) = collisions.events
+    assert begin.kind == "begin" and begin.body is box and begin.other is floor
+    assert begin.time == pytest.approx(0.75, abs=1e-6)
+    assert begin.point == pytest.approx(np.zeros(3), abs=1e-6)
+    assert begin.normal == pytest.approx(UP)
+    assert received == [begin]
+
+    box.shift(DOWN)
+    collisions.update(1.0)
+    assert [event.kind for event in collisions.events] == ["begin", "end"]
+    assert collisions.events[-1].time == pytest.approx(2.0)
+    assert received == [begin]
+
+
+def test_contact_events_between_bodies():
+    left = Square(side_length=1).move_to(2 * LEFT)
+    right = Square(side_length=1).move_to(2 * RIGHT)
+    collisions = PhysicsCollisions().add_body(left).add_body(right)
+
+    left.shift(2 * RIGHT)
+    right.shift(2 * LEFT)
+    collisions.update(0.5)
+    (begin,) = collisions.events
+    assert {begin.body, begin.other} == {left, right}
+    # The gap of 3 between them closes by 4 over the frame
+    assert begin.time == pytest.approx(0.375, abs=1e-6)
+    assert np.abs(begin.normal) == pytest.approx(RIGHT)
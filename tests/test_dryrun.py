@@ -0,0 +1,59 @@
+import math
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from physics.dryrun import dry_run
+from physics.parallel import load_scene_class
+
+EXAMPLE = Path(__file__).parents[1] / "example" / "car_pulley.py"
+FPS = 30
+# GRAVITY in FullPhysicsDemoLightMood.construct
+GRAVITY = 2.75
+
+
+@pytest.fixture(scope="module")
+def scene_class():
+    return load_scene_class(EXAMPLE, "FullPhysicsDemoLightMood")
+
+
+@pytest.fixture(scope="module")
+def run(scene_class):
+    return dry_run(scene_class, fps=FPS)
+
+
+def test_velocity_ratio_is_two(run):
+    # Both rope runs are horizontal, so the rope topology gives exactly 2:1
+    assert run.scene.system.velocity_ratio("mass", "car") == pytest.approx(2)
+
+
+def test_mass_velocity_at_end_of_fall(scene_class, run):
+    car, mass = scene_class.CAR_MASS, scene_class.HANGING_MASS
+    ratio = run.scene.system.velocity_ratio("mass", "car")
+    # The mass moves ratio times as far as the car: with x the car's position,
+    # (car + ratio^2 mass) x'' = ratio mass g - friction
+    car_acceleration = (ratio * mass * GRAVITY - scene_class.DECEL_RATE * car) / (
+        car + ratio**2 * mass
+    )
+    drop = np.nanmax(run["mass_tracker"])
+    expected = math.sqrt(2 * ratio * car_acceleration * drop)
+
+    # The tracker holds its touchdown velocity to the end
+    assert run["mass_tracker.velocity"][-1] == pytest.approx(expected, rel=1e-6)
+    assert np.nanmax(run["car_tracker.velocity"]) == pytest.approx(expected / ratio)
+
+
+def test_car_stops_after_coasting(scene_class, run):
+    ratio = run.scene.system.velocity_ratio("mass", "car")
+    touchdown_velocity = run["mass_tracker.velocity"][-1] / ratio
+    coast = touchdown_velocity / scene_class.DECEL_RATE
+
+    # Play durations are whole frames
+    assert min(abs(duration - coast) for _, duration in run.plays) < 1 / FPS
+    assert run["car_tracker.velocity"][-1] == pytest.approx(0, abs=1e-9)
+
+
+def test_silent_narration_leaves_no_clips(run):
+    assert run.sounds
+    assert not any(Path(sound).exists() for sound, _ in run.sounds)
@@ -0,0 +1,34 @@
+import json
+
+from manim import ValueTracker
+from manim.utils.hashing import get_json
+from physics.hashing import install_hashing, physics_signature
+from physics.motion import PhysicsTracker
+from physics.pobject import PhysicsCar
+
+
+def _car(tracker):
+    car = PhysicsCar()
+    car.attach_physics(tracker)
+    return car
+
+
+def test_car_on_plain_value_tracker():
+    signature = physics_signature(_car(ValueTracker(0.3)))
+
+    assert signature["state"]["tracker"]["velocity"] is None
+    assert signature == physics_signature(_car(ValueTracker(0.3)))
+    assert signature != physics_signature(_car(ValueTracker(0.5)))
+
+
+def test_car_on_physics_tracker_hashes_its_velocity():
+    signature = physics_signature(_car(PhysicsTracker(0.3)))
+
+    assert signature["state"]["tracker"]["velocity"] == 0.0
+
+
+def test_play_hash_serializes_car_on_plain_value_tracker():
+    install_hashing()
+    car = _car(ValueTracker(0.3))
+
+    assert json.loads(get_json(car)) == json.loads(get_json(_car(ValueTracker(0.3))))
@@ -0,0 +1,45 @@
+import json
+from pathlib import Path
+
+from manim_voiceover.defaults import DEFAULT_VOICEOVER_CACHE_JSON_FILENAME
+from manim_voiceover.modify_audio import get_duration
+
+from physics.voiceover import LocalSpeechService, prefetch_voiceovers
+
+TEXTS = [
+    ("The car rolls <bookmark mark='off'/> off the ledge.", {}),
+    ("The   mass\nfalls.", {}),
+    ("Then the brakes hold.", {}),
+]
+
+
+def test_prefetch_writes_cache_and_mp3(tmp_path):
+    service = LocalSpeechService(cache_dir=str(tmp_path))
+    results = prefetch_voiceovers(service, TEXTS, max_workers=3)
+
+    entries = json.loads((tmp_path / DEFAULT_VOICEOVER_CACHE_JSON_FILENAME).read_text())
+    assert [entry["input_text"] for entry in entries] == [
+        "The car rolls <bookmark mark='off'/> off the ledge.",
+        "The mass falls.",
+        "Then the brakes hold.",
+    ]
+    for entry, result in zip(entries, results):
+        assert entry == result
+        audio = tmp_path / entry["final_audio"]
+        assert audio.suffix == ".mp3"
+        # What the voiceover tracker times the clip with
+        assert get_duration(audio) > 0
+        assert not audio.with_suffix(".wav").exists()
+
+
+def test_prefetch_again_only_hits_cache(tmp_path):
+    service = LocalSpeechService(cache_dir=str(tmp_path))
+    first = prefetch_voiceovers(service, TEXTS)
+    second = prefetch_voiceovers(service, TEXTS)
+
+    entries = json.loads((tmp_path / DEFAULT_VOICEOVER_CACHE_JSON_FILENAME).read_text())
+    assert len(entries) == len(TEXTS)
+    assert second == first
+    assert sorted(Path(tmp_path).glob("*.mp3")) == sorted(
+        tmp_path / entry["final_audio"] for entry in entries
+    )
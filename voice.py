@@ -1,10 +1,11 @@
 from manim import *
 
-from manim_voiceover import VoiceoverScene
 from manim_voiceover.services.azure import AzureService
 
+from physics import PrefetchVoiceoverScene
 
-class AzureVoiceSync(VoiceoverScene):
+
+class AzureVoiceSync(PrefetchVoiceoverScene):
     def construct(self):
         service = AzureService(
             voice="en-HK-SamNeural",